@@ -0,0 +1,191 @@
+##############################################################################
+#
+# Module: bench_alloc.py
+#
+# Description:
+#     Compare per-call memory allocation and time of the vendor
+#     request issue path before and after the command registry.
+#     "Before" rebuilds the setup fields and list payloads the way
+#     the controllers used to; "after" issues the precompiled
+#     registry commands with a preallocated receive buffer.
+#
+#     Requests go through a real pyusb Device on an in-process
+#     backend, so pyusb's own payload conversion is measured but
+#     no hardware is needed.
+#
+#     Usage:
+#         python benchmarks/bench_alloc.py [--calls N] [--json]
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+# Lib imports
+import usb.backend
+import usb.core
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Own modules
+from model3501lib import vendor_commands as vc  # noqa: E402
+from model3501lib.pd_profile import PROFILE_45W  # noqa: E402
+
+
+class NullBackend(usb.backend.IBackend):
+    """
+    pyusb backend answering every control transfer in process.
+    """
+    def get_device_descriptor(self, dev):
+        return SimpleNamespace(
+            bLength=18, bDescriptorType=1, bcdUSB=0x0300, bDeviceClass=0,
+            bDeviceSubClass=0, bDeviceProtocol=0, bMaxPacketSize0=9,
+            idVendor=0x045E, idProduct=0x078F, bcdDevice=0x0100,
+            iManufacturer=1, iProduct=2, iSerialNumber=3, bNumConfigurations=1,
+            address=5, bus=1, port_number=4, port_numbers=(4,), speed=4)
+
+    def open_device(self, dev):
+        return dev
+
+    def close_device(self, dev_handle):
+        pass
+
+    def ctrl_transfer(self, dev_handle, bmRequestType, bRequest, wValue, wIndex,
+                      data, timeout):
+        return len(data)
+
+
+def before_get_rdo(device):
+    data1 = [0x00, 0x2A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+             0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+    if device.ctrl_transfer(0x40, 0xE4, 0x0000, 0x0000, data1) == 16:
+        return device.ctrl_transfer(0xC0, 0xE4, 0x0000, 0x0000, 0x0010)
+
+
+def before_set_speed(device):
+    bmRequestType = 0x40
+    bRequest = 0x14
+    return device.ctrl_transfer(bmRequestType, bRequest, 0x0000, 0x0000, 0x0000)
+
+
+def before_cdstress_on(device):
+    return device.ctrl_transfer(0x40, 0xE8, 0x0000, 0x0001, 0x0000)
+
+
+def before_charge_45w(device):
+    data_to_send_setup = [
+        0x01, 0x03, 0x2C, 0x91, 0x01, 0x04,
+        0x2C, 0xD1, 0x02, 0x00,
+        0x2C, 0xB1, 0x04, 0x00
+    ]
+    return device.ctrl_transfer(0x40, 0xEE, 0x0003, 0x0000, data_to_send_setup)
+
+
+def after_get_rdo(device, buffer):
+    if vc.MAILBOX_RDO.issue(device) == 16:
+        return vc.MAILBOX_READ.issue(device, buffer)
+
+
+def after_set_speed(device):
+    return vc.SPEED_COMMANDS['h'].issue(device)
+
+
+def after_cdstress_on(device):
+    return vc.CD_STRESS_ON.issue(device)
+
+
+def after_charge_45w(device):
+    return vc.CHARGE_PROFILE.issue(device, vc.payload_array(PROFILE_45W.payload),
+                                   value=PROFILE_45W.count)
+
+
+def measure(call, calls):
+    """
+    Measure allocated bytes and time per call.
+
+    Args:
+        call (callable): Zero-argument function to measure.
+        calls (int): Number of calls.
+
+    Returns:
+        dict: peak bytes allocated within one call, bytes still held
+        after all calls, and mean time per call in microseconds.
+
+    Raises:
+        None
+    """
+    for _ in range(100):
+        call()
+
+    tracemalloc.start()
+    call()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(calls):
+        call()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    began = time.perf_counter()
+    for _ in range(calls):
+        call()
+    elapsed = time.perf_counter() - began
+    return {
+        'peak_bytes_per_call': peak - base,
+        'retained_bytes': end - start,
+        'us_per_call': elapsed / calls * 1e6,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='model3501lib vendor request allocation benchmark')
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--json', action='store_true', help='emit JSON only')
+    args = parser.parse_args(argv)
+
+    device = usb.core.Device('null', NullBackend())
+    buffer = vc.MAILBOX_READ.new_buffer()
+    cases = {
+        'get_rdo': (lambda: before_get_rdo(device),
+                    lambda: after_get_rdo(device, buffer)),
+        'set_speed': (lambda: before_set_speed(device),
+                      lambda: after_set_speed(device)),
+        'cdstress_on': (lambda: before_cdstress_on(device),
+                        lambda: after_cdstress_on(device)),
+        'charge_45w': (lambda: before_charge_45w(device),
+                       lambda: after_charge_45w(device)),
+    }
+    results = {name: {'before': measure(before, args.calls),
+                      'after': measure(after, args.calls)}
+               for name, (before, after) in cases.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("%-12s %26s %26s" % ('', 'before (bytes, us)', 'after (bytes, us)'))
+        for name, r in results.items():
+            print("%-12s %16d %9.2f %16d %9.2f" % (
+                name, r['before']['peak_bytes_per_call'], r['before']['us_per_call'],
+                r['after']['peak_bytes_per_call'], r['after']['us_per_call']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
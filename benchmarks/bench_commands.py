@@ -0,0 +1,271 @@
+##############################################################################
+#
+# Module: bench_commands.py
+#
+# Description:
+#     Benchmark every public entry point of model3501lib: cold and
+#     warm latency, calls per second and allocations per call, plus
+#     discovery time as the number of attached MUTTs grows. Runs
+#     against the in-process simulator (CI) or real hardware (lab)
+#     and writes machine-readable JSON for trend tracking.
+#
+#     Usage:
+#         python benchmarks/bench_commands.py --target sim --output sim.json
+#         python benchmarks/bench_commands.py --target hw --settle 3
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Lib imports
+# (None)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Own modules
+import model3501lib  # noqa: E402
+from model3501lib.findDevice import FindDeviceController  # noqa: E402
+from model3501lib.fleet import MuttFleet  # noqa: E402
+from model3501lib.session import (  # noqa: E402
+    PRODUCT_ID, VENDOR_ID, MuttSession, close_default_session, set_default_session)
+from model3501lib.simulator import SimulatedBus  # noqa: E402
+
+# name, arguments, re-enumerates the MUTT
+ENTRY_POINTS = (
+    ('find_device_status', (), False),
+    ('set_speed', ('s',), True),
+    ('set_charge', (45,), False),
+    ('get_rdo_status', (), False),
+    ('get_power_role_status', (), False),
+    ('onset_cdstress', (), False),
+    ('offset_cdstress', (), False),
+    ('pd_captive_cables_status', (), False),
+    ('pd_charger_port_status', (), False),
+    ('reconnect_status', (100, 100), True),
+)
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        'n': len(ordered),
+        'mean_us': statistics.fmean(ordered) * 1e6,
+        'median_us': statistics.median(ordered) * 1e6,
+        'p90_us': ordered[int(0.9 * (len(ordered) - 1))] * 1e6,
+        'min_us': ordered[0] * 1e6,
+        'max_us': ordered[-1] * 1e6,
+    }
+
+
+class Target:
+    """
+    Where the entry points run: simulator or hardware.
+    """
+    def __init__(self, name, latency, settle):
+        self.name = name
+        self.latency = latency
+        self.settle = settle
+        self.bus = None
+
+    def reset(self):
+        """
+        Start from a cold default session (and a fresh simulator).
+        """
+        close_default_session()
+        if self.name == 'sim':
+            # Re-enumeration is instant so back-to-back calls succeed
+            self.bus = SimulatedBus(count=1, latency=self.latency, reenum_delay=0.0)
+            set_default_session(MuttSession(transport=self.bus))
+
+    def after_reenumeration(self):
+        if self.name == 'hw' and self.settle:
+            time.sleep(self.settle)
+
+
+def bench_entry_point(target, name, args, reenumerates, iterations):
+    """
+    Measure one entry point.
+
+    Args:
+        target (Target): Simulator or hardware target.
+        name (str): Public function name in model3501lib.
+        args (tuple): Call arguments.
+        reenumerates (bool): The call makes the MUTT re-enumerate.
+        iterations (int): Number of warm calls.
+
+    Returns:
+        dict: cold latency, warm latency summary, calls per second
+        and peak bytes allocated per warm call.
+
+    Raises:
+        None
+    """
+    function = getattr(model3501lib, name)
+    with open(os.devnull, 'w') as null, contextlib.redirect_stdout(null):
+        target.reset()
+        began = time.perf_counter()
+        function(*args)
+        cold = time.perf_counter() - began
+        if reenumerates:
+            target.after_reenumeration()
+
+        warm = []
+        for _ in range(iterations):
+            began = time.perf_counter()
+            function(*args)
+            warm.append(time.perf_counter() - began)
+            if reenumerates:
+                target.after_reenumeration()
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    busy = sum(warm)
+    return {
+        'cold_us': cold * 1e6,
+        'warm': _summary(warm),
+        'calls_per_s': len(warm) / busy if busy > 0 else None,
+        'peak_bytes_per_call': peak - base,
+    }
+
+
+def bench_discovery(target, counts, iterations):
+    """
+    Measure discovery time as the device count grows.
+
+    On the simulator every count in ``counts`` is built; on
+    hardware the attached devices are measured as they are.
+
+    Args:
+        target (Target): Simulator or hardware target.
+        counts (list): Simulated device counts.
+        iterations (int): Repetitions per measurement.
+
+    Returns:
+        list: One dict per device count with find_device and
+        MuttFleet.discover latency summaries.
+
+    Raises:
+        None
+    """
+    results = []
+    if target.name == 'sim':
+        setups = [(count, SimulatedBus(count=count, latency=target.latency))
+                  for count in counts]
+    else:
+        setups = [(None, None)]
+
+    for count, bus in setups:
+        controller = FindDeviceController(VENDOR_ID, PRODUCT_ID)
+        controller.transport = bus
+        find_samples = []
+        fleet_samples = []
+        found = 0
+        for _ in range(iterations):
+            began = time.perf_counter()
+            found = len(controller.find_device())
+            find_samples.append(time.perf_counter() - began)
+
+            fleet = MuttFleet(transport=bus)
+            began = time.perf_counter()
+            fleet.discover()
+            fleet_samples.append(time.perf_counter() - began)
+            fleet.close()
+        results.append({
+            'devices': found if count is None else count,
+            'find_device': _summary(find_samples),
+            'fleet_discover': _summary(fleet_samples),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='model3501lib entry point benchmark')
+    parser.add_argument('--target', choices=('sim', 'hw'), default='sim',
+                        help='simulated MUTTs (default) or attached hardware')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='warm calls per entry point')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='simulated per-transfer latency in seconds')
+    parser.add_argument('--settle', type=float, default=3.0,
+                        help='hardware wait after a re-enumerating call (s)')
+    parser.add_argument('--devices', default='1,10,100,500',
+                        help='simulated device counts for discovery')
+    parser.add_argument('--only', help='comma separated entry point names')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--json', action='store_true', help='print JSON only')
+    args = parser.parse_args(argv)
+
+    target = Target(args.target, args.latency, args.settle)
+    selected = set(args.only.split(',')) if args.only else None
+    iterations = args.iterations
+    if args.target == 'hw':
+        # Re-enumerating calls take seconds on hardware
+        iterations = min(iterations, 20)
+
+    commands = {}
+    for name, call_args, reenumerates in ENTRY_POINTS:
+        if selected is not None and name not in selected:
+            continue
+        commands[name] = bench_entry_point(
+            target, name, call_args, reenumerates,
+            iterations if not reenumerates or args.target == 'sim' else min(iterations, 5))
+    close_default_session()
+
+    counts = [int(count) for count in args.devices.split(',') if count]
+    report = {
+        'meta': {
+            'target': args.target,
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': iterations,
+            'latency_s': args.latency if args.target == 'sim' else None,
+        },
+        'commands': commands,
+        'discovery': bench_discovery(target, counts, max(1, min(iterations, 20))),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("%-26s %10s %10s %10s %12s %8s" % (
+            'entry point', 'cold us', 'warm p50', 'warm p90', 'calls/s', 'bytes'))
+        for name, r in commands.items():
+            print("%-26s %10.1f %10.1f %10.1f %12.0f %8d" % (
+                name, r['cold_us'], r['warm']['median_us'], r['warm']['p90_us'],
+                r['calls_per_s'] or 0, r['peak_bytes_per_call']))
+        print()
+        print("%-10s %18s %18s" % ('devices', 'find_device p50 us', 'discover p50 us'))
+        for r in report['discovery']:
+            print("%-10d %18.1f %18.1f" % (
+                r['devices'], r['find_device']['median_us'], r['fleet_discover']['median_us']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
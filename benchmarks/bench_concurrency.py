@@ -0,0 +1,155 @@
+##############################################################################
+#
+# Module: bench_concurrency.py
+#
+# Description:
+#     Concurrency stress of the per-device locks. Many threads per
+#     simulated MUTT alternate RDO and power role mailbox queries,
+#     half of them through one shared session and half through
+#     sessions of their own on the same device. Every answer must
+#     carry the opcode of its own query (no cross-talk), and the
+#     throughput should grow close to linearly with the number of
+#     devices, since devices never wait on each other's locks.
+#
+#     Exits with status 1 on any cross-talk, so it can gate CI.
+#
+#     Usage:
+#         python benchmarks/bench_concurrency.py
+#         python benchmarks/bench_concurrency.py --devices 1,4,16 --threads 16
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+# Lib imports
+# (None)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Own modules
+from model3501lib.pd_decode import OPCODE_POWER_ROLE, OPCODE_RDO  # noqa: E402
+from model3501lib.session import MuttSession  # noqa: E402
+from model3501lib.simulator import SimulatedBus  # noqa: E402
+
+# session method, opcode its answer must carry
+QUERIES = (('get_rdo', OPCODE_RDO), ('get_power_role', OPCODE_POWER_ROLE))
+
+
+def _worker(session, operations, offset, start, tally):
+    """
+    Run alternating mailbox queries and count wrong answers.
+    """
+    bad = 0
+    start.wait()
+    for number in range(operations):
+        method, opcode = QUERIES[(number + offset) % 2]
+        try:
+            result = getattr(session, method)()
+            if not result.ok or result.raw[1] != opcode:
+                bad += 1
+        except Exception:
+            bad += 1
+    tally.append(bad)
+
+
+def bench_devices(count, threads, operations, latency):
+    """
+    Stress ``count`` simulated MUTTs with ``threads`` threads each.
+
+    Args:
+        count (int): Simulated devices.
+        threads (int): Threads per device.
+        operations (int): Queries per thread.
+        latency (float): Simulated seconds per control transfer.
+
+    Returns:
+        dict: devices, threads, operations, cross_talk, elapsed and
+        operations per second.
+
+    Raises:
+        None
+    """
+    bus = SimulatedBus(count=count, latency=latency, reenum_delay=0.0)
+    workers = []
+    start = threading.Barrier(count * threads + 1)
+    tally = []
+    for state in bus.states:
+        shared = MuttSession(transport=bus, path=state.path)
+        # A contract must exist for the RDO query to answer in full
+        shared.set_charge(45)
+        for index in range(threads):
+            session = shared if index % 2 else MuttSession(transport=bus, path=state.path)
+            workers.append(threading.Thread(
+                target=_worker, args=(session, operations, index, start, tally)))
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+    total = count * threads * operations
+    return {
+        'devices': count,
+        'threads': count * threads,
+        'operations': total,
+        'cross_talk': sum(tally),
+        'elapsed_s': elapsed,
+        'ops_per_s': total / elapsed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Stress per-device locking with many threads on simulated MUTTs.')
+    parser.add_argument('--devices', default='1,2,4,8',
+                        help='comma separated simulated device counts')
+    parser.add_argument('--threads', type=int, default=8,
+                        help='threads per device')
+    parser.add_argument('--operations', type=int, default=50,
+                        help='queries per thread')
+    parser.add_argument('--latency', type=float, default=0.001,
+                        help='simulated seconds per control transfer')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--json', action='store_true', help='print JSON only')
+    args = parser.parse_args(argv)
+
+    results = [bench_devices(int(count), args.threads, args.operations, args.latency)
+               for count in args.devices.split(',')]
+    base = results[0]['ops_per_s'] / results[0]['devices']
+    for result in results:
+        # 1.0 means perfectly linear scaling from the first count
+        result['scaling'] = result['ops_per_s'] / (base * result['devices'])
+
+    report = {'latency_s': args.latency, 'threads_per_device': args.threads,
+              'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("%-8s %8s %10s %12s %10s %8s" % (
+            'devices', 'threads', 'ops', 'ops/s', 'crosstalk', 'scaling'))
+        for result in results:
+            print("%-8d %8d %10d %12.0f %10d %8.2f" % (
+                result['devices'], result['threads'], result['operations'],
+                result['ops_per_s'], result['cross_talk'], result['scaling']))
+    return 1 if any(result['cross_talk'] for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
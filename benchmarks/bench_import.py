@@ -0,0 +1,117 @@
+##############################################################################
+#
+# Module: bench_import.py
+#
+# Description:
+#     Measure the start-up cost of importing model3501lib in a fresh
+#     interpreter and fail when it exceeds the budget. The package
+#     import must stay side-effect free: no pyusb import and no USB
+#     bus access until the first command is issued.
+#
+#     Usage:
+#         python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Child program: time the import and report which heavy modules it pulled in.
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+{statement}
+t1 = time.perf_counter()
+print(json.dumps({{'ms': (t1 - t0) * 1000.0, 'usb': 'usb' in sys.modules}}))
+"""
+
+CASES = {
+    'import model3501lib': 'import model3501lib',
+    'from model3501lib import set_speed': 'from model3501lib import set_speed',
+    'from model3501lib import MuttSession': 'from model3501lib import MuttSession',
+}
+
+
+def measure(statement, runs):
+    """
+    Time a statement in fresh interpreters.
+
+    Args:
+        statement (str): Import statement to time.
+        runs (int): Number of interpreter launches.
+
+    Returns:
+        dict: Median and min time (ms) and whether pyusb was imported.
+
+    Raises:
+        subprocess.CalledProcessError: If the child interpreter fails.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = REPO_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    samples = []
+    usb_loaded = False
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        report = json.loads(out.strip().splitlines()[-1])
+        samples.append(report['ms'])
+        usb_loaded = usb_loaded or report['usb']
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'usb_imported': usb_loaded,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='model3501lib import-time benchmark')
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=10.0,
+                        help='regression threshold for the bare package import')
+    parser.add_argument('--json', action='store_true', help='emit JSON only')
+    args = parser.parse_args(argv)
+
+    results = {name: measure(stmt, args.runs) for name, stmt in CASES.items()}
+    bare = results['import model3501lib']
+    failures = ['%s imported pyusb' % name
+                for name, result in results.items() if result['usb_imported']]
+    if bare['median_ms'] > args.budget_ms:
+        failures.append('import model3501lib took %.2f ms (budget %.2f ms)'
+                        % (bare['median_ms'], args.budget_ms))
+
+    if args.json:
+        print(json.dumps({'results': results, 'budget_ms': args.budget_ms,
+                          'failures': failures}, indent=2))
+    else:
+        for name, r in results.items():
+            print("%-40s median %7.2f ms  min %7.2f ms  pyusb %s"
+                  % (name, r['median_ms'], r['min_ms'], r['usb_imported']))
+        for failure in failures:
+            print("REGRESSION:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+##############################################################################
+#
+# Module: bench_replay.py
+#
+# Description:
+#     Library overhead per command, without any device latency. The
+#     commands of a transfer log are replayed as fast as possible
+#     through the full session path (hooks, locks, retries, result
+#     building) against a ReplayBus. Without a log, a run of mixed
+#     commands is first recorded on a simulated MUTT.
+#
+#     Usage:
+#         python benchmarks/bench_replay.py
+#         python benchmarks/bench_replay.py --log lab-run.muttrec --device 0012345
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Lib imports
+# (None)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Own modules
+from model3501lib.recorder import Replayer, TransferRecorder  # noqa: E402
+from model3501lib.session import MuttSession  # noqa: E402
+from model3501lib.simulator import SimulatedBus  # noqa: E402
+
+
+def record_simulated(path, commands):
+    """
+    Record a mixed command run on a simulated MUTT.
+
+    Args:
+        path (str): Log file path.
+        commands (int): Commands to record.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    bus = SimulatedBus(count=1, latency=0.0, reenum_delay=0.0)
+    session = MuttSession(transport=bus)
+    session.set_charge(45)
+    steps = (session.get_rdo, session.get_power_role, session.cdstress_on,
+             session.cdstress_off, session.pd_charger_port, session.pd_captive_cables)
+    with TransferRecorder(path) as recorder:
+        recorder.attach(session)
+        for number in range(commands):
+            steps[number % len(steps)]()
+    session.close()
+
+
+def bench_replay(path, device, rounds):
+    """
+    Replay a log ``rounds`` times as fast as possible.
+
+    Args:
+        path (str): Log file path.
+        device (str): Device to replay, or None for a single-device log.
+        rounds (int): Replays to time.
+
+    Returns:
+        dict: commands, transfers, best seconds per command and per
+        transfer, and commands per second.
+
+    Raises:
+        ValueError: If the log cannot be replayed.
+    """
+    replayer = Replayer(path, device=device)
+    best = None
+    for _ in range(rounds):
+        began = time.perf_counter()
+        result, bus = replayer.run()
+        elapsed = time.perf_counter() - began
+        if bus.served != len(replayer.transfers):
+            raise ValueError("Replay served %d of %d transfers"
+                             % (bus.served, len(replayer.transfers)))
+        best = elapsed if best is None else min(best, elapsed)
+    commands = len(replayer.steps)
+    return {
+        'commands': commands,
+        'transfers': len(replayer.transfers),
+        'us_per_command': best / commands * 1e6,
+        'us_per_transfer': best / len(replayer.transfers) * 1e6,
+        'commands_per_s': commands / best,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure library overhead by replaying recorded transfer traffic.')
+    parser.add_argument('--log', help='transfer log to replay (default: record a simulated run)')
+    parser.add_argument('--device', help='device of the log to replay')
+    parser.add_argument('--commands', type=int, default=3000,
+                        help='commands of the simulated run')
+    parser.add_argument('--rounds', type=int, default=5, help='replays, best is reported')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--json', action='store_true', help='print JSON only')
+    args = parser.parse_args(argv)
+
+    path = args.log
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix='.muttrec')
+        os.close(handle)
+        record_simulated(path, args.commands)
+    try:
+        report = bench_replay(path, args.device, args.rounds)
+    finally:
+        if args.log is None:
+            os.remove(path)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("%d commands, %d transfers: %.1f us/command, %.1f us/transfer, %.0f commands/s"
+              % (report['commands'], report['transfers'], report['us_per_command'],
+                 report['us_per_transfer'], report['commands_per_s']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,23 +1,130 @@
-
 ##############################################################################
-# 
+#
 # Module: __init__.py
 #
 # Description:
-#     __init__ method in Python is used to initialize objects of a class. 
-#     It is also called a constructor
+#     Package entry point for model3501lib. Public names are loaded
+#     lazily on first attribute access (PEP 562), so importing the
+#     package neither imports pyusb nor touches the USB bus.
 #
 # Author:
 #     Vinay N, MCCI Corporation May 2024
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Lazy attribute loading
+#
 ##############################################################################
-from .set_speed import DeviceController, set_speed
-from .getrdo import getrdoController, get_rdo_status
-from .getpower_role import getpowerRoleController, get_power_role_status
-from .emulate_charge import ChargeController, set_charge
-from .cdstress_on import CDstressONController, onset_cdstress
-from .cdstress_off import CDstressOFFController, offset_cdstress
-from .pdcaptive_cables import PDCaptiveCablesController, pd_captive_cables_status
-from .pdcharger_port import PDChargerPortController, pd_charger_port_status
-from .reconnect import ReconnectController, reconnect_status
-from .findDevice import FindDeviceController, find_device_status
+
+# Built-in imports
+import importlib
+import sys
+import types
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+# Public name -> submodule providing it
+_EXPORTS = {
+    'DeviceController': '.set_speed',
+    'set_speed': '.set_speed',
+    'getrdoController': '.getrdo',
+    'get_rdo_status': '.getrdo',
+    'getpowerRoleController': '.getpower_role',
+    'get_power_role_status': '.getpower_role',
+    'ChargeController': '.emulate_charge',
+    'set_charge': '.emulate_charge',
+    'CDstressONController': '.cdstress_on',
+    'onset_cdstress': '.cdstress_on',
+    'CDstressOFFController': '.cdstress_off',
+    'offset_cdstress': '.cdstress_off',
+    'PDCaptiveCablesController': '.pdcaptive_cables',
+    'pd_captive_cables_status': '.pdcaptive_cables',
+    'PDChargerPortController': '.pdcharger_port',
+    'pd_charger_port_status': '.pdcharger_port',
+    'ReconnectController': '.reconnect',
+    'reconnect_status': '.reconnect',
+    'FindDeviceController': '.findDevice',
+    'find_device_status': '.findDevice',
+    'MuttSession': '.session',
+    'default_session': '.session',
+    'close_default_session': '.session',
+    'set_default_session': '.session',
+    'MuttFleet': '.fleet',
+    'AsyncMuttSession': '.aio',
+    'AsyncMuttFleet': '.aio',
+    'Pipeline': '.pipeline',
+    'run_pipeline': '.pipeline',
+    'RdoSampler': '.rdo_sampler',
+    'PowerRole': '.pd_decode',
+    'RdoResult': '.pd_decode',
+    'PowerRoleResult': '.pd_decode',
+    'decode_rdo': '.pd_decode',
+    'decode_power_role': '.pd_decode',
+    'PowerRoleWatcher': '.power_role_watcher',
+    'CampaignRunner': '.campaign',
+    'ReenumTracer': '.reenum_tracer',
+    'FixedPdo': '.pd_profile',
+    'PdProfile': '.pd_profile',
+    'SimulatedBus': '.simulator',
+    'TransferMetrics': '.metrics',
+    'MetricsServer': '.metrics',
+    'CommandResult': '.results',
+    'EventLog': '.events',
+    'event_log': '.events',
+    'MuttDaemon': '.daemon',
+    'MuttClient': '.client',
+    'TimeoutPolicy': '.timeouts',
+    'ShardedFleet': '.shards',
+    'TransferRecorder': '.recorder',
+    'Replayer': '.recorder',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Load a public name from its submodule on first access.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        object: The requested class or function.
+
+    Raises:
+        AttributeError: If the name is not exported.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+    Package module type keeping exported functions visible.
+
+    Importing a submodule binds it as a package attribute. The
+    ``set_speed`` submodule shares its name with the ``set_speed``
+    function, so bind the function instead to keep the public API
+    identical to the eager package.
+    """
+    def __setattr__(self, name, value):
+        if (isinstance(value, types.ModuleType)
+                and _EXPORTS.get(name) == '.' + name
+                and hasattr(value, name)):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
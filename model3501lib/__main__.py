@@ -0,0 +1,25 @@
+##############################################################################
+#
+# Module: __main__.py
+#
+# Description:
+#     'python -m model3501lib' runs the mutt command-line tool.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import sys
+
+# Lib imports
+# (None)
+
+# Own modules
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,459 @@
+##############################################################################
+#
+# Module: aio.py
+#
+# Description:
+#     asyncio variants of the Type-C MUTT controllers, session and
+#     fleet. These are a thread offload, not asynchronous USB I/O:
+#     every call runs the blocking pyusb code through
+#     loop.run_in_executor on a single worker thread owned by its
+#     device, and no transfer is submitted to libusb asynchronously.
+#     The event loop stays free, transfers to one MUTT stay ordered
+#     and transfers to many MUTTs are in flight at the same time, at
+#     the cost of one thread per device.
+#
+#     Every awaitable accepts a per-call timeout and can be
+#     cancelled. The deadline is handed down to libusb as the
+#     transfer timeout, so a wedged MUTT frees its worker when the
+#     deadline expires instead of after pyusb's default 1000 ms. A
+#     call cancelled before its transfer started is dropped from the
+#     device queue without touching the bus; one already on the
+#     worker thread runs to the end of its transfer.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Lib imports
+# (None)
+
+# Own modules
+from .cdstress_off import CDstressOFFController
+from .cdstress_on import CDstressONController
+from .emulate_charge import ChargeController
+from .findDevice import FindDeviceController
+from .fleet import COMMANDS, FleetResult, MuttFleet
+from .getpower_role import getpowerRoleController
+from .getrdo import getrdoController
+from .pdcaptive_cables import PDCaptiveCablesController
+from .pdcharger_port import PDChargerPortController
+from .reconnect import ReconnectController
+from .session import MuttSession, PRODUCT_ID, VENDOR_ID
+from .set_speed import DeviceController
+
+
+def _device_worker():
+    """
+    Create the single worker thread that serializes one device.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='mutt-aio')
+
+
+def _invoke(target, method, args, deadline):
+    """
+    Run a blocking operation on the device worker thread.
+
+    When a deadline is set, every transfer of the call is given the
+    remaining time as its timeout. The device handle itself is left
+    untouched, so other users of a shared session keep their own
+    timeouts.
+
+    Args:
+        target (object): Controller or session.
+        method (str): Method name.
+        args (tuple): Method arguments.
+        deadline (float): time.monotonic() deadline, or None.
+
+    Returns:
+        object: Method result.
+
+    Raises:
+        TimeoutError: If the deadline expired while the call was queued.
+    """
+    if deadline is None:
+        return getattr(target, method)(*args)
+
+    if deadline <= time.monotonic():
+        raise TimeoutError("Deadline expired before the transfer started")
+
+    if isinstance(target, MuttSession):
+        target.set_call_deadline(deadline)
+        try:
+            return getattr(target, method)(*args)
+        finally:
+            target.set_call_deadline(None)
+
+    # The controller belongs to its async wrapper and is only used
+    # from this worker thread
+    device = target.device
+    if device is None:
+        return getattr(target, method)(*args)
+
+    from .timeouts import Budget, TimedDevice
+
+    timed = target.device = TimedDevice(device, Budget(deadline=deadline))
+    try:
+        return getattr(target, method)(*args)
+    finally:
+        if target.device is timed:
+            target.device = device
+
+
+async def _submit(executor, target, method, args, timeout):
+    """
+    Queue an operation on a device worker and await its result.
+
+    Args:
+        executor (ThreadPoolExecutor): Device worker.
+        target (object): Controller or session.
+        method (str): Method name.
+        args (tuple): Method arguments.
+        timeout (float): Deadline in seconds, or None.
+
+    Returns:
+        object: Method result.
+
+    Raises:
+        asyncio.TimeoutError: If the deadline expires.
+        asyncio.CancelledError: If the call is cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    future = loop.run_in_executor(executor, _invoke, target, method, args, deadline)
+    if timeout is None:
+        return await future
+    return await asyncio.wait_for(future, timeout)
+
+
+class AsyncController:
+    """
+    Base class of the asyncio controller variants.
+
+    Wraps one blocking controller and runs its methods on a
+    dedicated worker thread.
+
+    Attributes:
+        controller (object): Wrapped blocking controller.
+    """
+    controller_class = None
+
+    def __init__(self, vendor_id=VENDOR_ID, product_id=PRODUCT_ID, device=None):
+        """
+        Initialize asyncio controller.
+
+        Args:
+            vendor_id (int): USB Vendor ID.
+            product_id (int): USB Product ID.
+            device (usb.core.Device): Optional already located device.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.controller = self.controller_class(vendor_id, product_id)
+        self.controller.device = device
+        self._executor = _device_worker()
+
+    @property
+    def device(self):
+        return self.controller.device
+
+    async def _call(self, method, *args, timeout=None):
+        return await _submit(self._executor, self.controller, method, args, timeout)
+
+    async def find_device(self, timeout=None):
+        return await self._call('find_device', timeout=timeout)
+
+    async def aclose(self):
+        """
+        Stop the worker thread once queued calls have completed.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._executor.shutdown, True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+class AsyncDeviceController(AsyncController):
+    controller_class = DeviceController
+
+    async def set_device_speed(self, speed_type, timeout=None):
+        return await self._call('set_device_speed', speed_type, timeout=timeout)
+
+
+class AsyncChargeController(AsyncController):
+    controller_class = ChargeController
+
+    async def set_charge(self, watts, timeout=None):
+        return await self._call('set_charge', watts, timeout=timeout)
+
+    async def set_profile(self, profile, timeout=None):
+        return await self._call('set_profile', profile, timeout=timeout)
+
+    async def set_emulate_charge_15w(self, watts, timeout=None):
+        return await self._call('set_emulate_charge_15w', watts, timeout=timeout)
+
+    async def set_emulate_charge_27w(self, watts, timeout=None):
+        return await self._call('set_emulate_charge_27w', watts, timeout=timeout)
+
+    async def set_emulate_charge_45w(self, watts, timeout=None):
+        return await self._call('set_emulate_charge_45w', watts, timeout=timeout)
+
+
+class AsyncgetrdoController(AsyncController):
+    controller_class = getrdoController
+
+    async def get_rdo(self, timeout=None):
+        return await self._call('get_rdo', timeout=timeout)
+
+
+class AsyncgetpowerRoleController(AsyncController):
+    controller_class = getpowerRoleController
+
+    async def get_power_role(self, timeout=None):
+        return await self._call('get_power_role', timeout=timeout)
+
+
+class AsyncCDstressONController(AsyncController):
+    controller_class = CDstressONController
+
+    async def set_cdstress_on(self, timeout=None):
+        return await self._call('set_cdstress_on', timeout=timeout)
+
+
+class AsyncCDstressOFFController(AsyncController):
+    controller_class = CDstressOFFController
+
+    async def set_cdstress_off(self, timeout=None):
+        return await self._call('set_cdstress_off', timeout=timeout)
+
+
+class AsyncPDCaptiveCablesController(AsyncController):
+    controller_class = PDCaptiveCablesController
+
+    async def pd_captive_cables(self, timeout=None):
+        return await self._call('pd_captive_cables', timeout=timeout)
+
+
+class AsyncPDChargerPortController(AsyncController):
+    controller_class = PDChargerPortController
+
+    async def pd_charger_port(self, timeout=None):
+        return await self._call('pd_charger_port', timeout=timeout)
+
+
+class AsyncReconnectController(AsyncController):
+    controller_class = ReconnectController
+
+    async def disconnect_and_reconnect(self, delay_disconnect_ms,
+                                       delay_reconnect_ms, timeout=None):
+        return await self._call('disconnect_and_reconnect', delay_disconnect_ms,
+                                delay_reconnect_ms, timeout=timeout)
+
+
+class AsyncFindDeviceController(AsyncController):
+    controller_class = FindDeviceController
+
+
+class AsyncMuttSession:
+    """
+    asyncio variant of MuttSession, running the blocking session
+    on its device's worker thread.
+
+    Attributes:
+        session (MuttSession): Wrapped blocking session.
+    """
+    def __init__(self, session=None, **kwargs):
+        """
+        Initialize asyncio session.
+
+        Args:
+            session (MuttSession): Session to wrap; a new one is
+                created from kwargs when omitted.
+            **kwargs: MuttSession constructor arguments.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.session = session if session is not None else MuttSession(**kwargs)
+        self._executor = _device_worker()
+
+    async def _call(self, method, *args, timeout=None):
+        return await _submit(self._executor, self.session, method, args, timeout)
+
+    async def open(self, timeout=None):
+        return await self._call('open', timeout=timeout)
+
+    async def close(self):
+        """
+        Close the session once queued calls have completed and stop
+        the worker thread, without blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._shutdown)
+
+    def _shutdown(self):
+        self._executor.submit(self.session.close)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def set_speed(self, speed_type, timeout=None):
+        return await self._call('set_speed', speed_type, timeout=timeout)
+
+    async def set_charge(self, watts, timeout=None):
+        return await self._call('set_charge', watts, timeout=timeout)
+
+    async def set_profile(self, profile, timeout=None):
+        return await self._call('set_profile', profile, timeout=timeout)
+
+    async def get_rdo(self, timeout=None):
+        return await self._call('get_rdo', timeout=timeout)
+
+    async def get_power_role(self, timeout=None):
+        return await self._call('get_power_role', timeout=timeout)
+
+    async def cdstress_on(self, timeout=None):
+        return await self._call('cdstress_on', timeout=timeout)
+
+    async def cdstress_off(self, timeout=None):
+        return await self._call('cdstress_off', timeout=timeout)
+
+    async def pd_captive_cables(self, timeout=None):
+        return await self._call('pd_captive_cables', timeout=timeout)
+
+    async def pd_charger_port(self, timeout=None):
+        return await self._call('pd_charger_port', timeout=timeout)
+
+    async def reconnect(self, delay_disconnect_ms, delay_reconnect_ms, timeout=None):
+        return await self._call('reconnect', delay_disconnect_ms,
+                                delay_reconnect_ms, timeout=timeout)
+
+
+class AsyncMuttFleet:
+    """
+    asyncio variant of MuttFleet.
+
+    Each device gets its own worker thread, so a fleet command keeps
+    one blocking transfer in flight per device.
+
+    Attributes:
+        fleet (MuttFleet): Wrapped blocking fleet registry.
+    """
+    def __init__(self, fleet=None, **kwargs):
+        self.fleet = fleet if fleet is not None else MuttFleet(**kwargs)
+        self._sessions = {}
+
+    async def discover(self):
+        devices = await asyncio.get_running_loop().run_in_executor(
+            None, self.fleet.discover)
+        live = set(map(id, devices))
+        for key in [k for k in self._sessions if k not in live]:
+            await self._sessions.pop(key).close()
+        return devices
+
+    def _session(self, entry):
+        session = self._sessions.get(id(entry))
+        if session is None:
+            session = AsyncMuttSession(entry.session)
+            self._sessions[id(entry)] = session
+        return session
+
+    async def _run_one(self, entry, command, args, timeout):
+        start = time.perf_counter()
+        try:
+            value = await getattr(self._session(entry), command)(*args, timeout=timeout)
+            error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            value = None
+            error = e
+        return FleetResult(entry, value, error, time.perf_counter() - start)
+
+    async def run(self, command, *args, devices=None, timeout=None):
+        """
+        Run a session command on several devices concurrently.
+
+        Args:
+            command (str): Session method name, one of COMMANDS.
+            *args: Arguments passed to the command.
+            devices (iterable): Device keys; None for all devices.
+            timeout (float): Per-device deadline in seconds.
+
+        Returns:
+            list: FleetResult per device, in selection order.
+
+        Raises:
+            ValueError: If the command is unknown.
+            KeyError: If a device key matches no device.
+        """
+        if command not in COMMANDS:
+            raise ValueError("Unknown fleet command: %r" % (command,))
+        return list(await asyncio.gather(*(
+            self._run_one(entry, command, args, timeout)
+            for entry in self.fleet.select(devices))))
+
+    async def set_speed(self, speed_type, devices=None, timeout=None):
+        return await self.run('set_speed', speed_type, devices=devices, timeout=timeout)
+
+    async def set_charge(self, watts, devices=None, timeout=None):
+        return await self.run('set_charge', watts, devices=devices, timeout=timeout)
+
+    async def set_profile(self, profile, devices=None, timeout=None):
+        return await self.run('set_profile', profile, devices=devices, timeout=timeout)
+
+    async def get_rdo(self, devices=None, timeout=None):
+        return await self.run('get_rdo', devices=devices, timeout=timeout)
+
+    async def get_power_role(self, devices=None, timeout=None):
+        return await self.run('get_power_role', devices=devices, timeout=timeout)
+
+    async def cdstress_on(self, devices=None, timeout=None):
+        return await self.run('cdstress_on', devices=devices, timeout=timeout)
+
+    async def cdstress_off(self, devices=None, timeout=None):
+        return await self.run('cdstress_off', devices=devices, timeout=timeout)
+
+    async def pd_captive_cables(self, devices=None, timeout=None):
+        return await self.run('pd_captive_cables', devices=devices, timeout=timeout)
+
+    async def pd_charger_port(self, devices=None, timeout=None):
+        return await self.run('pd_charger_port', devices=devices, timeout=timeout)
+
+    async def reconnect(self, delay_disconnect_ms, delay_reconnect_ms, devices=None,
+                        timeout=None):
+        return await self.run('reconnect', delay_disconnect_ms, delay_reconnect_ms,
+                              devices=devices, timeout=timeout)
+
+    async def close(self):
+        """
+        Close every device session and the wrapped fleet, without
+        blocking the event loop.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(session.close() for session in sessions))
+        await asyncio.get_running_loop().run_in_executor(None, self.fleet.close)
@@ -0,0 +1,430 @@
+##############################################################################
+#
+# Module: campaign.py
+#
+# Description:
+#     Long-running disconnect/reconnect and CD stress campaigns over
+#     many MUTTs at once. Per-cycle outcomes are appended to a compact
+#     binary log per device, which doubles as the checkpoint: a campaign
+#     restarted after a crash or reboot resumes at the first cycle that
+#     has no record, with the same delay schedule.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import json
+import os
+import random
+import re
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+KINDS = ('reconnect', 'cdstress')
+
+OUTCOME_OK = 0
+OUTCOME_FAILED = 1
+OUTCOME_ERROR = 2
+
+# cycle, wall clock time, outcome, first delay (ms), second delay (ms),
+# command duration (s)
+RECORD = struct.Struct('<IdBHHf')
+
+CHECKPOINT_FILE = 'campaign.json'
+
+# Delays travel in 16-bit wValue/wIndex fields and log records
+MAX_DELAY_MS = 0xFFFF
+
+
+def _check_delay(name, ms):
+    if ms < 0:
+        raise ValueError("%s must not be negative, got %r ms" % (name, ms))
+
+
+class Fixed:
+    """
+    Constant delay in milliseconds.
+    """
+    def __init__(self, ms):
+        _check_delay('ms', ms)
+        self.ms = int(ms)
+
+    def __call__(self, rng):
+        return self.ms
+
+    def describe(self):
+        return ['fixed', self.ms]
+
+
+class Uniform:
+    """
+    Delay drawn uniformly from [low_ms, high_ms].
+    """
+    def __init__(self, low_ms, high_ms):
+        _check_delay('low_ms', low_ms)
+        if low_ms > high_ms:
+            raise ValueError("low_ms must not exceed high_ms")
+        self.low_ms = int(low_ms)
+        self.high_ms = int(high_ms)
+
+    def __call__(self, rng):
+        return rng.randint(self.low_ms, self.high_ms)
+
+    def describe(self):
+        return ['uniform', self.low_ms, self.high_ms]
+
+
+class Normal:
+    """
+    Delay drawn from a normal distribution, clipped to [low_ms, high_ms].
+    """
+    def __init__(self, mean_ms, stdev_ms, low_ms=0, high_ms=MAX_DELAY_MS):
+        _check_delay('low_ms', low_ms)
+        if high_ms > MAX_DELAY_MS:
+            raise ValueError("high_ms must not exceed %d, got %r" % (MAX_DELAY_MS, high_ms))
+        if low_ms > high_ms:
+            raise ValueError("low_ms must not exceed high_ms")
+        self.mean_ms = float(mean_ms)
+        self.stdev_ms = float(stdev_ms)
+        self.low_ms = int(low_ms)
+        self.high_ms = int(high_ms)
+
+    def __call__(self, rng):
+        value = int(round(rng.gauss(self.mean_ms, self.stdev_ms)))
+        return min(max(value, self.low_ms), self.high_ms)
+
+    def describe(self):
+        return ['normal', self.mean_ms, self.stdev_ms, self.low_ms, self.high_ms]
+
+
+class CycleRecord:
+    """
+    One logged campaign cycle.
+
+    Attributes:
+        cycle (int): Cycle index, from 0.
+        timestamp (float): Wall clock time the cycle started.
+        outcome (int): OUTCOME_OK, OUTCOME_FAILED or OUTCOME_ERROR.
+        delay1_ms (int): Disconnect delay, or CD stress dwell time.
+        delay2_ms (int): Reconnect delay, or 0 for CD stress.
+        duration (float): Command duration in seconds.
+    """
+    __slots__ = ('cycle', 'timestamp', 'outcome', 'delay1_ms', 'delay2_ms', 'duration')
+
+    def __init__(self, cycle, timestamp, outcome, delay1_ms, delay2_ms, duration):
+        self.cycle = cycle
+        self.timestamp = timestamp
+        self.outcome = outcome
+        self.delay1_ms = delay1_ms
+        self.delay2_ms = delay2_ms
+        self.duration = duration
+
+    def __repr__(self):
+        return "CycleRecord(%d, outcome=%d, delays=(%d, %d), duration=%.6f)" % (
+            self.cycle, self.outcome, self.delay1_ms, self.delay2_ms, self.duration)
+
+
+def read_log(path):
+    """
+    Read the complete records of a campaign log.
+
+    A partial record left by a crash at the end of the file is ignored.
+
+    Args:
+        path (str): Log file path.
+
+    Returns:
+        list: CycleRecord entries in cycle order.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    usable = len(data) - len(data) % RECORD.size
+    return [CycleRecord(*fields) for fields in RECORD.iter_unpack(data[:usable])]
+
+
+def _describe(distribution):
+    """
+    JSON description of a delay distribution for the checkpoint.
+    """
+    if hasattr(distribution, 'describe'):
+        return distribution.describe()
+    return repr(distribution)
+
+
+def _log_name(key):
+    """
+    Map a device key to a safe log file name.
+    """
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', str(key)) + '.log'
+
+
+class CampaignRunner:
+    """
+    Run reconnect or CD stress cycles on many devices with resume.
+
+    Every device runs its cycles on its own thread. Each completed
+    cycle appends one fixed-size record to ``<directory>/<key>.log``;
+    on start the runner counts the complete records of every log and
+    continues from there. The delays of cycle N depend only on the
+    seed, the device key and N, so a resumed campaign replays the
+    same schedule.
+
+    Attributes:
+        directory (str): Campaign directory holding logs and checkpoint.
+        sessions (dict): Device key -> MuttSession.
+        cycles (int): Cycles to run per device.
+        kind (str): 'reconnect' or 'cdstress'.
+    """
+    def __init__(self, directory, sessions, cycles, kind='reconnect',
+                 disconnect_delay=Fixed(500), reconnect_delay=Fixed(500),
+                 dwell=Fixed(1000), settle=Fixed(2000), seed=0, sync_every=1):
+        """
+        Initialize campaign runner.
+
+        Args:
+            directory (str): Campaign directory; created if missing.
+            sessions (dict or MuttFleet): Device key -> MuttSession,
+                or a discovered MuttFleet.
+            cycles (int): Cycles to run per device.
+            kind (str): 'reconnect' for disconnect/reconnect cycles,
+                'cdstress' for CD stress on / dwell / off cycles.
+            disconnect_delay (callable): Reconnect X delay distribution.
+            reconnect_delay (callable): Reconnect Y delay distribution.
+            dwell (callable): Time CD stress stays on per cycle.
+            settle (callable): Extra wait after each cycle, on top of
+                the reconnect delays, for the MUTT to re-enumerate.
+            seed (int): Schedule seed.
+            sync_every (int): fsync the log every this many cycles.
+                The default of 1 keeps every completed cycle across a
+                power loss; cycles take seconds, so the fsync is cheap.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If kind is unknown, or the directory holds a
+                checkpoint of a different campaign.
+        """
+        if kind not in KINDS:
+            raise ValueError("Unknown campaign kind: %r" % (kind,))
+        if hasattr(sessions, 'devices'):
+            sessions = {entry.key: entry.session for entry in sessions.devices}
+        self.directory = directory
+        self.sessions = dict(sessions)
+        self.cycles = int(cycles)
+        self.kind = kind
+        self.disconnect_delay = disconnect_delay
+        self.reconnect_delay = reconnect_delay
+        self.dwell = dwell
+        self.settle = settle
+        self.seed = seed
+        self.sync_every = max(1, int(sync_every))
+        self._stop = threading.Event()
+        self._progress = {}
+        os.makedirs(directory, exist_ok=True)
+        self._check_checkpoint()
+
+    def _parameters(self):
+        return {
+            'kind': self.kind,
+            'cycles': self.cycles,
+            'seed': self.seed,
+            'disconnect_delay': _describe(self.disconnect_delay),
+            'reconnect_delay': _describe(self.reconnect_delay),
+            'dwell': _describe(self.dwell),
+            'settle': _describe(self.settle),
+            'devices': sorted(str(key) for key in self.sessions),
+        }
+
+    def _check_checkpoint(self):
+        """
+        Verify or create the checkpoint describing this campaign.
+        """
+        path = os.path.join(self.directory, CHECKPOINT_FILE)
+        parameters = self._parameters()
+        if os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            for name in ('kind', 'seed', 'disconnect_delay', 'reconnect_delay',
+                         'dwell', 'settle'):
+                if saved.get(name) != parameters[name]:
+                    raise ValueError("Campaign directory %s holds a different "
+                                     "campaign (%s differs)" % (self.directory, name))
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(parameters, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def log_path(self, key):
+        return os.path.join(self.directory, _log_name(key))
+
+    def completed(self, key):
+        """
+        Number of cycles already recorded for a device.
+
+        Truncates a partial trailing record so appends stay aligned.
+
+        Args:
+            key (str): Device key.
+
+        Returns:
+            int: Completed cycles.
+
+        Raises:
+            None
+        """
+        path = self.log_path(key)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return 0
+        if size % RECORD.size:
+            with open(path, 'r+b') as f:
+                f.truncate(size - size % RECORD.size)
+        return size // RECORD.size
+
+    def _schedule(self, key, cycle):
+        rng = random.Random("%s:%s:%d" % (self.seed, key, cycle))
+        if self.kind == 'reconnect':
+            first = self.disconnect_delay(rng)
+            second = self.reconnect_delay(rng)
+        else:
+            first = self.dwell(rng)
+            second = 0
+        settle = self.settle(rng)
+        # Checked before any transfer: a bad delay must not surface
+        # from RECORD.pack after the cycle ran
+        names = (('disconnect_delay', 'reconnect_delay') if self.kind == 'reconnect'
+                 else ('dwell', None))
+        _check_delay(names[0], first)
+        if names[1]:
+            _check_delay(names[1], second)
+        _check_delay('settle', settle)
+        return min(first, MAX_DELAY_MS), min(second, MAX_DELAY_MS), settle
+
+    def _cycle(self, session, first, second):
+        if self.kind == 'reconnect':
+            return session.reconnect(first, second)
+        try:
+            if not session.cdstress_on():
+                return False
+            self._stop.wait(first / 1000.0)
+        finally:
+            # Also after a cdstress_on that failed or raised once it
+            # may have reached the MUTT: never leave the link toggling
+            stopped = session.cdstress_off()
+        return stopped
+
+    def _run_device(self, key):
+        session = self.sessions[key]
+        start = self.completed(key)
+        self._progress[key] = start
+        with open(self.log_path(key), 'ab') as log:
+            for cycle in range(start, self.cycles):
+                if self._stop.is_set():
+                    break
+                first, second, settle = self._schedule(key, cycle)
+                timestamp = time.time()
+                began = time.perf_counter()
+                try:
+                    outcome = OUTCOME_OK if self._cycle(session, first, second) \
+                        else OUTCOME_FAILED
+                except Exception:
+                    outcome = OUTCOME_ERROR
+                duration = time.perf_counter() - began
+
+                log.write(RECORD.pack(cycle, timestamp, outcome, first, second, duration))
+                log.flush()
+                if (cycle + 1) % self.sync_every == 0:
+                    os.fsync(log.fileno())
+                self._progress[key] = cycle + 1
+
+                # Let the MUTT drop off and come back before the next cycle
+                wait_ms = settle + (first + second if self.kind == 'reconnect' else 0)
+                self._stop.wait(wait_ms / 1000.0)
+            os.fsync(log.fileno())
+        return key
+
+    def run(self):
+        """
+        Run (or resume) the campaign on every device until done or stopped.
+
+        Args:
+            None
+
+        Returns:
+            dict: Device key -> summary with completed, ok, failed
+            and error counts.
+
+        Raises:
+            ValueError: If a delay distribution yields a negative
+                delay; the device stops before that cycle's commands.
+        """
+        self._stop.clear()
+        if self.sessions:
+            with ThreadPoolExecutor(max_workers=len(self.sessions),
+                                    thread_name_prefix='mutt-campaign') as executor:
+                for future in [executor.submit(self._run_device, key)
+                               for key in self.sessions]:
+                    future.result()
+        return self.summary()
+
+    def stop(self):
+        """
+        Ask every device thread to stop after its current cycle.
+        """
+        self._stop.set()
+
+    def progress(self):
+        """
+        Completed cycles per device while the campaign runs.
+        """
+        return dict(self._progress)
+
+    def summary(self):
+        """
+        Summarize the logs of every device.
+
+        Args:
+            None
+
+        Returns:
+            dict: Device key -> dict with completed, ok, failed, error.
+
+        Raises:
+            None
+        """
+        result = {}
+        for key in self.sessions:
+            counts = [0, 0, 0]
+            try:
+                records = read_log(self.log_path(key))
+            except OSError:
+                records = []
+            for record in records:
+                counts[min(record.outcome, OUTCOME_ERROR)] += 1
+            result[key] = {
+                'completed': len(records),
+                'ok': counts[OUTCOME_OK],
+                'failed': counts[OUTCOME_FAILED],
+                'error': counts[OUTCOME_ERROR],
+            }
+        return result
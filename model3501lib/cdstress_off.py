@@ -12,16 +12,23 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import FAILED, OK, CommandResult, not_found
+from .vendor_commands import CD_STRESS_OFF
 
 
 class CDstressOFFController:
@@ -69,6 +76,8 @@ class CDstressOFFController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(
             idVendor=self.vendor_id,
             idProduct=self.product_id
@@ -83,34 +92,25 @@ class CDstressOFFController:
             None
 
         Returns:
-            bool: True if command executed successfully, False otherwise.
+            CommandResult: Outcome of the command.
 
         Raises:
             usb.core.USBError: If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-
-        # USB Control Transfer parameters
-        bmRequestType = 0x40
-        bRequest = 0xE8
-        wValue = 0x0000
-        wIndex = 0x0000
-        wLength = 0x0000
-
-        # Send control transfer
-        result = self.device.ctrl_transfer(
-            bmRequestType,
-            bRequest,
-            wValue,
-            wIndex,
-            wLength
-        )
+            emit(WARNING, "Device not found")
+            return not_found('cdstress_off')
 
-        print("result_cd_stress:", result)
+        # Send control transfer (0xE8, wIndex 0x0000)
+        began = time.perf_counter()
+        result = CD_STRESS_OFF.issue(self.device)
+        duration = time.perf_counter() - began
 
-        return result == 0
+        if result == 0:
+            emit(INFO, "CD Stress OFF command sent successfully")
+            return CommandResult('cdstress_off', OK, duration=duration)
+        emit(WARNING, "Failed to send CD Stress OFF command: %d bytes transferred", result)
+        return CommandResult('cdstress_off', FAILED, duration=duration)
 
     def setup_cd_stress_off(self):
         """
@@ -123,39 +123,31 @@ class CDstressOFFController:
             None
 
         Returns:
-            None
+            CommandResult: Outcome of the command.
 
         Raises:
             None
         """
-        if self.find_device():
-            if self.set_cdstress_off():
-                print("CD Stress OFF command sent successfully")
-            else:
-                print("Failed to send CD Stress OFF command")
-        else:
-            print("Device not found")
+        self.find_device()
+        return self.set_cdstress_off()
 
 
 def offset_cdstress():
     """
     Entry function to disable CD Stress.
 
-    This function initializes the controller with
-    predefined Vendor ID and Product ID and triggers
-    the CD Stress OFF workflow.
+    This function triggers the CD Stress OFF
+    workflow through the default cached session.
 
     Args:
         None
 
     Returns:
-        None
+        CommandResult: Outcome of the command.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045E
-    PRODUCT_ID = 0x078F
+    from .session import default_session
 
-    controller = CDstressOFFController(VENDOR_ID, PRODUCT_ID)
-    controller.setup_cd_stress_off()
+    return default_session().cdstress_off()
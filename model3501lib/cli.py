@@ -0,0 +1,412 @@
+##############################################################################
+#
+# Module: cli.py
+#
+# Description:
+#     'mutt' command-line tool. Runs one command, or a whole script
+#     file of commands in one process and one device session, with
+#     plain text or JSON output.
+#
+#     Only the standard library is imported at start-up; pyusb and
+#     the controllers are imported once a command actually runs, so
+#     'mutt --help' and argument errors cost no USB work.
+#
+#     Usage:
+#         mutt speed h
+#         mutt charge 27
+#         mutt --json rdo
+#         mutt reconnect 500 500
+#         mutt run lab-step.mutt
+#         mutt serve &
+#         mutt --daemon rdo
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import argparse
+import json
+import shlex
+import signal
+import sys
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+_PD_PORTS = {'captive': 'pd_captive_cables', 'charger': 'pd_charger_port'}
+
+# Command word -> (help, ((parameter, type, choices), ...), builder).
+# The builder turns the converted arguments into a pipeline
+# operation and its argument tuple.
+COMMANDS = {
+    'speed': ("set the USB speed: s super, h high, f full",
+              (('speed', str, ('s', 'h', 'f')),),
+              lambda a: ('set_speed', (a[0],))),
+    'charge': ("emulate a PD charger with max watts",
+               (('watts', int, None),),
+               lambda a: ('set_charge', (a[0],))),
+    'rdo': ("read the RDO of the current power contract",
+            (),
+            lambda a: ('get_rdo', ())),
+    'role': ("read the current power role",
+             (),
+             lambda a: ('get_power_role', ())),
+    'cdstress': ("enable or disable connect-disconnect stress",
+                 (('state', str, ('on', 'off')),),
+                 lambda a: ('cdstress_' + a[0], ())),
+    'pd': ("route PD through the captive cable or the charger receptacle",
+           (('port', str, tuple(_PD_PORTS)),),
+           lambda a: (_PD_PORTS[a[0]], ())),
+    'reconnect': ("disconnect and reconnect once, delays in ms",
+                  (('disconnect_ms', int, None), ('reconnect_ms', int, None)),
+                  lambda a: ('reconnect', tuple(a))),
+    'wait': ("pause for ms (scripts)",
+             (('ms', int, None),),
+             lambda a: ('wait', (a[0],))),
+}
+
+
+def parse_command(words):
+    """
+    Convert one command line into a pipeline step.
+
+    Args:
+        words (list): Command word followed by its arguments, for
+            example ['reconnect', '500', '500'].
+
+    Returns:
+        tuple: (operation, *args) step for pipeline.Pipeline.
+
+    Raises:
+        ValueError: If the command or its arguments are invalid.
+    """
+    name, values = words[0], words[1:]
+    spec = COMMANDS.get(name)
+    if spec is None:
+        raise ValueError("unknown command %r, expected one of %s"
+                         % (name, ', '.join(COMMANDS)))
+    _, params, build = spec
+    if len(values) != len(params):
+        raise ValueError("%s takes %d argument(s): %s" % (
+            name, len(params), ' '.join(param for param, _, _ in params) or 'none'))
+    args = []
+    for (param, kind, choices), value in zip(params, values):
+        try:
+            value = kind(value)
+        except ValueError:
+            raise ValueError("%s: %s must be %s, got %r"
+                             % (name, param, kind.__name__, value)) from None
+        if choices is not None and value not in choices:
+            raise ValueError("%s: %s must be one of %s, got %r"
+                             % (name, param, ', '.join(choices), value))
+        args.append(value)
+    operation, args = build(args)
+    return (operation,) + args
+
+
+def parse_script(lines, source='<script>'):
+    """
+    Parse a script: one command per line, '#' starts a comment.
+
+    Args:
+        lines (iterable): Script lines.
+        source (str): Script name used in error messages.
+
+    Returns:
+        list: (operation, *args) steps.
+
+    Raises:
+        ValueError: If a line is invalid; the message names the
+            source and line number.
+    """
+    steps = []
+    for number, line in enumerate(lines, 1):
+        try:
+            words = shlex.split(line, comments=True)
+            if words:
+                steps.append(parse_command(words))
+        except ValueError as e:
+            raise ValueError("%s:%d: %s" % (source, number, e)) from None
+    return steps
+
+
+def _socket_path(options):
+    from .daemon import DEFAULT_SOCKET_PATH
+
+    return options.socket or DEFAULT_SOCKET_PATH
+
+
+def _session(options):
+    if options.daemon:
+        from .client import MuttClient
+        return MuttClient(_socket_path(options), device=options.serial or options.path)
+
+    from .session import MuttSession
+
+    transport = None
+    if options.simulate:
+        from .simulator import SimulatedBus
+        transport = SimulatedBus(count=1)
+    return MuttSession(serial_number=options.serial, path=options.path,
+                       transport=transport)
+
+
+def _step_dict(step):
+    value = step.value
+    return {
+        'index': step.index,
+        'operation': step.operation,
+        'args': list(step.args),
+        'ok': step.ok,
+        'elapsed': step.elapsed,
+        'result': value.to_dict() if hasattr(value, 'to_dict') else None,
+        'error': str(step.error) if step.error is not None else None,
+    }
+
+
+def _step_text(step):
+    if step.error is not None:
+        return "%s error %s" % (step.operation, step.error)
+    value = step.value
+    if value is None:
+        return "%s %.3f ms" % (step.operation, step.elapsed * 1e3)
+    text = "%s %s" % (step.operation, value.status)
+    if value.value is not None:
+        text += " %s" % (value.value,)
+    if value.message:
+        text += " (%s)" % value.message
+    return text + " %.3f ms" % (value.duration * 1e3)
+
+
+def run_steps(pipeline, options, out):
+    """
+    Run a validated pipeline in one session and report its steps.
+
+    Args:
+        pipeline (Pipeline): Steps to run.
+        options (argparse.Namespace): Parsed global options.
+        out (file): Output stream.
+
+    Returns:
+        int: EXIT_OK if every step succeeded, EXIT_FAILED otherwise.
+
+    Raises:
+        None
+    """
+    with _session(options) as session:
+        found = session.open()
+        result = pipeline.run(session, stop_on_error=not options.keep_going)
+
+    if options.json:
+        json.dump({
+            'ok': result.ok,
+            'device_found': found,
+            'completed': result.completed,
+            'elapsed': result.elapsed,
+            'steps': [_step_dict(step) for step in result],
+        }, out, indent=2)
+        out.write('\n')
+    elif not found:
+        out.write("Device not found\n")
+    else:
+        for step in result:
+            out.write(_step_text(step) + '\n')
+    return EXIT_OK if result.ok else EXIT_FAILED
+
+
+def run_find(options, out):
+    """
+    List attached MUTTs.
+
+    Args:
+        options (argparse.Namespace): Parsed global options.
+        out (file): Output stream.
+
+    Returns:
+        int: EXIT_OK if a MUTT was found, EXIT_FAILED otherwise.
+
+    Raises:
+        usb.core.NoBackendError: If neither sysfs nor a libusb
+            backend is available.
+    """
+    from .findDevice import FindDeviceController
+    from .session import PRODUCT_ID, VENDOR_ID
+
+    controller = FindDeviceController(VENDOR_ID, PRODUCT_ID)
+    if options.simulate:
+        from .simulator import SimulatedBus
+        controller.transport = SimulatedBus(count=1)
+    devices = controller.find_device()
+
+    if options.json:
+        json.dump(devices, out, indent=2)
+        out.write('\n')
+    elif not devices:
+        out.write("No matching devices found.\n")
+    else:
+        for device in devices:
+            out.write("%s %s %s %s fw %s, %s\n" % (
+                device.get('path'), device.get('serial'), device['manufacturer'],
+                device['product'], device['firmware_version'], device['speed']))
+    return EXIT_OK if devices else EXIT_FAILED
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_serve(options):
+    """
+    Serve the attached MUTTs over the daemon socket until interrupted.
+
+    Args:
+        options (argparse.Namespace): Parsed global and serve options.
+
+    Returns:
+        int: EXIT_OK after Ctrl-C.
+
+    Raises:
+        OSError: If the socket cannot be bound.
+    """
+    from .daemon import OVERFLOW_BLOCK, OVERFLOW_REJECT, MuttDaemon
+    from .fleet import MuttFleet
+
+    transport = None
+    if options.simulate:
+        from .simulator import SimulatedBus
+        transport = SimulatedBus(count=options.simulate_count)
+    daemon = MuttDaemon(_socket_path(options), MuttFleet(transport=transport),
+                        queue_limit=options.queue_limit,
+                        overflow=OVERFLOW_REJECT if options.reject else OVERFLOW_BLOCK)
+    daemon.start()
+    # Stop cleanly (and remove the socket) on SIGTERM as on Ctrl-C
+    signal.signal(signal.SIGTERM, _interrupt)
+    sys.stderr.write("mutt: serving %d MUTT(s) on %s\n" % (len(daemon.fleet), daemon.path))
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+    return EXIT_OK
+
+
+def build_parser():
+    """
+    Build the argument parser.
+
+    Args:
+        None
+
+    Returns:
+        argparse.ArgumentParser: Parser with one subcommand per
+        command plus 'find' and 'run'.
+
+    Raises:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        prog='mutt', description='Control MCCI Model 3501 Type-C MUTT devices.')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--serial', help='use the MUTT with this serial number')
+    parser.add_argument('--path', help="use the MUTT on this bus/port path, e.g. '1-4.2'")
+    parser.add_argument('--keep-going', action='store_true',
+                        help='run the remaining commands after a failure')
+    parser.add_argument('--simulate', action='store_true',
+                        help='run against a simulated MUTT instead of USB')
+    parser.add_argument('--daemon', action='store_true',
+                        help="send commands through a running 'mutt serve' daemon")
+    parser.add_argument('--socket', help='daemon socket path')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='log library messages to stderr')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    commands.add_parser('find', help='list attached MUTTs')
+    script = commands.add_parser('run', help="run a script file of commands ('-' for stdin)")
+    script.add_argument('script')
+    serve = commands.add_parser('serve', help='run the device daemon in the foreground')
+    serve.add_argument('--queue-limit', type=int, default=64,
+                       help='maximum queued requests per device')
+    serve.add_argument('--reject', action='store_true',
+                       help="answer 'busy' instead of blocking when a queue is full")
+    serve.add_argument('--simulate-count', type=int, default=1,
+                       help='simulated MUTTs with --simulate')
+    for name, (text, params, _) in COMMANDS.items():
+        if name == 'wait':
+            continue
+        command = commands.add_parser(name, help=text)
+        for param, _, choices in params:
+            # Converted by parse_command so scripts and the command
+            # line share one set of checks and messages
+            command.add_argument(param, choices=choices)
+    return parser
+
+
+def main(argv=None):
+    """
+    'mutt' console entry point.
+
+    Args:
+        argv (list): Arguments; sys.argv[1:] when omitted.
+
+    Returns:
+        int: Process exit status.
+
+    Raises:
+        None
+    """
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    if options.verbose:
+        import logging
+        logging.basicConfig(level=logging.INFO, format='%(name)s: %(message)s')
+
+    if options.command == 'find':
+        try:
+            return run_find(options, sys.stdout)
+        except (ValueError, OSError) as e:
+            # usb.core.NoBackendError is a ValueError
+            parser.exit(EXIT_FAILED, "mutt: error: %s\n" % e)
+    if options.command == 'serve':
+        try:
+            return run_serve(options)
+        except (ValueError, OSError) as e:
+            parser.exit(EXIT_FAILED, "mutt: error: %s\n" % e)
+
+    # Every step is checked before the device is touched
+    try:
+        if options.command == 'run':
+            if options.script == '-':
+                steps = parse_script(sys.stdin, '<stdin>')
+            else:
+                with open(options.script) as f:
+                    steps = parse_script(f, options.script)
+        else:
+            params = COMMANDS[options.command][1]
+            words = [options.command] + [getattr(options, param) for param, _, _ in params]
+            steps = [parse_command(words)]
+        from .pipeline import Pipeline
+        pipeline = Pipeline(steps)
+    except (ValueError, OSError) as e:
+        parser.exit(EXIT_USAGE, "mutt: error: %s\n" % e)
+    try:
+        return run_steps(pipeline, options, sys.stdout)
+    except (ValueError, OSError) as e:
+        # No USB backend, or the device could not be opened
+        parser.exit(EXIT_FAILED, "mutt: error: %s\n" % e)
+
+if __name__ == '__main__':
+    sys.exit(main())
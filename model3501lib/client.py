@@ -0,0 +1,344 @@
+##############################################################################
+#
+# Module: client.py
+#
+# Description:
+#     Client of the device daemon (daemon.py). MuttClient mirrors
+#     the MuttSession commands and the module-level entry functions
+#     and returns CommandResult objects, so test code can switch
+#     from direct USB access to the shared daemon unchanged.
+#
+#     Requests are pipelined: submit() returns a Future at once and
+#     up to max_in_flight requests are outstanding per client.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import itertools
+import json
+import socket
+import threading
+from concurrent.futures import Future
+
+# Lib imports
+# (None)
+
+# Own modules
+from .daemon import DEFAULT_SOCKET_PATH
+from .pd_decode import decode_power_role, decode_rdo
+from .results import CommandResult
+
+DEFAULT_MAX_IN_FLIGHT = 32
+
+# Commands whose raw response is decoded again on the client side
+_DECODERS = {'get_rdo': decode_rdo, 'get_power_role': decode_power_role}
+
+
+class DaemonError(Exception):
+    """
+    Request rejected by the daemon (unknown device, busy, ...).
+    """
+
+
+def _result(command, response):
+    """
+    Rebuild a CommandResult from a daemon response.
+    """
+    data = response['result']
+    raw = bytes.fromhex(data['raw']) if data.get('raw') else None
+    value = data.get('value')
+    decoder = _DECODERS.get(command)
+    if decoder is not None and raw is not None:
+        value = decoder(raw)
+    return CommandResult(data['command'], data['status'], value, raw,
+                         data.get('duration', 0.0), data.get('message'))
+
+
+class MuttClient:
+    """
+    Connection to the device daemon.
+
+    Attributes:
+        path (str): Unix socket path of the daemon.
+        device (str): Default device key (serial, path or label),
+            or None when the daemon serves a single MUTT.
+        timeout (float): Seconds to wait for each answer, or None.
+    """
+    def __init__(self, path=DEFAULT_SOCKET_PATH, device=None,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, timeout=None):
+        """
+        Initialize the client; connects on first use.
+
+        Args:
+            path (str): Unix socket path of the daemon.
+            device (str): Default device key for every command.
+            max_in_flight (int): Maximum outstanding requests; submit()
+                blocks beyond it.
+            timeout (float): Seconds to wait for each answer.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.path = path
+        self.device = device
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        # Separate from _lock: a send blocked by back-pressure must
+        # not keep the reader from completing answers
+        self._send_lock = threading.Lock()
+        self._sock = None
+        self._reader = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def connect(self):
+        """
+        Connect to the daemon if not connected yet.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If no daemon listens on the socket path.
+        """
+        with self._lock:
+            if self._sock is not None:
+                return
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self.path)
+            self._sock = sock
+            self._reader = threading.Thread(target=self._read, args=(sock,),
+                                            daemon=True, name='mutt-client')
+            self._reader.start()
+
+    def open(self):
+        """
+        Connect and check that the default device is served.
+
+        Lets a client stand in for a MuttSession, for example in
+        Pipeline.run().
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the daemon serves the device.
+
+        Raises:
+            None
+        """
+        try:
+            devices = self.devices()
+        except (OSError, DaemonError):
+            return False
+        if self.device is None:
+            return len(devices) == 1
+        return any(self.device in (d['key'], d['serial'], d['path'], d['label'])
+                   for d in devices)
+
+    def close(self):
+        """
+        Disconnect; outstanding requests fail with ConnectionError.
+        """
+        with self._lock:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if self._reader is not None:
+            self._reader.join()
+            self._reader = None
+
+    def _read(self, sock):
+        try:
+            with sock.makefile('rb') as stream:
+                for line in stream:
+                    response = json.loads(line)
+                    with self._lock:
+                        entry = self._pending.pop(response.get('id'), None)
+                    if entry is not None:
+                        self._slots.release()
+                        entry.set_result(response)
+        except (OSError, ValueError):
+            pass
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for entry in pending.values():
+            self._slots.release()
+            entry.set_exception(ConnectionError("Daemon connection closed"))
+
+    def request(self, command, *args, device=None):
+        """
+        Send one request without waiting for the answer.
+
+        Args:
+            command (str): Session command or daemon control command.
+            *args: JSON-serializable command arguments.
+            device (str): Device key; the client default when omitted.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the raw response dict.
+
+        Raises:
+            OSError: If the daemon is not reachable.
+        """
+        self.connect()
+        self._slots.acquire()
+        request_id = next(self._ids)
+        future = Future()
+        message = {'id': request_id, 'command': command, 'args': list(args),
+                   'device': device if device is not None else self.device}
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        with self._lock:
+            self._pending[request_id] = future
+            sock = self._sock
+        try:
+            with self._send_lock:
+                sock.sendall(data)
+        except (OSError, AttributeError):
+            with self._lock:
+                # The reader may already have failed it on disconnect
+                if self._pending.pop(request_id, None) is not None:
+                    self._slots.release()
+            raise ConnectionError("Daemon connection closed") from None
+        return future
+
+    def submit(self, command, *args, device=None):
+        """
+        Pipeline a session command.
+
+        Args:
+            command (str): Session command name, e.g. 'get_rdo'.
+            *args: Command arguments.
+            device (str): Device key; the client default when omitted.
+
+        Returns:
+            concurrent.futures.Future: Resolves to a CommandResult.
+
+        Raises:
+            OSError: If the daemon is not reachable.
+        """
+        if command == 'set_profile':
+            profile = args[0]
+            args = ([[p.voltage_mv, p.current_ma, p.flags] for p in profile.pdos],
+                    profile.name)
+        response = self.request(command, *args, device=device)
+        future = Future()
+
+        def done(answer):
+            try:
+                response = answer.result()
+                if not isinstance(response.get('result'), dict):
+                    # Rejected, busy, or the command raised on the daemon
+                    raise DaemonError(response.get('error'))
+                future.set_result(_result(command, response))
+            except Exception as e:
+                future.set_exception(e)
+
+        response.add_done_callback(done)
+        return future
+
+    def call(self, command, *args, device=None):
+        """
+        Run a session command and wait for its result.
+
+        Args:
+            command (str): Session command name.
+            *args: Command arguments.
+            device (str): Device key; the client default when omitted.
+
+        Returns:
+            CommandResult: Result of the command on the device.
+
+        Raises:
+            DaemonError: If the daemon rejected the request.
+            OSError: If the daemon is not reachable.
+        """
+        return self.submit(command, *args, device=device).result(self.timeout)
+
+    def _control(self, command):
+        response = self.request(command).result(self.timeout)
+        if not response['ok']:
+            raise DaemonError(response['error'])
+        return response['result']
+
+    def devices(self):
+        """
+        List the served devices (key, serial, path, label).
+        """
+        return self._control('devices')
+
+    def discover(self):
+        """
+        Ask the daemon to rescan the bus; returns the served devices.
+        """
+        return self._control('discover')
+
+    def stats(self):
+        """
+        Per-device queue depth, peak depth and request counters.
+        """
+        return self._control('stats')
+
+    def set_speed(self, speed_type, device=None):
+        return self.call('set_speed', speed_type, device=device)
+
+    def set_charge(self, watts, device=None):
+        return self.call('set_charge', watts, device=device)
+
+    def set_profile(self, profile, device=None):
+        return self.call('set_profile', profile, device=device)
+
+    def get_rdo(self, device=None):
+        return self.call('get_rdo', device=device)
+
+    def get_power_role(self, device=None):
+        return self.call('get_power_role', device=device)
+
+    def cdstress_on(self, device=None):
+        return self.call('cdstress_on', device=device)
+
+    def cdstress_off(self, device=None):
+        return self.call('cdstress_off', device=device)
+
+    def pd_captive_cables(self, device=None):
+        return self.call('pd_captive_cables', device=device)
+
+    def pd_charger_port(self, device=None):
+        return self.call('pd_charger_port', device=device)
+
+    def reconnect(self, delay_disconnect_ms, delay_reconnect_ms, device=None):
+        return self.call('reconnect', delay_disconnect_ms, delay_reconnect_ms,
+                         device=device)
+
+    # Names of the module-level entry functions
+    get_rdo_status = get_rdo
+    get_power_role_status = get_power_role
+    onset_cdstress = cdstress_on
+    offset_cdstress = cdstress_off
+    pd_captive_cables_status = pd_captive_cables
+    pd_charger_port_status = pd_charger_port
+    reconnect_status = reconnect
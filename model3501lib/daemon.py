@@ -0,0 +1,488 @@
+##############################################################################
+#
+# Module: daemon.py
+#
+# Description:
+#     Long-lived device daemon. It owns the sessions of every
+#     attached Model 3501 and serves many clients over a Unix
+#     domain socket, so test processes share open handles instead
+#     of each enumerating and opening the MUTTs.
+#
+#     Every device has one worker thread and a bounded queue:
+#     transfers to one MUTT are serialized while devices run in
+#     parallel. Clients may pipeline requests; responses carry the
+#     request id and may complete out of order across devices.
+#     When a device queue is full the connection stops reading
+#     (back-pressure through the socket) or, with overflow='reject',
+#     answers 'busy' at once. Every response to a device command
+#     reports the queue depth of its device; answers to control and
+#     malformed requests carry none. Requests still queued for a
+#     device that a rescan no longer finds are answered with an
+#     error. Responses go out through a writer thread
+#     per connection, so a client that stops reading never holds up
+#     a device worker; one whose backlog of unsent responses
+#     overflows is disconnected.
+#
+#     Protocol: one JSON object per line in each direction.
+#         request:  {"id": 7, "command": "get_rdo", "args": [],
+#                    "device": "MUTT0001"}
+#         response: {"id": 7, "ok": true, "result": {...},
+#                    "error": null, "queue_depth": 0}
+#     Besides the session commands: "devices", "discover", "stats",
+#     answered as {"id": 8, "ok": true, "result": ..., "error": null}.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import json
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+from .events import INFO, WARNING, emit
+from .fleet import COMMANDS, MuttFleet
+from .pd_profile import FixedPdo, PdProfile
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'mutt-%d.sock' % os.getuid())
+
+DEFAULT_QUEUE_LIMIT = 64
+
+# Unsent responses a connection may hold before it is dropped
+OUTBOX_LIMIT = 4096
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_REJECT = 'reject'
+
+# Requests answered by the daemon itself
+CONTROL_COMMANDS = frozenset(('devices', 'discover', 'stats'))
+
+
+def _decode_args(command, args):
+    """
+    Rebuild arguments that do not travel as JSON.
+
+    set_profile takes a list of [voltage_mv, current_ma(, flags)]
+    PDOs and an optional name.
+    """
+    if command == 'set_profile':
+        pdos = [FixedPdo(*pdo) for pdo in args[0]]
+        return (PdProfile(pdos, *args[1:2]),)
+    return tuple(args)
+
+
+class _DeviceWorker:
+    """
+    Worker thread and bounded queue of one device.
+    """
+    def __init__(self, entry, limit):
+        self.entry = entry
+        self.queue = queue.Queue(maxsize=limit)
+        self.retired = False
+        self.busy = False
+        self.processed = 0
+        self.rejected = 0
+        self.peak_depth = 0
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='mutt-daemon-%s' % entry.path)
+        self._thread.start()
+
+    @property
+    def depth(self):
+        """
+        Requests queued or in progress.
+        """
+        return self.queue.qsize() + self.busy
+
+    def submit(self, job, block):
+        """
+        Queue a job; False if the queue is full and block is False.
+
+        A job queued once the worker has retired is answered with an
+        error, by the worker while it runs and here after it ended.
+        """
+        try:
+            self.queue.put(job, block)
+        except queue.Full:
+            self.rejected += 1
+            return False
+        self.peak_depth = max(self.peak_depth, self.depth)
+        if self.retired and not self._thread.is_alive():
+            self._fail_pending()
+        return True
+
+    def stop(self):
+        """
+        Retire the worker: finish the request in progress and answer
+        every queued one, or one a blocked reader queues later, with
+        an error.
+        """
+        self.retired = True
+        # Room for readers blocked on the full queue, and for the stop
+        self._fail_pending()
+        self.queue.put(None)
+        self._thread.join()
+        self._fail_pending()
+
+    def _fail_pending(self):
+        while True:
+            try:
+                job = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            self._fail(job)
+
+    def _fail(self, job):
+        connection, request_id, _, _ = job
+        connection.reply({'id': request_id, 'ok': False, 'result': None,
+                          'error': 'device no longer served', 'queue_depth': 0})
+
+    def _run(self):
+        session = self.entry.session
+        while True:
+            job = self.queue.get()
+            if job is None:
+                break
+            if self.retired:
+                self._fail(job)
+                continue
+            connection, request_id, command, args = job
+            self.busy = True
+            began = time.perf_counter()
+            try:
+                value = getattr(session, command)(*args)
+                error = None
+            except Exception as e:
+                value = None
+                error = e
+            elapsed = time.perf_counter() - began
+            self.busy = False
+            self.processed += 1
+            ok = error is None and bool(value)
+            connection.reply({
+                'id': request_id,
+                'ok': ok,
+                'result': value.to_dict() if hasattr(value, 'to_dict') else value,
+                'error': str(error) if error is not None else None,
+                'elapsed': elapsed,
+                'queue_depth': self.depth,
+            })
+
+
+class _Connection:
+    """
+    One client connection: a reader thread and a writer thread
+    draining a bounded queue of responses.
+    """
+    def __init__(self, daemon, sock):
+        self.daemon = daemon
+        self.sock = sock
+        self._outbox = queue.Queue(maxsize=OUTBOX_LIMIT)
+        self._closed = threading.Event()
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='mutt-daemon-client')
+        self._writer = threading.Thread(target=self._write, daemon=True,
+                                        name='mutt-daemon-client-writer')
+
+    def start(self):
+        self._writer.start()
+        self._thread.start()
+
+    def reply(self, message):
+        """
+        Queue a response; never blocks the calling device worker.
+        """
+        if self._closed.is_set():
+            # Client went away; its remaining answers are dropped
+            return
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        try:
+            self._outbox.put_nowait(data)
+        except queue.Full:
+            emit(WARNING, "Client not reading its responses, disconnecting")
+            self.close()
+
+    def _write(self):
+        while True:
+            data = self._outbox.get()
+            if data is None:
+                break
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                self.close()
+                break
+
+    def close(self):
+        with self._close_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        try:
+            self._outbox.put_nowait(None)
+        except queue.Full:
+            # The writer is stuck in sendall, which the shutdown ends
+            pass
+
+    def _run(self):
+        try:
+            with self.sock.makefile('rb') as stream:
+                for line in stream:
+                    if line.strip():
+                        self._dispatch(line)
+        except OSError:
+            pass
+        finally:
+            self.daemon._forget(self)
+            self.close()
+
+    def _dispatch(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            command = request['command']
+            args = request.get('args', ())
+            if command in CONTROL_COMMANDS:
+                self.reply({'id': request_id, 'ok': True, 'error': None,
+                            'result': self.daemon._control(command)})
+                return
+            if command not in COMMANDS:
+                raise ValueError("Unknown command: %r" % (command,))
+            worker = self.daemon._worker(request.get('device'))
+            job = (self, request_id, command, _decode_args(command, args))
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            self.reply({'id': request_id, 'ok': False, 'result': None,
+                        'error': "%s: %s" % (type(e).__name__, e)})
+            return
+
+        # Blocking here stops reading this socket: the client feels
+        # the full queue as back-pressure
+        if not worker.submit(job, self.daemon.overflow == OVERFLOW_BLOCK):
+            self.reply({'id': request_id, 'ok': False, 'result': None,
+                        'error': 'busy', 'queue_depth': worker.depth})
+
+
+class MuttDaemon:
+    """
+    Serve the attached MUTTs to many clients over a Unix socket.
+
+    Attributes:
+        path (str): Unix socket path.
+        fleet (MuttFleet): Devices and their sessions.
+        queue_limit (int): Maximum queued requests per device.
+        overflow (str): OVERFLOW_BLOCK to stop reading a client whose
+            device queue is full, OVERFLOW_REJECT to answer 'busy'.
+    """
+    def __init__(self, path=DEFAULT_SOCKET_PATH, fleet=None,
+                 queue_limit=DEFAULT_QUEUE_LIMIT, overflow=OVERFLOW_BLOCK):
+        """
+        Initialize the daemon.
+
+        Args:
+            path (str): Unix socket path to listen on.
+            fleet (MuttFleet): Fleet to serve; a new MuttFleet over
+                pyusb when omitted.
+            queue_limit (int): Maximum queued requests per device.
+            overflow (str): OVERFLOW_BLOCK or OVERFLOW_REJECT.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If overflow is unknown.
+        """
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_REJECT):
+            raise ValueError("Unknown overflow policy: %r" % (overflow,))
+        self.path = path
+        self.fleet = fleet if fleet is not None else MuttFleet()
+        self.queue_limit = queue_limit
+        self.overflow = overflow
+        self._workers = {}
+        self._workers_lock = threading.Lock()
+        self._connections = set()
+        self._listener = None
+        self._thread = None
+
+    def discover(self):
+        """
+        Rescan the fleet and start a worker for every new device.
+
+        Args:
+            None
+
+        Returns:
+            list: FleetDevice entries served.
+
+        Raises:
+            usb.core.NoBackendError: If no pyusb backend is available.
+        """
+        with self._workers_lock:
+            devices = self.fleet.discover()
+            current = {entry.path: entry for entry in devices}
+            for path in list(self._workers):
+                worker = self._workers[path]
+                if current.get(path) is not worker.entry:
+                    del self._workers[path]
+                    worker.stop()
+            for path, entry in current.items():
+                if path not in self._workers:
+                    self._workers[path] = _DeviceWorker(entry, self.queue_limit)
+        emit(INFO, "Serving %d MUTT(s)", len(devices))
+        return devices
+
+    def _worker(self, key):
+        # discover() replaces workers under the same lock
+        with self._workers_lock:
+            if key is None:
+                if len(self._workers) != 1:
+                    raise ValueError("device required: %d MUTTs attached"
+                                     % len(self._workers))
+                return next(iter(self._workers.values()))
+            return self._workers[self.fleet.get(key).path]
+
+    def _control(self, command):
+        if command == 'discover':
+            self.discover()
+        if command == 'stats':
+            return self.stats()
+        return [{'key': entry.key, 'serial': entry.serial, 'path': entry.path,
+                 'label': entry.label} for entry in self.fleet.devices]
+
+    def stats(self):
+        """
+        Queue depth and counters of every device.
+
+        Args:
+            None
+
+        Returns:
+            dict: 'clients' count and per-device 'queue_depth',
+            'peak_depth', 'processed' and 'rejected'.
+
+        Raises:
+            None
+        """
+        return {
+            'clients': len(self._connections),
+            'devices': {worker.entry.key: {
+                'queue_depth': worker.depth,
+                'peak_depth': worker.peak_depth,
+                'processed': worker.processed,
+                'rejected': worker.rejected,
+            } for worker in list(self._workers.values())},
+        }
+
+    def _forget(self, connection):
+        self._connections.discard(connection)
+
+    def start(self):
+        """
+        Discover the devices, bind the socket and serve in a thread.
+
+        Args:
+            None
+
+        Returns:
+            MuttDaemon: self.
+
+        Raises:
+            OSError: If the socket cannot be bound (for example
+                another daemon is serving the path).
+        """
+        self.discover()
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                # Left behind by a daemon that did not shut down
+                os.unlink(self.path)
+            else:
+                probe.close()
+                raise OSError("A daemon is already serving %s" % self.path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.path)
+        self._listener.listen()
+        self._thread = threading.Thread(target=self._accept, daemon=True,
+                                        name='mutt-daemon')
+        self._thread.start()
+        emit(INFO, "Listening on %s", self.path)
+        return self
+
+    def serve_forever(self):
+        """
+        Start and block until stop() is called from another thread.
+        """
+        if self._thread is None:
+            self.start()
+        self._thread.join()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                break
+            connection = _Connection(self, sock)
+            self._connections.add(connection)
+            connection.start()
+
+    def stop(self):
+        """
+        Stop serving, disconnect clients and release the devices.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self._listener is not None:
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+            self._listener = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                emit(WARNING, "Could not remove %s", self.path)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for connection in list(self._connections):
+            connection.close()
+        with self._workers_lock:
+            for worker in self._workers.values():
+                worker.stop()
+            self._workers.clear()
+        self.fleet.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
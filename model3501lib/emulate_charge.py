@@ -14,16 +14,30 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Send profiles encoded by pd_profile; add set_profile
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Re-raise stale handle, timeout and transient errors
+#         Import pyusb on first use
+#
 ##############################################################################
 
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .hooks import OUTCOME_NO_DEVICE, OUTCOME_TIMEOUT, classify_error
+from .pd_profile import PROFILE_15W, PROFILE_27W, PROFILE_45W, profile_for_watts
+from .results import FAILED, INVALID, OK, CommandResult, not_found
+from .vendor_commands import CHARGE_PROFILE, payload_array
+
+# Transfer outcomes set_profile raises instead of reporting FAILED
+_RAISED_OUTCOMES = (OUTCOME_NO_DEVICE, OUTCOME_TIMEOUT)
 
 
 class ChargeController:
@@ -71,94 +85,86 @@ class ChargeController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(
             idVendor=self.vendor_id,
             idProduct=self.product_id
         )
         return self.device is not None
 
-    def set_emulate_charge_15w(self, watts):
+    def set_profile(self, profile):
         """
-        Configure DUT to emulate 15W PD charger.
+        Configure DUT to emulate a PD charger with given source PDOs.
 
         Args:
-            watts (int): Requested wattage value.
+            profile (PdProfile): Source capabilities to advertise.
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: value is the profile; status FAILED if
+            the MUTT rejected the transfer.
 
         Raises:
-            usb.core.USBError: If USB transfer fails.
+            usb.core.USBError: If the device has gone away, or the
+                transfer timed out or failed transiently.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-
-        bmRequestType_setup = 0x40
-        bRequest_setup = 0xEE
-        wValue_setup = 0x0001
-
-        data_to_send_setup = [
-            0x01, 0x01, 0x2C, 0x91, 0x01, 0x04
-        ]
+            emit(WARNING, "Device not found")
+            return not_found('set_profile')
 
+        began = time.perf_counter()
+        # usb.core.USBError is an OSError: catching that needs no pyusb
         try:
-            result_setup = self.device.ctrl_transfer(
-                bmRequestType_setup,
-                bRequest_setup,
-                wValue_setup,
-                0x0000,
-                data_to_send_setup
+            result_setup = CHARGE_PROFILE.issue(
+                self.device,
+                payload_array(profile.payload),
+                value=profile.count
             )
+        except OSError as e:
+            from .timeouts import is_transient
+
+            # A stale handle lets the session locate the MUTT again;
+            # timeouts and transient errors go to its timeout policy,
+            # as they do from the other controllers
+            if classify_error(e) in _RAISED_OUTCOMES or is_transient(e):
+                raise
+            emit(WARNING, "USBError (%s): %s", profile, e)
+            return CommandResult('set_profile', FAILED, profile,
+                                 duration=time.perf_counter() - began, message=str(e))
+
+        duration = time.perf_counter() - began
+        emit(INFO, "Setup control transfer result for %s: %d", profile, result_setup)
+        return CommandResult('set_profile', OK, profile, duration=duration)
 
-            print("Setup control transfer result for 15W:", result_setup)
-            return True
-
-        except usb.core.USBError as e:
-            print(f"USBError (15W): {e}")
-            return False
-
-    def set_emulate_charge_27w(self, watts):
+    def set_emulate_charge_15w(self, watts):
         """
-        Configure DUT to emulate 27W PD charger.
+        Configure DUT to emulate 15W PD charger.
 
         Args:
             watts (int): Requested wattage value.
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: Outcome of the command.
 
         Raises:
-            usb.core.USBError: If USB transfer fails.
+            usb.core.USBError: As set_profile.
         """
-        if self.device is None:
-            print("Device not found")
-            return False
+        return self.set_profile(PROFILE_15W)
 
-        bmRequestType_setup = 0x40
-        bRequest_setup = 0xEE
-        wValue_setup = 0x0002
-
-        data_to_send_setup = [
-            0x01, 0x02, 0x2C, 0x91, 0x01, 0x04,
-            0xB1, 0xD0, 0x02, 0x00
-        ]
+    def set_emulate_charge_27w(self, watts):
+        """
+        Configure DUT to emulate 27W PD charger.
 
-        try:
-            result_setup = self.device.ctrl_transfer(
-                bmRequestType_setup,
-                bRequest_setup,
-                wValue_setup,
-                0x0000,
-                data_to_send_setup
-            )
+        Args:
+            watts (int): Requested wattage value.
 
-            print("Setup control transfer result for 27W:", result_setup)
-            return True
+        Returns:
+            CommandResult: Outcome of the command.
 
-        except usb.core.USBError as e:
-            print(f"USBError (27W): {e}")
-            return False
+        Raises:
+            usb.core.USBError: As set_profile.
+        """
+        return self.set_profile(PROFILE_27W)
 
     def set_emulate_charge_45w(self, watts):
         """
@@ -168,40 +174,41 @@ class ChargeController:
             watts (int): Requested wattage value.
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: Outcome of the command.
 
         Raises:
-            usb.core.USBError: If USB transfer fails.
+            usb.core.USBError: As set_profile.
         """
-        if self.device is None:
-            print("Device not found")
-            return False
+        return self.set_profile(PROFILE_45W)
 
-        bmRequestType_setup = 0x40
-        bRequest_setup = 0xEE
-        wValue_setup = 0x0003
+    def set_charge(self, watts):
+        """
+        Emulate the charger profile matching a wattage.
 
-        data_to_send_setup = [
-            0x01, 0x03, 0x2C, 0x91, 0x01, 0x04,
-            0x2C, 0xD1, 0x02, 0x00,
-            0x2C, 0xB1, 0x04, 0x00
-        ]
+        Rounds the requested wattage up to the nearest
+        supported profile (15W / 27W / 45W) and sends the
+        corresponding configuration command.
 
-        try:
-            result_setup = self.device.ctrl_transfer(
-                bmRequestType_setup,
-                bRequest_setup,
-                wValue_setup,
-                0x0000,
-                data_to_send_setup
-            )
+        Args:
+            watts (int): Desired charger wattage.
 
-            print("Setup control transfer result for 45W:", result_setup)
-            return True
+        Returns:
+            CommandResult: Outcome of the command; status INVALID
+            for an unsupported wattage.
 
-        except usb.core.USBError as e:
-            print(f"USBError (45W): {e}")
-            return False
+        Raises:
+            usb.core.USBError: As set_profile.
+        """
+        profile = profile_for_watts(watts)
+
+        if profile is None:
+            emit(WARNING, "Invalid wattage specified: %r", watts)
+            return CommandResult('set_charge', INVALID, watts,
+                                 message="Invalid wattage specified")
+
+        result = self.set_profile(profile)
+        result.command = 'set_charge'
+        return result
 
 
 def set_charge(watts):
@@ -210,35 +217,18 @@ def set_charge(watts):
 
     Selects appropriate charger profile based on
     requested wattage and sends configuration
-    command to DUT device.
+    command to DUT device through the default
+    cached session.
 
     Args:
         watts (int): Desired charger wattage.
 
     Returns:
-        None
+        CommandResult: Outcome of the command.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045E
-    PRODUCT_ID = 0x078F
-
-    controller = ChargeController(VENDOR_ID, PRODUCT_ID)
-
-    if controller.find_device():
-
-        if watts <= 15:
-            controller.set_emulate_charge_15w(watts)
-
-        elif watts <= 27:
-            controller.set_emulate_charge_27w(watts)
-
-        elif watts <= 45:
-            controller.set_emulate_charge_45w(watts)
-
-        else:
-            print("Invalid wattage specified")
+    from .session import default_session
 
-    else:
-        print("Device not found")
+    return default_session().set_charge(watts)
@@ -0,0 +1,146 @@
+##############################################################################
+#
+# Module: events.py
+#
+# Description:
+#     Human-readable messages of the library. Messages are kept
+#     unformatted in a bounded in-memory event log and forwarded to
+#     the standard logging module (logger 'model3501lib'); nothing
+#     is formatted unless the log is read or the logger is enabled.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import logging
+import time
+from collections import deque
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+DEFAULT_CAPACITY = 1024
+
+logger = logging.getLogger('model3501lib')
+# A library leaves output to the application: no lastResort stderr
+logger.addHandler(logging.NullHandler())
+
+
+class Event:
+    """
+    One logged message, formatted on demand.
+
+    Attributes:
+        time (float): time.time() when the event was logged.
+        level (int): logging level.
+        template (str): %-style message template.
+        args (tuple): Template arguments.
+    """
+    __slots__ = ('time', 'level', 'template', 'args')
+
+    def __init__(self, time, level, template, args):
+        self.time = time
+        self.level = level
+        self.template = template
+        self.args = args
+
+    @property
+    def message(self):
+        return self.template % self.args if self.args else self.template
+
+    def __repr__(self):
+        return "Event(%s, %r)" % (logging.getLevelName(self.level), self.message)
+
+
+class EventLog:
+    """
+    Bounded in-memory log of recent events.
+
+    Appending stores the template and arguments only; the oldest
+    events are dropped once the capacity is reached.
+
+    Attributes:
+        level (int): Minimum level kept.
+        enabled (bool): Whether events are kept at all.
+    """
+    def __init__(self, capacity=DEFAULT_CAPACITY, level=INFO):
+        self._events = deque(maxlen=capacity)
+        self.level = level
+        self.enabled = True
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(list(self._events))
+
+    @property
+    def capacity(self):
+        return self._events.maxlen
+
+    def resize(self, capacity):
+        """
+        Change the capacity, keeping the newest events.
+        """
+        self._events = deque(self._events, maxlen=capacity)
+
+    def append(self, level, template, args):
+        if self.enabled and level >= self.level:
+            self._events.append(Event(time.time(), level, template, args))
+
+    def messages(self, count=None):
+        """
+        Format the most recent events.
+
+        Args:
+            count (int): Maximum number of events; all when omitted.
+
+        Returns:
+            list: Message strings, oldest first.
+
+        Raises:
+            None
+        """
+        events = list(self._events)
+        if count is not None:
+            events = events[-count:]
+        return [event.message for event in events]
+
+    def clear(self):
+        self._events.clear()
+
+
+event_log = EventLog()
+
+
+def emit(level, template, *args):
+    """
+    Record a message in the event log and the 'model3501lib' logger.
+
+    Args:
+        level (int): logging level.
+        template (str): %-style template, formatted only when read.
+        *args: Template arguments.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    event_log.append(level, template, args)
+    if logger.isEnabledFor(level):
+        logger.log(level, template, *args)
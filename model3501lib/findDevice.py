@@ -15,17 +15,68 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         sysfs discovery, speed read without vendor request
+#         Discovery through a replaceable transport
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 
 # Built-in imports
-# (None)
+import os
+import time
 
 # Lib imports
-import usb.core
-import usb.util
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import NOT_FOUND, OK, CommandResult
+
+SYSFS_USB_DEVICES = '/sys/bus/usb/devices'
+
+# sysfs 'speed' attribute (Mbit/s) -> speed name
+_SYSFS_SPEEDS = {
+    '1.5': "Low speed",
+    '12': "Full speed",
+    '480': "High speed",
+    '5000': "Super speed",
+    '10000': "Super speed plus",
+    '20000': "Super speed plus",
+}
+
+# pyusb Device.speed (usb.util.SPEED_*) -> speed name
+_LIBUSB_SPEEDS = {
+    1: "Low speed",
+    2: "Full speed",
+    3: "High speed",
+    4: "Super speed",
+    5: "Super speed plus",
+}
+
+def device_path(device):
+    """
+    Build the bus/port path of a USB device.
+
+    Uses the Linux sysfs notation ``<bus>-<port>.<port>...``. When
+    the backend does not report port numbers, falls back to
+    ``<bus>:<address>``.
+
+    Args:
+        device (usb.core.Device): USB device instance.
+
+    Returns:
+        str: Bus/port path.
+
+    Raises:
+        None
+    """
+    ports = getattr(device, 'port_numbers', None)
+    if ports:
+        return "%d-%s" % (device.bus, '.'.join(str(p) for p in ports))
+    return "%s:%s" % (device.bus, device.address)
+
 
 class FindDeviceController:
     """
@@ -39,6 +90,8 @@ class FindDeviceController:
         vendor_id (int): Target USB Vendor ID.
         product_id (int): Target USB Product ID.
         device (usb.core.Device): USB device instance.
+        transport (object): Device source replacing pyusb (see
+            MuttSession), or None.
     """
     def __init__(self, vendor_id, product_id):
         """
@@ -57,14 +110,93 @@ class FindDeviceController:
         self.vendor_id = vendor_id
         self.product_id = product_id
         self.device = None
+        self.transport = None
     
     def find_device(self):
         """
         Scan and list matching USB devices.
 
-        This function searches all connected USB devices,
-        filters by VID/PID, retrieves descriptor details,
-        and determines USB speed.
+        On Linux the device list is read straight from sysfs, which
+        needs no libusb handle and sends nothing to the devices.
+        Elsewhere, or when a transport is set, the list is built
+        through libusb (or the transport).
+
+        Args:
+            None
+
+        Returns:
+            list: List of dictionaries containing device details.
+
+        Raises:
+            usb.core.USBError: If descriptor retrieval fails.
+        """
+        if self.transport is None and os.path.isdir(SYSFS_USB_DEVICES):
+            return self.find_device_sysfs()
+        return self.find_device_libusb()
+
+    def find_device_sysfs(self, root=SYSFS_USB_DEVICES):
+        """
+        List matching USB devices from the Linux sysfs tree.
+
+        Reads idVendor, idProduct, serial, speed, manufacturer,
+        product and bcdDevice of every device directory. No device
+        is opened, so discovery has no side effect on the MUTT.
+
+        Args:
+            root (str): sysfs USB devices directory.
+
+        Returns:
+            list: List of dictionaries containing device details.
+
+        Raises:
+            None
+        """
+        devices_info = []
+        vendor_id = "%04x" % self.vendor_id
+        product_id = "%04x" % self.product_id
+
+        try:
+            entries = sorted(os.scandir(root), key=lambda e: e.name)
+        except OSError:
+            return devices_info
+
+        for entry in entries:
+            # Skip interface directories such as 1-4:1.0
+            if ':' in entry.name:
+                continue
+            path = entry.path
+            if _read_sysfs_attr(path, 'idVendor') != vendor_id:
+                continue
+            if _read_sysfs_attr(path, 'idProduct') != product_id:
+                continue
+
+            bcd_device = _read_sysfs_attr(path, 'bcdDevice')
+            busnum = _read_sysfs_attr(path, 'busnum')
+            devnum = _read_sysfs_attr(path, 'devnum')
+            speed = _read_sysfs_attr(path, 'speed')
+
+            device_info = {
+                'vendor_id': hex(self.vendor_id),
+                'product_id': hex(self.product_id),
+                'manufacturer': _read_sysfs_attr(path, 'manufacturer'),
+                'product': _read_sysfs_attr(path, 'product'),
+                'firmware_version': int(bcd_device, 16) if bcd_device else None,
+                'speed': _SYSFS_SPEEDS.get(speed, "Unknown speed"),
+                'serial': _read_sysfs_attr(path, 'serial'),
+                'bus': int(busnum) if busnum else None,
+                'address': int(devnum) if devnum else None,
+                'path': entry.name
+            }
+            devices_info.append(device_info)
+
+        return devices_info
+
+    def find_device_libusb(self):
+        """
+        List matching USB devices through libusb.
+
+        Speed comes from the libusb device record; no vendor
+        request is sent to the device.
 
         Args:
             None
@@ -77,76 +209,102 @@ class FindDeviceController:
         """
         devices_info = []
 
-        # Find all USB devices connected to the system
-        devices = usb.core.find(find_all=True)
-        
-        # Iterate through each device and check if it matches the target VID and PID
+        # Find all matching USB devices connected to the system
+        if self.transport is None:
+            import usb.core
+
+            find = usb.core.find
+        else:
+            find = self.transport.find
+        devices = find(find_all=True, idVendor=self.vendor_id,
+                       idProduct=self.product_id)
+
         for device in devices:
-            # Check if the device has both VID and PID attributes
-            if device.idVendor is not None and device.idProduct is not None:
-                # Check if the device matches the target VID and PID
-                if device.idVendor == self.vendor_id and device.idProduct == self.product_id:
-                    # Perform control transfer to retrieve device descriptor
-                    try:
-                        bmRequestType = 0x40  # Direction: IN
-                        bRequest = 0x14        # GET_DESCRIPTOR request
-                        wValue = 0x0000
-                        wIndex = 0x0000
-                        wLength = 0x0000
-                        
-                        result = device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
-                        if result == 0:
-                            speed = "High speed"
-                        else:
-                            speed = "Super speed"
-                        
-                        # Retrieve device information
-                        manufacturer = usb.util.get_string(device, device.iManufacturer)
-                        product = usb.util.get_string(device, device.iProduct)
-                        firmware_version = device.bcdDevice
-
-                        # Create a dictionary with device information including USB speed
-                        device_info = {
-                            'vendor_id': hex(self.vendor_id),
-                            'product_id': hex(self.product_id),
-                            'manufacturer': manufacturer,
-                            'product': product,
-                            'firmware_version': firmware_version,
-                            'speed': speed
-                        }
-                        devices_info.append(device_info)
-                    except usb.core.USBError as e:
-                        print(f"Failed to retrieve device descriptor: {e}")
-        
+            # usb.core.USBError is an OSError: catching that needs no pyusb
+            try:
+                # Retrieve device information (string descriptors are
+                # read once and cached by the device object)
+                manufacturer = device.manufacturer
+                product = device.product
+                serial = device.serial_number
+                firmware_version = device.bcdDevice
+
+                # Create a dictionary with device information including USB speed
+                device_info = {
+                    'vendor_id': hex(self.vendor_id),
+                    'product_id': hex(self.product_id),
+                    'manufacturer': manufacturer,
+                    'product': product,
+                    'firmware_version': firmware_version,
+                    'speed': _LIBUSB_SPEEDS.get(device.speed, "Unknown speed"),
+                    'serial': serial,
+                    'bus': device.bus,
+                    'address': device.address,
+                    'path': device_path(device)
+                }
+                devices_info.append(device_info)
+            except OSError as e:
+                emit(WARNING, "Failed to retrieve device descriptor: %s", e)
+
         return devices_info
 
+
+def _read_sysfs_attr(path, name):
+    """
+    Read one sysfs attribute file.
+
+    Args:
+        path (str): sysfs device directory.
+        name (str): Attribute name.
+
+    Returns:
+        str: Stripped attribute value, or None if unreadable.
+
+    Raises:
+        None
+    """
+    try:
+        with open(os.path.join(path, name)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
 def find_device_status():
     """
     Entry function to list MUTT device status.
 
-    Detects all matching devices and prints their
+    Detects all matching devices and logs their
     descriptor and speed information.
 
     Args:
         None
 
     Returns:
-        None
+        CommandResult: value is the list of device detail
+        dictionaries; status NOT_FOUND if there is none.
 
     Raises:
         None
     """
+    from .session import default_session
+
     VENDOR_ID = 0x045e
     PRODUCT_ID = 0x078f
     controller = FindDeviceController(VENDOR_ID, PRODUCT_ID)
+    # Follow the transport of the default session (pyusb unless replaced)
+    controller.transport = default_session().transport
+    began = time.perf_counter()
     devices = controller.find_device()
+    duration = time.perf_counter() - began
 
-    # Print the device information directly
-    if devices:
-        for device in devices:
-            print(f"Vendor ID: {device['vendor_id']}, Product ID: {device['product_id']}, Manufacturer: {device['manufacturer']}, Product: {device['product']}, Firmware Version: {device['firmware_version']}, Speed: {device['speed']}")
-    else:
-        print("No matching devices found.")
+    if not devices:
+        emit(INFO, "No matching devices found.")
+        return CommandResult('find_device', NOT_FOUND, devices, duration=duration,
+                             message="No matching devices found")
 
-# Example usage
-find_device_status()
+    for device in devices:
+        emit(INFO, "Vendor ID: %s, Product ID: %s, Manufacturer: %s, Product: %s, "
+             "Firmware Version: %s, Speed: %s", device['vendor_id'], device['product_id'],
+             device['manufacturer'], device['product'], device['firmware_version'],
+             device['speed'])
+    return CommandResult('find_device', OK, devices, duration=duration)
@@ -0,0 +1,499 @@
+##############################################################################
+#
+# Module: fleet.py
+#
+# Description:
+#     Index every attached Type-C MUTT by serial number, bus/port
+#     path and user label, and fan out commands to a selected subset
+#     of devices on a thread pool with per-device results and timings.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Lib imports
+# (None)
+
+# Own modules
+from .findDevice import FindDeviceController, SYSFS_USB_DEVICES, device_path
+from .results import CommandResult
+from .session import MuttSession, PRODUCT_ID, VENDOR_ID, _resolve_backend
+
+# Default for MuttFleet(sysfs_root=...): use sysfs when it is available
+SYSFS_AUTO = object()
+
+# Session methods that may be fanned out across the fleet
+COMMANDS = frozenset((
+    'set_speed',
+    'set_charge',
+    'set_profile',
+    'get_rdo',
+    'get_power_role',
+    'cdstress_on',
+    'cdstress_off',
+    'pd_captive_cables',
+    'pd_charger_port',
+    'reconnect',
+))
+
+
+class FleetDevice:
+    """
+    One MUTT of the fleet.
+
+    Attributes:
+        serial (str): USB serial number, or None if unreadable.
+        path (str): Bus/port path.
+        label (str): User label, or None.
+        session (MuttSession): Session bound to this device.
+    """
+    def __init__(self, serial, path, session, label=None):
+        self.serial = serial
+        self.path = path
+        self.session = session
+        self.label = label
+
+    @property
+    def key(self):
+        """
+        Preferred identity of the device: label, serial or path.
+        """
+        return self.label or self.serial or self.path
+
+    def __repr__(self):
+        return "FleetDevice(serial=%r, path=%r, label=%r)" % (
+            self.serial, self.path, self.label)
+
+
+class FleetResult:
+    """
+    Outcome of one command on one device.
+
+    Attributes:
+        device (FleetDevice): Device the command ran on.
+        value (object): Command return value.
+        error (Exception): Exception raised, or None.
+        elapsed (float): Command duration in seconds.
+    """
+    __slots__ = ('device', 'value', 'error', 'elapsed')
+
+    def __init__(self, device, value, error, elapsed):
+        self.device = device
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """
+        True if the command raised no error and did not report failure.
+        """
+        if isinstance(self.value, CommandResult):
+            return self.error is None and self.value.ok
+        return self.error is None and self.value is not False
+
+    def __repr__(self):
+        return "FleetResult(%s, value=%r, error=%r, elapsed=%.6f)" % (
+            self.device.key, self.value, self.error, self.elapsed)
+
+
+class MuttFleet:
+    """
+    Registry of all attached MUTT devices.
+
+    Devices are looked up in O(1) by serial number, bus/port path
+    or user label. Commands run in parallel on a thread pool, one
+    persistent session per device. On Linux, discovery reads sysfs
+    and each device handle is opened only by its first command.
+
+    Attributes:
+        vendor_id (int): USB Vendor ID of DUT devices.
+        product_id (int): USB Product ID of DUT devices.
+        backend (usb.backend.IBackend): pyusb backend shared by sessions.
+        transport (object): Device source replacing pyusb, or None.
+        timeout_policy (TimeoutPolicy): Policy shared by the device
+            sessions, or None.
+        shadow (bool): Device sessions skip redundant writes.
+        cache_ttl (float or dict): Read cache TTL of the device
+            sessions, or None.
+        max_workers (int): Thread pool size, or None for one per device.
+        sysfs_root (str): sysfs USB devices directory used for
+            discovery, or None to enumerate through libusb.
+        devices (list): FleetDevice entries in discovery order.
+    """
+    def __init__(self, vendor_id=VENDOR_ID, product_id=PRODUCT_ID,
+                 backend=None, labels=None, max_workers=None,
+                 sysfs_root=SYSFS_AUTO, transport=None, timeout_policy=None,
+                 shadow=False, cache_ttl=None):
+        """
+        Initialize the fleet registry.
+
+        Args:
+            vendor_id (int): USB Vendor ID.
+            product_id (int): USB Product ID.
+            backend (usb.backend.IBackend): Optional pyusb backend.
+            labels (dict): Optional mapping of serial number or path
+                to user label, applied on discovery.
+            max_workers (int): Optional thread pool size.
+            sysfs_root (str): sysfs directory to discover from. By
+                default sysfs is used on Linux unless an explicit
+                backend or transport is given; None forces libusb
+                enumeration.
+            transport (object): Optional device source used instead
+                of pyusb (see MuttSession), such as a SimulatedBus.
+            timeout_policy (TimeoutPolicy): Optional timeouts, deadline
+                and retries of every device session; its stats cover
+                the whole fleet.
+            shadow (bool): Give every device session a DeviceShadow
+                that skips writes of settings already active.
+            cache_ttl (float or dict): Give every device session a
+                ReadCache for get_rdo / get_power_role answers.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.backend = backend
+        self.transport = transport
+        self.timeout_policy = timeout_policy
+        self.shadow = shadow
+        self.cache_ttl = cache_ttl
+        self.max_workers = max_workers
+        if sysfs_root is SYSFS_AUTO:
+            sysfs_root = (SYSFS_USB_DEVICES if backend is None and transport is None
+                          and os.path.isdir(SYSFS_USB_DEVICES) else None)
+        self.sysfs_root = sysfs_root
+        self.devices = []
+        self._labels = dict(labels or {})
+        self._by_serial = {}
+        self._by_path = {}
+        self._by_label = {}
+        self._executor = None
+        self._executor_size = 0
+        self._transfer_hooks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __iter__(self):
+        return iter(self.devices)
+
+    def discover(self):
+        """
+        Enumerate all matching MUTT devices and rebuild the indexes.
+
+        Sessions of devices that are still attached are kept, so
+        their open handles survive a rescan.
+
+        Args:
+            None
+
+        Returns:
+            list: FleetDevice entries.
+
+        Raises:
+            usb.core.NoBackendError: If no pyusb backend is available.
+        """
+        if self.sysfs_root is not None:
+            found = self._scan_sysfs()
+        else:
+            found = self._scan_libusb()
+
+        previous = self._by_path
+        devices = []
+        for serial, path, device in found:
+            entry = previous.get(path)
+            if entry is None or entry.serial != serial:
+                session = MuttSession(self.vendor_id, self.product_id,
+                                      backend=self.backend, device=device,
+                                      serial_number=serial, path=path,
+                                      transport=self.transport,
+                                      timeout_policy=self.timeout_policy,
+                                      shadow=self.shadow,
+                                      cache_ttl=self.cache_ttl)
+                for hook in self._transfer_hooks:
+                    session.add_transfer_hook(hook)
+                entry = FleetDevice(serial, path, session)
+            entry.label = self._labels.get(serial, self._labels.get(path))
+            devices.append(entry)
+
+        kept = set(map(id, devices))
+        for entry in previous.values():
+            if id(entry) not in kept:
+                entry.session.close()
+
+        self.devices = devices
+        self._reindex()
+        return devices
+
+    def _scan_sysfs(self):
+        """
+        List (serial, path, None) of matching devices from sysfs.
+
+        No handle is opened; sessions locate their device by path
+        when the first command is issued.
+        """
+        controller = FindDeviceController(self.vendor_id, self.product_id)
+        return [(info['serial'], info['path'], None)
+                for info in controller.find_device_sysfs(self.sysfs_root)]
+
+    def _scan_libusb(self):
+        """
+        List (serial, path, device) of matching devices through libusb
+        (or the transport, when one is set).
+        """
+        if self.transport is not None:
+            devices = self.transport.find(find_all=True, idVendor=self.vendor_id,
+                                          idProduct=self.product_id)
+        else:
+            import usb.core
+
+            if self.backend is None:
+                self.backend = _resolve_backend()
+            devices = usb.core.find(find_all=True, idVendor=self.vendor_id,
+                                    idProduct=self.product_id,
+                                    backend=self.backend)
+
+        found = []
+        for device in devices:
+            # usb.core.USBError is an OSError: catching that needs no pyusb
+            try:
+                serial = device.serial_number
+            except (OSError, ValueError):
+                serial = None
+            found.append((serial, device_path(device), device))
+        return found
+
+    def _reindex(self):
+        self._by_serial = {d.serial: d for d in self.devices if d.serial is not None}
+        self._by_path = {d.path: d for d in self.devices}
+        self._by_label = {d.label: d for d in self.devices if d.label is not None}
+
+    def set_label(self, key, label):
+        """
+        Attach a user label to a device.
+
+        Args:
+            key (str): Serial number, path or current label.
+            label (str): New label, or None to remove it.
+
+        Returns:
+            FleetDevice: Labelled device.
+
+        Raises:
+            KeyError: If no device matches the key.
+        """
+        entry = self.get(key)
+        if entry.label is not None:
+            self._by_label.pop(entry.label, None)
+        entry.label = label
+        self._labels[entry.serial or entry.path] = label
+        if label is not None:
+            self._by_label[label] = entry
+        return entry
+
+    def get(self, key):
+        """
+        Look up a device by serial number, bus/port path or label.
+
+        Args:
+            key (str): Serial number, path or label.
+
+        Returns:
+            FleetDevice: Matching device.
+
+        Raises:
+            KeyError: If no device matches the key.
+        """
+        entry = (self._by_serial.get(key) or self._by_path.get(key)
+                 or self._by_label.get(key))
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __contains__(self, key):
+        return (key in self._by_serial or key in self._by_path
+                or key in self._by_label)
+
+    def select(self, keys=None):
+        """
+        Resolve a subset of devices.
+
+        Args:
+            keys (iterable): Serial numbers, paths or labels; None
+                selects every device.
+
+        Returns:
+            list: FleetDevice entries.
+
+        Raises:
+            KeyError: If a key matches no device.
+        """
+        if keys is None:
+            return list(self.devices)
+        if isinstance(keys, str):
+            keys = (keys,)
+        return [self.get(key) for key in keys]
+
+    def run(self, command, *args, devices=None):
+        """
+        Run a session command on several devices in parallel.
+
+        Args:
+            command (str): Session method name, one of COMMANDS.
+            *args: Arguments passed to the command.
+            devices (iterable): Device keys; None for all devices.
+
+        Returns:
+            list: FleetResult per device, in selection order.
+
+        Raises:
+            ValueError: If the command is unknown.
+            KeyError: If a device key matches no device.
+        """
+        if command not in COMMANDS:
+            raise ValueError("Unknown fleet command: %r" % (command,))
+        selected = self.select(devices)
+        if not selected:
+            return []
+
+        executor = self._get_executor()
+        futures = [executor.submit(_run_one, entry, command, args)
+                   for entry in selected]
+        return [future.result() for future in futures]
+
+    def add_transfer_hook(self, hook):
+        """
+        Register a transfer hook on every device session.
+
+        Sessions of devices found by later rescans get the hook too.
+
+        Args:
+            hook (callable): Hook to add (see
+                MuttSession.add_transfer_hook).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._transfer_hooks.append(hook)
+        for entry in self.devices:
+            entry.session.add_transfer_hook(hook)
+
+    def remove_transfer_hook(self, hook):
+        """
+        Unregister a transfer hook from every device session.
+
+        Args:
+            hook (callable): Hook to remove.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._transfer_hooks.remove(hook)
+        for entry in self.devices:
+            entry.session.remove_transfer_hook(hook)
+
+    def _get_executor(self):
+        workers = self.max_workers or max(1, len(self.devices))
+        if self._executor is not None and self._executor_size < workers:
+            # More devices than threads since a rescan: commands already
+            # queued on the old pool still run there
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='mutt-fleet')
+            self._executor_size = workers
+        return self._executor
+
+    def set_speed(self, speed_type, devices=None):
+        return self.run('set_speed', speed_type, devices=devices)
+
+    def set_charge(self, watts, devices=None):
+        return self.run('set_charge', watts, devices=devices)
+
+    def set_profile(self, profile, devices=None):
+        return self.run('set_profile', profile, devices=devices)
+
+    def get_rdo(self, devices=None):
+        return self.run('get_rdo', devices=devices)
+
+    def get_power_role(self, devices=None):
+        return self.run('get_power_role', devices=devices)
+
+    def cdstress_on(self, devices=None):
+        return self.run('cdstress_on', devices=devices)
+
+    def cdstress_off(self, devices=None):
+        return self.run('cdstress_off', devices=devices)
+
+    def pd_captive_cables(self, devices=None):
+        return self.run('pd_captive_cables', devices=devices)
+
+    def pd_charger_port(self, devices=None):
+        return self.run('pd_charger_port', devices=devices)
+
+    def reconnect(self, delay_disconnect_ms, delay_reconnect_ms, devices=None):
+        return self.run('reconnect', delay_disconnect_ms, delay_reconnect_ms,
+                        devices=devices)
+
+    def close(self):
+        """
+        Shut down the thread pool and release every device handle.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for entry in self.devices:
+            entry.session.close()
+
+
+def _run_one(entry, command, args):
+    """
+    Run one command on one device, capturing result and timing.
+    """
+    start = time.perf_counter()
+    try:
+        value = getattr(entry.session, command)(*args)
+        error = None
+    except Exception as e:
+        value = None
+        error = e
+    return FleetResult(entry, value, error, time.perf_counter() - start)
@@ -13,15 +13,29 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Raw read into a caller buffer, decoded power role result
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Hold the device lock across the mailbox exchange
+#         Import pyusb on first use
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import time
+from array import array
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .locks import device_lock
+from .pd_decode import decode_power_role
+from .results import NO_RESPONSE, OK, CommandResult, not_found
+from .vendor_commands import MAILBOX_LENGTH, MAILBOX_POWER_ROLE, MAILBOX_READ
+
+POWER_ROLE_LENGTH = MAILBOX_LENGTH
 
 
 class getpowerRoleController:
@@ -36,6 +50,7 @@ class getpowerRoleController:
         vendor_id (int): USB Vendor ID of DUT device.
         product_id (int): USB Product ID of DUT device.
         device (usb.core.Device): Detected USB device instance.
+        response (array.array): Preallocated mailbox receive buffer.
     """
     def __init__(self, vendor_id, product_id):
         """
@@ -54,6 +69,8 @@ class getpowerRoleController:
         self.vendor_id = vendor_id
         self.product_id = product_id
         self.device = None
+        # Receive buffer reused by every get_power_role() call
+        self.response = MAILBOX_READ.new_buffer()
     
     def find_device(self):
         """
@@ -68,82 +85,91 @@ class getpowerRoleController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
     
+    def read_power_role(self, buffer=None):
+        """
+        Read the raw power role mailbox response without printing.
+
+        When a buffer is given, the response is read into it in
+        place so repeated reads allocate nothing for the response.
+
+        Args:
+            buffer (array.array): Optional 16-byte 'B' array to read into.
+
+        Returns:
+            array.array: 16 response bytes, or None if the query
+            was not accepted.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        # E4 mailbox request selecting the power role query (opcode 0x28)
+        if buffer is None:
+            buffer = array('B', bytes(POWER_ROLE_LENGTH))
+        # The read returns the answer to the last query from any
+        # thread: no other query may come in between
+        with device_lock(self.device):
+            if MAILBOX_POWER_ROLE.issue(self.device) != POWER_ROLE_LENGTH:
+                return None
+            if MAILBOX_READ.issue(self.device, buffer) != POWER_ROLE_LENGTH:
+                return None
+        return buffer
+
     def get_power_role(self):
         """
         Read current DUT power role.
 
         Performs control transfer write/read sequence
-        and compares returned data to identify whether
-        DUT is operating in Source or Sink mode.
+        and decodes the returned role byte to identify
+        whether DUT is operating in Source or Sink mode.
 
         Args:
             None
 
         Returns:
-            None
+            CommandResult: value is the decoded PowerRoleResult and
+            raw the response bytes; status NO_RESPONSE if the query
+            was not accepted.
 
         Raises:
             usb.core.USBError: If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        else:
-            print("Device found")
-        
-        bmRequestType = 0x40
-        bRequest = 0xE4
-        wValue = 0x0000
-        wIndex = 0x0000
-        wLength = 0x0010
-        data1 = [0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-        result1 = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, data1)
-        
-        if result1 != 16:
-            print("Device is None:")
-            return
-
-        bmRequestType = 0xC0
-        bRequest = 0xE4
-        wValue = 0x0000
-        wIndex = 0x0000
-        wLength = 0x0010
-        result2 = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
-        hex_strings = ['0x{:02X}'.format(byte) for byte in result2]
-        formatted_hex_string = ' '.join(hex_strings)
-
-        sink_data = "0x00 0x28 0x02 0x01 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00"
-        source_data = "0x00 0x28 0x02 0x02 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00"
-
-        if formatted_hex_string == sink_data:
-            print("Read the current power role: SINK")
-        elif formatted_hex_string == source_data:
-            print("Read the current power role: SOURCE")
-        else:
-            print("Invalid:")
+            emit(WARNING, "Device not found")
+            return not_found('get_power_role')
+
+        began = time.perf_counter()
+        response = self.read_power_role(self.response)
+        duration = time.perf_counter() - began
+        if response is None:
+            emit(WARNING, "Power role query not accepted")
+            return CommandResult('get_power_role', NO_RESPONSE, duration=duration,
+                                 message="Query not accepted")
+
+        result = decode_power_role(response)
+        emit(INFO, "Read the current power role: %s", result)
+        return CommandResult('get_power_role', OK, result, result.raw, duration)
 
 def get_power_role_status():
     """
     Entry function to read DUT power role.
 
-    Initializes controller and triggers
-    power role detection workflow.
+    Triggers power role detection workflow
+    through the default cached session.
 
     Args:
         None
 
     Returns:
-        None
+        CommandResult: Decoded power role and raw response.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045e
-    PRODUCT_ID = 0x078f
+    from .session import default_session
 
-    controller = getpowerRoleController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.get_power_role()
+    return default_session().get_power_role()
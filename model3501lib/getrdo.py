@@ -14,15 +14,30 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Raw RDO read into a caller buffer, decoded RDO result
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Hold the device lock across the mailbox exchange
+#         Import pyusb on first use
+#         Report an RDO answer with a bad status or length as FAILED
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import time
+from array import array
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .locks import device_lock
+from .pd_decode import decode_rdo
+from .results import FAILED, NO_RESPONSE, OK, CommandResult, not_found
+from .vendor_commands import MAILBOX_LENGTH, MAILBOX_RDO, MAILBOX_READ
+
+RDO_LENGTH = MAILBOX_LENGTH
 
 class getrdoController:
     """
@@ -36,6 +51,7 @@ class getrdoController:
         vendor_id (int): USB Vendor ID of DUT device.
         product_id (int): USB Product ID of DUT device.
         device (usb.core.Device): Detected USB device instance.
+        response (array.array): Preallocated mailbox receive buffer.
     """
     def __init__(self, vendor_id, product_id):
         """
@@ -54,6 +70,8 @@ class getrdoController:
         self.vendor_id = vendor_id
         self.product_id = product_id
         self.device = None
+        # Receive buffer reused by every get_rdo() call
+        self.response = MAILBOX_READ.new_buffer()
     
     def find_device(self):
         """
@@ -68,9 +86,41 @@ class getrdoController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
     
+    def read_rdo(self, buffer=None):
+        """
+        Read the raw RDO mailbox response without printing.
+
+        Performs the same write/read exchange as get_rdo(). When a
+        buffer is given, the response is read into it in place so
+        repeated reads allocate nothing for the response.
+
+        Args:
+            buffer (array.array): Optional 16-byte 'B' array to read into.
+
+        Returns:
+            array.array: 16 response bytes, or None if no power
+            contract is in place.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        # E4 mailbox request selecting the RDO query (opcode 0x2A)
+        if buffer is None:
+            buffer = array('B', bytes(RDO_LENGTH))
+        # The read returns the answer to the last query from any
+        # thread: no other query may come in between
+        with device_lock(self.device):
+            if MAILBOX_RDO.issue(self.device) != RDO_LENGTH:
+                return None
+            if MAILBOX_READ.issue(self.device, buffer) != RDO_LENGTH:
+                return None
+        return buffer
+
     def get_rdo(self):
         """
         Read the current RDO
@@ -83,58 +133,50 @@ class getrdoController:
             None
 
         Returns:
-            None
+            CommandResult: value is the decoded RdoResult and raw the
+            response bytes; status NO_RESPONSE if no power contract
+            is in place, FAILED if the MUTT rejected the query.
 
         Raises:
             usb.core.USBError: If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        else:
-            print("Device found")
-        
-        bmRequestType = 0x40
-        bRequest = 0xE4
-        wValue = 0x0000
-        wIndex = 0x0000
-        wLength = 0x0010
-        data1 = [0x00, 0x2A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-        result1 = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, data1)
-        print("result-1:", result1)
-        
-        if result1 == 16:
-            bmRequestType = 0xC0
-            bRequest = 0xE4
-            wValue = 0x0000
-            wIndex = 0x0000
-            wLength = 0x0010
-            result2 = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
-            hex_strings = ['0x{:02X}'.format(byte) for byte in result2]
-            formatted_hex_string = ' '.join(hex_strings)
-            print("Read the RDO for the current power contract:", formatted_hex_string)
-        else:
-            print("No RDO: no power contract in place between the system and the Type-C MUTT")
+            emit(WARNING, "Device not found")
+            return not_found('get_rdo')
+
+        began = time.perf_counter()
+        response = self.read_rdo(self.response)
+        duration = time.perf_counter() - began
+        if response is None:
+            emit(INFO, "No RDO: no power contract in place between the system and the Type-C MUTT")
+            return CommandResult('get_rdo', NO_RESPONSE, duration=duration,
+                                 message="No power contract")
+
+        try:
+            result = decode_rdo(response)
+        except ValueError as e:
+            emit(WARNING, "%s", e)
+            return CommandResult('get_rdo', FAILED, raw=bytes(response), duration=duration,
+                                 message=str(e))
+        emit(INFO, "Read the RDO for the current power contract: %s", result)
+        return CommandResult('get_rdo', OK, result, result.raw, duration)
 
 def get_rdo_status():
     """
     Entry function to read RDO status.
 
-    Initializes controller and retrieves
-    active power contract RDO data.
+    Retrieves active power contract RDO data
+    through the default cached session.
 
     Args:
         None
 
     Returns:
-        None
+        CommandResult: Decoded RDO and raw response.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045e
-    PRODUCT_ID = 0x078f
+    from .session import default_session
 
-    controller = getrdoController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.get_rdo()
+    return default_session().get_rdo()
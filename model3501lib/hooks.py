@@ -0,0 +1,176 @@
+##############################################################################
+#
+# Module: hooks.py
+#
+# Description:
+#     Per-transfer hook layer. HookedDevice wraps a device handle,
+#     times every control transfer and hands a TransferEvent with
+#     bRequest, device identity, duration, byte count and outcome
+#     to the registered hooks (for example TransferMetrics).
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+OUTCOME_OK = 'ok'
+OUTCOME_STALL = 'stall'
+OUTCOME_TIMEOUT = 'timeout'
+OUTCOME_NO_DEVICE = 'no_device'
+OUTCOME_ERROR = 'error'
+
+# libusb error codes / errno values -> outcome label
+_BACKEND_OUTCOMES = {-4: OUTCOME_NO_DEVICE, -7: OUTCOME_TIMEOUT, -9: OUTCOME_STALL}
+_ERRNO_OUTCOMES = {
+    errno.ENODEV: OUTCOME_NO_DEVICE,
+    errno.ETIMEDOUT: OUTCOME_TIMEOUT,
+    errno.EPIPE: OUTCOME_STALL,
+}
+
+
+def classify_error(error):
+    """
+    Map a transfer exception to an outcome label.
+
+    Args:
+        error (Exception): Exception raised by ctrl_transfer.
+
+    Returns:
+        str: OUTCOME_NO_DEVICE, OUTCOME_TIMEOUT, OUTCOME_STALL or
+        OUTCOME_ERROR.
+
+    Raises:
+        None
+    """
+    outcome = _BACKEND_OUTCOMES.get(getattr(error, 'backend_error_code', None))
+    if outcome is None:
+        outcome = _ERRNO_OUTCOMES.get(getattr(error, 'errno', None), OUTCOME_ERROR)
+    return outcome
+
+
+class TransferEvent:
+    """
+    One completed (or failed) control transfer.
+
+    Attributes:
+        device (str): Device identity (serial number or bus/port path).
+        request_type (int): bmRequestType.
+        request (int): bRequest.
+        value (int): wValue.
+        index (int): wIndex.
+        nbytes (int): Bytes transferred (0 on failure).
+        duration (float): Transfer time in seconds.
+        outcome (str): OUTCOME_* label.
+        error (Exception): Exception raised, or None.
+        data: data_or_wLength as passed: OUT payload, IN length or
+            IN buffer.
+        response (array.array): IN data read (the first nbytes are
+            valid), or None for OUT and failed transfers.
+
+    data and response reference the caller's buffers without a copy;
+    they are valid only while the hook runs.
+    """
+    __slots__ = ('device', 'request_type', 'request', 'value', 'index',
+                 'nbytes', 'duration', 'outcome', 'error', 'data', 'response')
+
+    def __init__(self, device, request_type, request, value, index, nbytes,
+                 duration, outcome, error, data=None, response=None):
+        self.device = device
+        self.request_type = request_type
+        self.request = request
+        self.value = value
+        self.index = index
+        self.nbytes = nbytes
+        self.duration = duration
+        self.outcome = outcome
+        self.error = error
+        self.data = data
+        self.response = response
+
+    def __repr__(self):
+        return "TransferEvent(%s, 0x%02X, %d bytes, %.6fs, %s)" % (
+            self.device, self.request, self.nbytes, self.duration, self.outcome)
+
+
+class HookedDevice:
+    """
+    Device handle proxy calling hooks around every control transfer.
+
+    Everything except ctrl_transfer is forwarded to the wrapped
+    device, including attribute assignment (default_timeout).
+
+    Attributes:
+        device (usb.core.Device): Wrapped device handle.
+        identity (str): Device identity reported in events.
+        hooks (list): Hook callables, shared with the owner so
+            hooks added later apply immediately.
+    """
+    __slots__ = ('device', 'identity', 'hooks')
+
+    def __init__(self, device, identity, hooks):
+        object.__setattr__(self, 'device', device)
+        object.__setattr__(self, 'identity', identity)
+        object.__setattr__(self, 'hooks', hooks)
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.device, name, value)
+
+    def __repr__(self):
+        return "HookedDevice(%r)" % (self.device,)
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        """
+        Forward a control transfer and report it to every hook.
+
+        Args:
+            Same as usb.core.Device.ctrl_transfer.
+
+        Returns:
+            int or array.array: Result of the wrapped transfer.
+
+        Raises:
+            usb.core.USBError: Re-raised after the hooks ran.
+        """
+        began = time.perf_counter()
+        try:
+            result = self.device.ctrl_transfer(bmRequestType, bRequest, wValue,
+                                               wIndex, data_or_wLength, timeout)
+        except Exception as e:
+            event = TransferEvent(self.identity, bmRequestType, bRequest, wValue, wIndex,
+                                  0, time.perf_counter() - began, classify_error(e), e,
+                                  data_or_wLength)
+            for hook in self.hooks:
+                hook(event)
+            raise
+        duration = time.perf_counter() - began
+        # OUT and in-place IN transfers return a count, IN with a
+        # length returns the array read
+        if isinstance(result, int):
+            nbytes = result
+            response = data_or_wLength if bmRequestType & 0x80 else None
+        else:
+            nbytes = len(result)
+            response = result
+        event = TransferEvent(self.identity, bmRequestType, bRequest, wValue, wIndex,
+                              nbytes, duration, OUTCOME_OK, None, data_or_wLength, response)
+        for hook in self.hooks:
+            hook(event)
+        return result
+
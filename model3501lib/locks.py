@@ -0,0 +1,61 @@
+##############################################################################
+#
+# Module: locks.py
+#
+# Description:
+#     Per-device locks. The E4 mailbox of the MUTT is a write that
+#     selects a query followed by a read of its answer; two threads
+#     interleaving on one MUTT would read each other's answers. Every
+#     multi-transfer operation runs under the lock of its device, so
+#     it is atomic, while different devices never wait on each other.
+#
+#     Locks are keyed by the bus/port path, so every handle, session
+#     and controller on the same MUTT shares one lock, also across
+#     re-enumeration.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+
+# Lib imports
+# (None)
+
+# Own modules
+from .findDevice import device_path
+
+_locks = {}
+_registry_lock = threading.Lock()
+
+
+def device_lock(device):
+    """
+    Lock serializing the multi-transfer operations of one MUTT.
+
+    Args:
+        device (usb.core.Device): Device handle, possibly wrapped
+            (HookedDevice, TimedDevice).
+
+    Returns:
+        threading.RLock: Lock shared by every handle of the device.
+        Re-entrant, so an operation may call another one.
+
+    Raises:
+        None
+    """
+    try:
+        key = device_path(device)
+    except (AttributeError, TypeError):
+        # No bus information: lock this handle only
+        key = id(device)
+    lock = _locks.get(key)
+    if lock is None:
+        with _registry_lock:
+            lock = _locks.setdefault(key, threading.RLock())
+    return lock
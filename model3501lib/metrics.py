@@ -0,0 +1,360 @@
+##############################################################################
+#
+# Module: metrics.py
+#
+# Description:
+#     Transfer counters and latency histograms per device and
+#     bRequest, fed by the per-transfer hooks, and an OpenMetrics
+#     text exporter serving them on a localhost HTTP endpoint or
+#     writing them to a file (node_exporter textfile collector).
+#
+#     Every thread updates its own shard under the shard's lock,
+#     which only the exporter contends for when it copies the
+#     shards to merge and render them.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import bisect
+import http.server
+import os
+import threading
+
+# Lib imports
+# (None)
+
+# Own modules
+from .hooks import OUTCOME_OK
+
+# Latency histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+DEFAULT_PORT = 9351
+
+
+class _Series:
+    """
+    Counters of one (device, bRequest, outcome) in one shard.
+    """
+    __slots__ = ('count', 'nbytes', 'seconds', 'buckets')
+
+    def __init__(self, nbuckets):
+        self.count = 0
+        self.nbytes = 0
+        self.seconds = 0.0
+        # One slot per bound plus the overflow slot
+        self.buckets = [0] * (nbuckets + 1)
+
+
+class _Shard:
+    """
+    Series of one recording thread and the lock guarding them.
+    """
+    __slots__ = ('lock', 'series')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+
+
+class TransferMetrics:
+    """
+    Sharded transfer counters and latency histograms.
+
+    Use ``record`` as a transfer hook, or ``attach`` it to a
+    session or fleet; attached to a fleet it also counts the
+    devices found by later rescans.
+
+    Attributes:
+        buckets (tuple): Histogram bucket upper bounds in seconds.
+        prefix (str): Metric family name prefix.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='mutt'):
+        """
+        Initialize transfer metrics.
+
+        Args:
+            buckets (tuple): Ascending bucket bounds in seconds.
+            prefix (str): Metric family name prefix.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._local = threading.local()
+        # Appending to a list is atomic; the exporter only reads it
+        self._shards = []
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            self._shards.append(shard)
+        return shard
+
+    def record(self, event):
+        """
+        Count one transfer (hooks.TransferEvent).
+
+        Args:
+            event (TransferEvent): Transfer to count.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        shard = self._shard()
+        key = (event.device, event.request, event.outcome)
+        bucket = bisect.bisect_left(self.buckets, event.duration)
+        with shard.lock:
+            series = shard.series.get(key)
+            if series is None:
+                series = shard.series[key] = _Series(len(self.buckets))
+            series.count += 1
+            series.nbytes += event.nbytes
+            series.seconds += event.duration
+            series.buckets[bucket] += 1
+
+    __call__ = record
+
+    def attach(self, target):
+        """
+        Register the metrics as transfer hook of a session or fleet.
+
+        Args:
+            target (MuttSession or MuttFleet): Where to collect from.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        target.add_transfer_hook(self.record)
+
+    def detach(self, target):
+        """
+        Stop collecting from a session or fleet.
+
+        Args:
+            target (MuttSession or MuttFleet): Where to stop collecting.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the metrics are not attached to it.
+        """
+        target.remove_transfer_hook(self.record)
+
+    def snapshot(self):
+        """
+        Merge every shard.
+
+        Args:
+            None
+
+        Returns:
+            dict: (device, request, outcome) -> dict with count,
+            bytes, seconds and per-bucket (non-cumulative) counts.
+
+        Raises:
+            None
+        """
+        merged = {}
+        for shard in list(self._shards):
+            # Copy under the lock: a histogram read while its thread
+            # records could count more in its buckets than in total
+            with shard.lock:
+                copies = [(key, series.count, series.nbytes, series.seconds,
+                           list(series.buckets))
+                          for key, series in shard.series.items()]
+            for key, count, nbytes, seconds, buckets in copies:
+                total = merged.get(key)
+                if total is None:
+                    total = merged[key] = {'count': 0, 'bytes': 0, 'seconds': 0.0,
+                                           'buckets': [0] * (len(self.buckets) + 1)}
+                total['count'] += count
+                total['bytes'] += nbytes
+                total['seconds'] += seconds
+                for i, n in enumerate(buckets):
+                    total['buckets'][i] += n
+        return merged
+
+    def render(self):
+        """
+        Render the metrics in OpenMetrics text format.
+
+        Families: <prefix>_transfers (counter, by device, request
+        and outcome), <prefix>_transfer_bytes (counter) and
+        <prefix>_transfer_duration_seconds (histogram of successful
+        transfers, by device and request).
+
+        Args:
+            None
+
+        Returns:
+            str: Exposition text ending with '# EOF'.
+
+        Raises:
+            None
+        """
+        merged = self.snapshot()
+        keys = sorted(merged, key=lambda k: (str(k[0]), k[1], k[2]))
+        prefix = self.prefix
+        lines = [
+            '# TYPE %s_transfers counter' % prefix,
+            '# HELP %s_transfers Control transfers by device, bRequest and outcome.' % prefix,
+        ]
+        for key in keys:
+            lines.append('%s_transfers_total{%s} %d' % (prefix, _labels(*key), merged[key]['count']))
+
+        lines += [
+            '# TYPE %s_transfer_bytes counter' % prefix,
+            '# HELP %s_transfer_bytes Bytes moved by control transfers.' % prefix,
+            '# UNIT %s_transfer_bytes bytes' % prefix,
+        ]
+        for key in keys:
+            lines.append('%s_transfer_bytes_total{%s} %d' % (prefix, _labels(*key), merged[key]['bytes']))
+
+        family = '%s_transfer_duration_seconds' % prefix
+        lines += [
+            '# TYPE %s histogram' % family,
+            '# HELP %s Duration of successful control transfers.' % family,
+            '# UNIT %s seconds' % family,
+        ]
+        for key in keys:
+            device, request, outcome = key
+            if outcome != OUTCOME_OK:
+                continue
+            total = merged[key]
+            labels = _labels(device, request)
+            cumulative = 0
+            for bound, n in zip(self.buckets, total['buckets']):
+                cumulative += n
+                lines.append('%s_bucket{%s,le="%s"} %d' % (family, labels, _float(bound), cumulative))
+            lines.append('%s_bucket{%s,le="+Inf"} %d' % (family, labels, total['count']))
+            lines.append('%s_sum{%s} %s' % (family, labels, _float(total['seconds'])))
+            lines.append('%s_count{%s} %d' % (family, labels, total['count']))
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Write the metrics to a file atomically.
+
+        Args:
+            path (str): Destination, e.g. in the node_exporter
+                textfile collector directory.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(device, request, outcome=None):
+    text = 'device="%s",request="0x%02X"' % (_escape(device), request)
+    if outcome is not None:
+        text += ',outcome="%s"' % outcome
+    return text
+
+
+def _float(value):
+    return repr(float(value))
+
+
+class MetricsServer:
+    """
+    Serve TransferMetrics over HTTP for Prometheus to scrape.
+
+    Attributes:
+        metrics (TransferMetrics): Metrics to serve.
+        address (tuple): (host, port) actually bound.
+    """
+    def __init__(self, metrics, host='127.0.0.1', port=DEFAULT_PORT):
+        """
+        Initialize metrics server.
+
+        Args:
+            metrics (TransferMetrics): Metrics to serve.
+            host (str): Address to bind; localhost by default.
+            port (int): TCP port; 0 picks a free port.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the address cannot be bound.
+        """
+        self.metrics = metrics
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split('?')[0] not in ('/', '/metrics'):
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                handler.send_response(200)
+                handler.send_header('Content-Type', CONTENT_TYPE)
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.address = self._server.server_address[:2]
+        self._thread = None
+
+    def start(self):
+        """
+        Serve in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='mutt-metrics', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and release the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
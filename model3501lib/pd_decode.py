@@ -0,0 +1,285 @@
+##############################################################################
+#
+# Module: pd_decode.py
+#
+# Description:
+#     Decode the 16-byte E4 mailbox responses of the RDO (0x2A) and
+#     power role (0x28) queries into typed result objects, straight
+#     from the response buffer with precompiled struct layouts, and
+#     decode whole capture buffers into NumPy structured arrays.
+#
+#     Response layout, as returned by the MUTT:
+#         byte 0      status
+#         byte 1      opcode echoed back (0x28 / 0x2A)
+#         byte 2      payload length
+#         byte 3..    payload (power role byte / 32-bit RDO, LE)
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import enum
+import struct
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+RESPONSE_LENGTH = 16
+
+OPCODE_POWER_ROLE = 0x28
+OPCODE_RDO = 0x2A
+
+# Status byte of an accepted query
+STATUS_OK = 0x00
+
+# Payload length byte of each answer
+RDO_PAYLOAD_LENGTH = 4
+POWER_ROLE_PAYLOAD_LENGTH = 2
+
+# status, opcode, length, RDO (little endian), padding
+_RDO_LAYOUT = struct.Struct('<BBBI9x')
+# status, opcode, length, role, padding
+_POWER_ROLE_LAYOUT = struct.Struct('<BBBB12x')
+
+# '0xNN' text of every byte value, for hex dumps without per-byte formatting
+_HEX_BYTES = tuple('0x%02X' % value for value in range(256))
+
+
+def hex_dump(raw):
+    """
+    Format response bytes as '0x00 0x2A ...'.
+
+    Args:
+        raw (bytes-like): Response bytes.
+
+    Returns:
+        str: Space separated hex bytes.
+
+    Raises:
+        None
+    """
+    return ' '.join(map(_HEX_BYTES.__getitem__, raw))
+
+
+class PowerRole(enum.IntEnum):
+    """
+    DUT power role reported by the 0x28 mailbox query.
+    """
+    UNKNOWN = 0
+    SINK = 1
+    SOURCE = 2
+
+
+class RdoResult:
+    """
+    Decoded RDO of the current power contract.
+
+    Fields follow the USB PD Request Data Object for fixed and
+    variable supplies.
+
+    Attributes:
+        raw (bytes): 16 response bytes.
+        rdo (int): 32-bit Request Data Object.
+        object_position (int): Requested PDO position (1-based).
+        give_back (bool): GiveBack flag.
+        capability_mismatch (bool): Capability Mismatch flag.
+        usb_comm_capable (bool): USB Communications Capable flag.
+        no_usb_suspend (bool): No USB Suspend flag.
+        unchunked_extended (bool): Unchunked Extended Messages Supported.
+        operating_current_ma (int): Operating current in mA.
+        max_current_ma (int): Maximum (or minimum, with GiveBack)
+            operating current in mA.
+    """
+    __slots__ = ('raw', 'rdo', 'object_position', 'give_back',
+                 'capability_mismatch', 'usb_comm_capable', 'no_usb_suspend',
+                 'unchunked_extended', 'operating_current_ma', 'max_current_ma')
+
+    def __init__(self, raw, rdo):
+        self.raw = raw
+        self.rdo = rdo
+        self.object_position = (rdo >> 28) & 0x0F
+        self.give_back = bool(rdo & (1 << 27))
+        self.capability_mismatch = bool(rdo & (1 << 26))
+        self.usb_comm_capable = bool(rdo & (1 << 25))
+        self.no_usb_suspend = bool(rdo & (1 << 24))
+        self.unchunked_extended = bool(rdo & (1 << 23))
+        self.operating_current_ma = ((rdo >> 10) & 0x3FF) * 10
+        self.max_current_ma = (rdo & 0x3FF) * 10
+
+    def __repr__(self):
+        return ("RdoResult(rdo=0x%08X, object_position=%d, operating_current_ma=%d, "
+                "max_current_ma=%d)" % (self.rdo, self.object_position,
+                                        self.operating_current_ma, self.max_current_ma))
+
+    def __str__(self):
+        return hex_dump(self.raw)
+
+
+class PowerRoleResult:
+    """
+    Decoded DUT power role.
+
+    Attributes:
+        raw (bytes): 16 response bytes.
+        role (PowerRole): Decoded power role.
+    """
+    __slots__ = ('raw', 'role')
+
+    def __init__(self, raw, role):
+        self.raw = raw
+        self.role = role
+
+    def __repr__(self):
+        return "PowerRoleResult(role=%s)" % (self.role.name,)
+
+    def __str__(self):
+        return self.role.name
+
+
+def decode_rdo(buffer):
+    """
+    Decode an RDO mailbox response.
+
+    Args:
+        buffer (bytes-like): 16 response bytes.
+
+    Returns:
+        RdoResult: Decoded RDO.
+
+    Raises:
+        ValueError: If the status is not OK, or the response is not an
+            RDO answer with a 4-byte payload.
+        struct.error: If the buffer is not 16 bytes long.
+    """
+    status, opcode, length, rdo = _RDO_LAYOUT.unpack_from(buffer)
+    if status != STATUS_OK or opcode != OPCODE_RDO or length != RDO_PAYLOAD_LENGTH:
+        raise ValueError("Not an RDO answer: %s" % hex_dump(buffer[:3]))
+    return RdoResult(bytes(buffer), rdo)
+
+
+def decode_power_role(buffer):
+    """
+    Decode a power role mailbox response.
+
+    Args:
+        buffer (bytes-like): 16 response bytes.
+
+    Returns:
+        PowerRoleResult: Decoded power role; UNKNOWN if the status is
+        not OK or the response is not a power role answer.
+
+    Raises:
+        struct.error: If the buffer is not 16 bytes long.
+    """
+    status, opcode, length, role = _POWER_ROLE_LAYOUT.unpack_from(buffer)
+    if (status != STATUS_OK or opcode != OPCODE_POWER_ROLE
+            or length != POWER_ROLE_PAYLOAD_LENGTH
+            or role not in (PowerRole.SINK, PowerRole.SOURCE)):
+        role = PowerRole.UNKNOWN
+    return PowerRoleResult(bytes(buffer), PowerRole(role))
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Bulk decoding needs NumPy: pip install numpy") from None
+    return numpy
+
+
+def _responses(numpy, buffer, dtype, count):
+    """
+    View a capture buffer as an array of raw responses.
+    """
+    if count is None:
+        count = len(memoryview(buffer).cast('B')) // RESPONSE_LENGTH
+    return numpy.frombuffer(buffer, dtype=dtype, count=count)
+
+
+def decode_rdo_array(buffer, count=None):
+    """
+    Decode N captured RDO responses into a NumPy structured array.
+
+    The capture buffer holds back-to-back 16-byte responses, for
+    example RdoSampler.data.
+
+    Args:
+        buffer (bytes-like): N * 16 response bytes.
+        count (int): Number of responses; all whole responses
+            in the buffer when omitted.
+
+    Returns:
+        numpy.ndarray: Structured array with fields status, opcode,
+        valid (status OK and a 4-byte RDO answer, as decode_rdo
+        checks), rdo, object_position, give_back, capability_mismatch,
+        usb_comm_capable, no_usb_suspend, unchunked_extended,
+        operating_current_ma and max_current_ma.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    np = _numpy()
+    raw = _responses(np, buffer, np.dtype([
+        ('status', 'u1'), ('opcode', 'u1'), ('length', 'u1'),
+        ('rdo', '<u4'), ('pad', 'V9')]), count)
+    rdo = raw['rdo'].astype(np.uint32)
+
+    out = np.empty(len(raw), dtype=[
+        ('status', 'u1'), ('opcode', 'u1'), ('valid', '?'), ('rdo', 'u4'),
+        ('object_position', 'u1'), ('give_back', '?'),
+        ('capability_mismatch', '?'), ('usb_comm_capable', '?'),
+        ('no_usb_suspend', '?'), ('unchunked_extended', '?'),
+        ('operating_current_ma', 'u2'), ('max_current_ma', 'u2')])
+    out['status'] = raw['status']
+    out['opcode'] = raw['opcode']
+    out['valid'] = ((raw['status'] == STATUS_OK) & (raw['opcode'] == OPCODE_RDO)
+                    & (raw['length'] == RDO_PAYLOAD_LENGTH))
+    out['rdo'] = rdo
+    out['object_position'] = (rdo >> 28) & 0x0F
+    out['give_back'] = (rdo >> 27) & 1
+    out['capability_mismatch'] = (rdo >> 26) & 1
+    out['usb_comm_capable'] = (rdo >> 25) & 1
+    out['no_usb_suspend'] = (rdo >> 24) & 1
+    out['unchunked_extended'] = (rdo >> 23) & 1
+    out['operating_current_ma'] = ((rdo >> 10) & 0x3FF) * 10
+    out['max_current_ma'] = (rdo & 0x3FF) * 10
+    return out
+
+
+def decode_power_role_array(buffer, count=None):
+    """
+    Decode N captured power role responses into a NumPy structured array.
+
+    Args:
+        buffer (bytes-like): N * 16 response bytes.
+        count (int): Number of responses; all whole responses
+            in the buffer when omitted.
+
+    Returns:
+        numpy.ndarray: Structured array with fields status, opcode
+        and role (PowerRole values).
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    np = _numpy()
+    raw = _responses(np, buffer, np.dtype([
+        ('status', 'u1'), ('opcode', 'u1'), ('length', 'u1'),
+        ('role', 'u1'), ('pad', 'V12')]), count)
+
+    out = np.empty(len(raw), dtype=[('status', 'u1'), ('opcode', 'u1'), ('role', 'u1')])
+    out['status'] = raw['status']
+    out['opcode'] = raw['opcode']
+    valid = ((raw['status'] == STATUS_OK) & (raw['opcode'] == OPCODE_POWER_ROLE)
+             & (raw['length'] == POWER_ROLE_PAYLOAD_LENGTH)
+             & ((raw['role'] == PowerRole.SINK) | (raw['role'] == PowerRole.SOURCE)))
+    out['role'] = np.where(valid, raw['role'], PowerRole.UNKNOWN)
+    return out
@@ -0,0 +1,262 @@
+##############################################################################
+#
+# Module: pd_profile.py
+#
+# Description:
+#     Encode USB PD source capabilities (lists of fixed supply PDOs)
+#     into the 0xEE charger emulation payload. Encoded payloads are
+#     cached as immutable bytes per profile, so switching between
+#     profiles during a sweep costs no re-encoding.
+#
+#     Payload layout, as sent with bRequest 0xEE:
+#         wValue      number of PDOs
+#         byte 0      0x01
+#         byte 1      number of PDOs
+#         byte 2..    PDOs, 32 bits each, little endian
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import struct
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+PAYLOAD_HEADER = 0x01
+
+# A source advertises at most 7 PDOs
+MAX_PDOS = 7
+
+# Fixed supply PDO flags (only meaningful on the vSafe5V PDO)
+DUAL_ROLE_POWER = 1 << 29
+USB_SUSPEND_SUPPORTED = 1 << 28
+UNCONSTRAINED_POWER = 1 << 27
+USB_COMMUNICATIONS_CAPABLE = 1 << 26
+DUAL_ROLE_DATA = 1 << 25
+UNCHUNKED_EXTENDED = 1 << 24
+
+_FLAG_MASK = (DUAL_ROLE_POWER | USB_SUSPEND_SUPPORTED | UNCONSTRAINED_POWER
+              | USB_COMMUNICATIONS_CAPABLE | DUAL_ROLE_DATA | UNCHUNKED_EXTENDED)
+
+# Encoded payload of every profile seen so far
+_payload_cache = {}
+
+
+class FixedPdo:
+    """
+    Fixed supply Power Data Object.
+
+    Instances are immutable and hashable, so they can key caches.
+
+    Attributes:
+        voltage_mv (int): Voltage in mV (multiple of 50).
+        current_ma (int): Maximum current in mA (multiple of 10).
+        flags (int): Fixed supply flag bits (DUAL_ROLE_POWER, ...).
+    """
+    __slots__ = ('voltage_mv', 'current_ma', 'flags')
+
+    def __init__(self, voltage_mv, current_ma, flags=0):
+        """
+        Initialize fixed supply PDO.
+
+        Args:
+            voltage_mv (int): Voltage in mV, 50 mV steps.
+            current_ma (int): Maximum current in mA, 10 mA steps.
+            flags (int): Fixed supply flag bits.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a value does not fit the PDO fields.
+        """
+        if voltage_mv % 50 or not 0 < voltage_mv // 50 <= 0x3FF:
+            raise ValueError("Voltage must be a multiple of 50 mV up to 51150 mV: %r"
+                             % (voltage_mv,))
+        if current_ma % 10 or not 0 <= current_ma // 10 <= 0x3FF:
+            raise ValueError("Current must be a multiple of 10 mA up to 10230 mA: %r"
+                             % (current_ma,))
+        if flags & ~_FLAG_MASK:
+            raise ValueError("Unknown fixed supply flags: 0x%08X" % (flags,))
+        object.__setattr__(self, 'voltage_mv', int(voltage_mv))
+        object.__setattr__(self, 'current_ma', int(current_ma))
+        object.__setattr__(self, 'flags', int(flags))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FixedPdo is immutable")
+
+    def __reduce__(self):
+        # Pickled by value: __setattr__ is blocked
+        return (FixedPdo, self._key())
+
+    def _key(self):
+        return (self.voltage_mv, self.current_ma, self.flags)
+
+    def __eq__(self, other):
+        if not isinstance(other, FixedPdo):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "FixedPdo(%d mV, %d mA, flags=0x%08X)" % self._key()
+
+    @property
+    def watts(self):
+        return self.voltage_mv * self.current_ma / 1e6
+
+    def encode(self):
+        """
+        Encode the PDO as a 32-bit value.
+
+        Args:
+            None
+
+        Returns:
+            int: Fixed supply PDO.
+
+        Raises:
+            None
+        """
+        return self.flags | (self.voltage_mv // 50) << 10 | self.current_ma // 10
+
+    @classmethod
+    def decode(cls, value):
+        """
+        Build a PDO from its 32-bit encoding (inverse of encode()).
+
+        Args:
+            value (int): Fixed supply PDO.
+
+        Returns:
+            FixedPdo: Decoded PDO.
+
+        Raises:
+            ValueError: If the value holds no valid fixed supply PDO.
+        """
+        return cls(((value >> 10) & 0x3FF) * 50, (value & 0x3FF) * 10, value & _FLAG_MASK)
+
+
+class PdProfile:
+    """
+    Source capabilities to emulate: an ordered list of fixed PDOs.
+
+    Attributes:
+        pdos (tuple): FixedPdo entries; the first one is vSafe5V.
+        name (str): Optional label used in messages.
+    """
+    __slots__ = ('pdos', 'name')
+
+    def __init__(self, pdos, name=None):
+        """
+        Initialize PD profile.
+
+        Args:
+            pdos (iterable): FixedPdo entries, vSafe5V first.
+            name (str): Optional label.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no PDOs, more than MAX_PDOS,
+                or the first PDO is not 5V.
+        """
+        pdos = tuple(pdos)
+        if not 0 < len(pdos) <= MAX_PDOS:
+            raise ValueError("A profile needs 1 to %d PDOs" % (MAX_PDOS,))
+        if pdos[0].voltage_mv != 5000:
+            raise ValueError("The first PDO must be vSafe5V")
+        self.pdos = pdos
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, PdProfile):
+            return NotImplemented
+        return self.pdos == other.pdos
+
+    def __hash__(self):
+        return hash(self.pdos)
+
+    def __repr__(self):
+        return "PdProfile(%s%r)" % ('%s: ' % self.name if self.name else '', list(self.pdos))
+
+    def __str__(self):
+        return self.name or '%gW' % self.max_watts
+
+    @property
+    def max_watts(self):
+        return max(pdo.watts for pdo in self.pdos)
+
+    @property
+    def count(self):
+        return len(self.pdos)
+
+    @property
+    def payload(self):
+        return encode_profile(self.pdos)
+
+
+def encode_profile(pdos):
+    """
+    Encode PDOs into the 0xEE payload, caching the result.
+
+    Args:
+        pdos (tuple): FixedPdo entries.
+
+    Returns:
+        bytes: Payload to send with bRequest 0xEE.
+
+    Raises:
+        ValueError: If there are more than MAX_PDOS PDOs.
+    """
+    payload = _payload_cache.get(pdos)
+    if payload is None:
+        if len(pdos) > MAX_PDOS:
+            raise ValueError("A profile holds at most %d PDOs" % (MAX_PDOS,))
+        payload = struct.pack('<BB%dI' % len(pdos), PAYLOAD_HEADER, len(pdos),
+                              *[pdo.encode() for pdo in pdos])
+        _payload_cache[pdos] = payload
+    return payload
+
+
+_VSAFE5V = FixedPdo(5000, 3000, USB_COMMUNICATIONS_CAPABLE)
+
+# Profiles of the original set_emulate_charge_15w/27w/45w commands
+PROFILE_15W = PdProfile([_VSAFE5V], '15W')
+PROFILE_27W = PdProfile([_VSAFE5V, FixedPdo(9000, 1770)], '27W')
+PROFILE_45W = PdProfile([_VSAFE5V, FixedPdo(9000, 3000), FixedPdo(15000, 3000)], '45W')
+
+# Wattage tier -> profile, in ascending order, used by set_charge
+TIERS = ((15, PROFILE_15W), (27, PROFILE_27W), (45, PROFILE_45W))
+
+
+def profile_for_watts(watts):
+    """
+    Round a wattage up to the nearest tier profile.
+
+    Args:
+        watts (int): Desired charger wattage.
+
+    Returns:
+        PdProfile: Matching profile, or None above the largest tier.
+
+    Raises:
+        None
+    """
+    for limit, profile in TIERS:
+        if watts <= limit:
+            return profile
+    return None
+
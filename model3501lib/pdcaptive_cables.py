@@ -14,16 +14,23 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import FAILED, OK, CommandResult, not_found
+from .vendor_commands import PD_CAPTIVE_CABLES
 
 class PDCaptiveCablesController:
     """
@@ -69,6 +76,8 @@ class PDCaptiveCablesController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
     
@@ -83,50 +92,42 @@ class PDCaptiveCablesController:
             None
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: Outcome of the command.
 
         Raises:
             usb.core.USBError: If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        
-        # Control transfer parameters for PdCaptiveCable
-        bmRequestType = 0x40  # Request type: Vendor, Host-to-device, Device-to-interface
-        bRequest = 0xE9       # Request code for PdCaptiveCable command
-        wValue = 0x0000       # Value
-        wIndex = 0x0000       # Index
-        wLength = 0x0000      # Length
-
-        # Send control transfer for PdCaptiveCable command
-        result = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
-        print("result-pd-captive-cables:", result)
+            emit(WARNING, "Device not found")
+            return not_found('pd_captive_cables')
+
+        # Send control transfer for PdCaptiveCable command (0xE9, wIndex 0x0000)
+        began = time.perf_counter()
+        result = PD_CAPTIVE_CABLES.issue(self.device)
+        duration = time.perf_counter() - began
+
         if result == 0:
-            print("Switched PD support to captive cable successfully")
-        else:
-            print("Failed to switch PD support to captive cable")
-        return result == 0
+            emit(INFO, "Switched PD support to captive cable successfully")
+            return CommandResult('pd_captive_cables', OK, duration=duration)
+        emit(WARNING, "Failed to switch PD support to captive cable: %d bytes transferred", result)
+        return CommandResult('pd_captive_cables', FAILED, duration=duration)
 
 def pd_captive_cables_status():
     """
     Entry function to enable Captive Cable PD mode.
 
-    Initializes controller and triggers captive
-    cable configuration workflow.
+    Triggers captive cable configuration workflow
+    through the default cached session.
 
     Args:
         None
 
     Returns:
-        None
+        CommandResult: Outcome of the command.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045e  # Replace with your vendor ID
-    PRODUCT_ID = 0x078f  # Replace with your product ID
+    from .session import default_session
 
-    controller = PDCaptiveCablesController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.pd_captive_cables()
+    return default_session().pd_captive_cables()
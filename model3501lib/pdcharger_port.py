@@ -13,15 +13,22 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import FAILED, OK, CommandResult, not_found
+from .vendor_commands import PD_CHARGER_PORT
 
 class PDChargerPortController:
     """
@@ -67,6 +74,8 @@ class PDChargerPortController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
     
@@ -81,50 +90,42 @@ class PDChargerPortController:
             None
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: Outcome of the command.
 
         Raises:
             usb.core.USBError: If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        
-        # Control transfer parameters for PD Charger Port
-        bmRequestType = 0x40  # Request type: Vendor, Host-to-device, Device-to-interface
-        bRequest = 0xE9       # Request code for PD Charger Port command
-        wValue = 0x0000       # Value
-        wIndex = 0x0001       # Index
-        wLength = 0x0000      # Length
-
-        # Send control transfer for PD Charger Port command
-        result = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
-        print("result-pd-charger-port:", result)
+            emit(WARNING, "Device not found")
+            return not_found('pd_charger_port')
+
+        # Send control transfer for PD Charger Port command (0xE9, wIndex 0x0001)
+        began = time.perf_counter()
+        result = PD_CHARGER_PORT.issue(self.device)
+        duration = time.perf_counter() - began
+
         if result == 0:
-            print("Switched PD to charger receptacle successfully")
-        else:
-            print("Failed to switch PD to charger receptacle")
-        return result == 0
+            emit(INFO, "Switched PD to charger receptacle successfully")
+            return CommandResult('pd_charger_port', OK, duration=duration)
+        emit(WARNING, "Failed to switch PD to charger receptacle: %d bytes transferred", result)
+        return CommandResult('pd_charger_port', FAILED, duration=duration)
 
 def pd_charger_port_status():
     """
     Entry function to enable Charger Receptacle PD mode.
 
-    Initializes controller and triggers PD routing
-    configuration workflow.
+    Triggers PD routing configuration workflow
+    through the default cached session.
 
     Args:
         None
 
-        Returns:
-            None
+    Returns:
+        CommandResult: Outcome of the command.
 
-        Raises:
-            None
+    Raises:
+        None
     """
-    VENDOR_ID = 0x045e  # Replace with your vendor ID
-    PRODUCT_ID = 0x078f  # Replace with your product ID
+    from .session import default_session
 
-    controller = PDChargerPortController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.pd_charger_port()
+    return default_session().pd_charger_port()
@@ -0,0 +1,315 @@
+##############################################################################
+#
+# Module: pipeline.py
+#
+# Description:
+#     Batched command pipeline for the Type-C MUTT. A sequence of
+#     operations is validated when it is built and executed back to
+#     back on one open device handle, returning a structured result
+#     with timings for every step.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+from .events import WARNING, emit
+from .pd_profile import PdProfile
+from .results import CommandResult
+from .session import default_session
+
+SPEED_TYPES = ('s', 'h', 'f')
+MAX_WATTS = 45
+MAX_DELAY_MS = 0xFFFF       # delays travel in the 16-bit wValue/wIndex
+
+
+def _check_delay(name, value):
+    if not isinstance(value, int) or isinstance(value, bool) \
+            or not 0 <= value <= MAX_DELAY_MS:
+        raise ValueError("%s must be an integer 0..%d ms, got %r"
+                         % (name, MAX_DELAY_MS, value))
+
+
+def _validate_set_speed(speed_type):
+    if speed_type not in SPEED_TYPES:
+        raise ValueError("Invalid speed type %r, expected one of %s"
+                         % (speed_type, ', '.join(SPEED_TYPES)))
+
+
+def _validate_set_charge(watts):
+    if not isinstance(watts, (int, float)) or isinstance(watts, bool) \
+            or not 0 < watts <= MAX_WATTS:
+        raise ValueError("Invalid wattage %r, expected 1..%d W"
+                         % (watts, MAX_WATTS))
+
+
+def _validate_set_profile(profile):
+    if not isinstance(profile, PdProfile):
+        raise ValueError("set_profile needs a PdProfile, got %r" % (profile,))
+
+
+def _validate_reconnect(delay_disconnect_ms, delay_reconnect_ms):
+    _check_delay('delay_disconnect_ms', delay_disconnect_ms)
+    _check_delay('delay_reconnect_ms', delay_reconnect_ms)
+
+
+def _validate_wait(ms):
+    if not isinstance(ms, (int, float)) or isinstance(ms, bool) or ms < 0:
+        raise ValueError("wait must be a non-negative number of ms, got %r" % (ms,))
+
+
+def _validate_none():
+    pass
+
+
+# Pipeline operation -> argument validator
+OPERATIONS = {
+    'set_speed': _validate_set_speed,
+    'set_charge': _validate_set_charge,
+    'set_profile': _validate_set_profile,
+    'get_rdo': _validate_none,
+    'get_power_role': _validate_none,
+    'cdstress_on': _validate_none,
+    'cdstress_off': _validate_none,
+    'pd_captive_cables': _validate_none,
+    'pd_charger_port': _validate_none,
+    'reconnect': _validate_reconnect,
+    'wait': _validate_wait,
+}
+
+
+class StepResult:
+    """
+    Outcome of one pipeline step.
+
+    Attributes:
+        index (int): Step position in the pipeline.
+        operation (str): Operation name.
+        args (tuple): Operation arguments.
+        value (object): Operation return value.
+        error (Exception): Exception raised, or None.
+        elapsed (float): Step duration in seconds.
+    """
+    __slots__ = ('index', 'operation', 'args', 'value', 'error', 'elapsed')
+
+    def __init__(self, index, operation, args, value, error, elapsed):
+        self.index = index
+        self.operation = operation
+        self.args = args
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """
+        True if the step raised no error and did not report failure.
+        """
+        if isinstance(self.value, CommandResult):
+            return self.error is None and self.value.ok
+        return self.error is None and self.value is not False
+
+    def __repr__(self):
+        return "StepResult(%d, %s%r, value=%r, error=%r, elapsed=%.6f)" % (
+            self.index, self.operation, self.args, self.value, self.error,
+            self.elapsed)
+
+
+class PipelineResult:
+    """
+    Outcome of a pipeline run.
+
+    Attributes:
+        steps (list): StepResult per executed step.
+        elapsed (float): Total run duration in seconds.
+        completed (bool): True if every step was executed.
+    """
+    __slots__ = ('steps', 'elapsed', 'completed')
+
+    def __init__(self, steps, elapsed, completed):
+        self.steps = steps
+        self.elapsed = elapsed
+        self.completed = completed
+
+    @property
+    def ok(self):
+        """
+        True if every step ran and succeeded.
+        """
+        return self.completed and all(step.ok for step in self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __getitem__(self, index):
+        return self.steps[index]
+
+
+class Pipeline:
+    """
+    Builder for a batch of MUTT operations.
+
+    Each operation is validated as it is added, so an invalid
+    sequence fails before anything is sent to the device.
+
+    Example:
+        Pipeline().set_speed('h').set_charge(27).pd_captive_cables()
+            .cdstress_on().wait(500).get_rdo().run()
+
+    Attributes:
+        steps (list): (operation, args) tuples in execution order.
+    """
+    def __init__(self, steps=None):
+        """
+        Initialize pipeline.
+
+        Args:
+            steps (iterable): Optional (operation, *args) sequences.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If an operation or its arguments are invalid.
+        """
+        self.steps = []
+        for step in steps or ():
+            self.add(step[0], *step[1:])
+
+    def __len__(self):
+        return len(self.steps)
+
+    def add(self, operation, *args):
+        """
+        Validate and append an operation.
+
+        Args:
+            operation (str): Operation name, one of OPERATIONS.
+            *args: Operation arguments.
+
+        Returns:
+            Pipeline: self, for chaining.
+
+        Raises:
+            ValueError: If the operation or its arguments are invalid.
+        """
+        validator = OPERATIONS.get(operation)
+        if validator is None:
+            raise ValueError("Unknown pipeline operation: %r" % (operation,))
+        try:
+            validator(*args)
+        except TypeError:
+            raise ValueError("Wrong arguments for %s: %r" % (operation, args)) from None
+        self.steps.append((operation, args))
+        return self
+
+    def set_speed(self, speed_type):
+        return self.add('set_speed', speed_type)
+
+    def set_charge(self, watts):
+        return self.add('set_charge', watts)
+
+    def set_profile(self, profile):
+        return self.add('set_profile', profile)
+
+    def get_rdo(self):
+        return self.add('get_rdo')
+
+    def get_power_role(self):
+        return self.add('get_power_role')
+
+    def cdstress_on(self):
+        return self.add('cdstress_on')
+
+    def cdstress_off(self):
+        return self.add('cdstress_off')
+
+    def pd_captive_cables(self):
+        return self.add('pd_captive_cables')
+
+    def pd_charger_port(self):
+        return self.add('pd_charger_port')
+
+    def reconnect(self, delay_disconnect_ms, delay_reconnect_ms):
+        return self.add('reconnect', delay_disconnect_ms, delay_reconnect_ms)
+
+    def wait(self, ms):
+        return self.add('wait', ms)
+
+    def run(self, session=None, stop_on_error=True):
+        """
+        Execute the pipeline back to back on one device handle.
+
+        Args:
+            session (MuttSession): Session to run on; the default
+                cached session when omitted.
+            stop_on_error (bool): Stop at the first failing step.
+
+        Returns:
+            PipelineResult: Per-step results and timings.
+
+        Raises:
+            None
+        """
+        if session is None:
+            session = default_session()
+
+        results = []
+        start = time.perf_counter()
+        completed = True
+
+        if not session.open():
+            emit(WARNING, "Device not found")
+            return PipelineResult(results, time.perf_counter() - start, False)
+
+        for index, (operation, args) in enumerate(self.steps):
+            step_start = time.perf_counter()
+            error = None
+            value = None
+            try:
+                if operation == 'wait':
+                    time.sleep(args[0] / 1000.0)
+                else:
+                    value = getattr(session, operation)(*args)
+            except Exception as e:
+                error = e
+            step = StepResult(index, operation, args, value, error,
+                              time.perf_counter() - step_start)
+            results.append(step)
+            if stop_on_error and not step.ok:
+                completed = index == len(self.steps) - 1
+                break
+
+        return PipelineResult(results, time.perf_counter() - start, completed)
+
+
+def run_pipeline(steps, session=None, stop_on_error=True):
+    """
+    Validate and run a list of operations on one device handle.
+
+    Args:
+        steps (iterable): (operation, *args) sequences, for example
+            [('set_speed', 'h'), ('set_charge', 27), ('wait', 500)].
+        session (MuttSession): Optional session to run on.
+        stop_on_error (bool): Stop at the first failing step.
+
+    Returns:
+        PipelineResult: Per-step results and timings.
+
+    Raises:
+        ValueError: If an operation or its arguments are invalid.
+    """
+    return Pipeline(steps).run(session, stop_on_error)
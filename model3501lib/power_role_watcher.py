@@ -0,0 +1,266 @@
+##############################################################################
+#
+# Module: power_role_watcher.py
+#
+# Description:
+#     Watch the DUT power role through the 0x28 mailbox query and
+#     fire callbacks on role transitions only. The polling interval
+#     adapts: fast right after a change (or a command that can cause
+#     one), backing off while the role stays stable.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import statistics
+import threading
+import time
+from array import array
+from collections import deque
+
+# Lib imports
+# (None)
+
+# Own modules
+from .getpower_role import POWER_ROLE_LENGTH
+from .pd_decode import decode_power_role
+
+# Number of recent transitions kept for latency statistics
+LATENCY_WINDOW = 4096
+
+
+class PowerRoleWatcher:
+    """
+    Detect DUT power role swaps with adaptive polling.
+
+    Each poll reads the raw response into a reused buffer and
+    compares it byte for byte with the previous response; the
+    response is only decoded when it changed.
+
+    Callbacks are called from the watcher thread as
+    ``callback(old_result, new_result, detected_at)`` where the
+    results are PowerRoleResult and detected_at is a time.monotonic()
+    timestamp. The first read only sets ``current``.
+
+    Attributes:
+        session (MuttSession): Session of the watched device.
+        min_interval (float): Poll interval right after a change (s).
+        max_interval (float): Poll interval when stable (s).
+        backoff (float): Interval growth factor per unchanged poll.
+        current (PowerRoleResult): Last decoded role, or None.
+        polls (int): Number of queries sent.
+        transitions (int): Number of role changes seen.
+    """
+    def __init__(self, session, callback=None, min_interval=0.002,
+                 max_interval=0.25, backoff=1.5, auto_poke=True):
+        """
+        Initialize power role watcher.
+
+        Args:
+            session (MuttSession): Session of the device to watch.
+            callback (callable): Optional transition callback.
+            min_interval (float): Fastest poll interval in seconds.
+            max_interval (float): Slowest poll interval in seconds.
+            backoff (float): Interval growth factor (> 1).
+            auto_poke (bool): Return to fast polling after every
+                write command sent through the session.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the intervals or backoff are inconsistent.
+        """
+        if not 0 < min_interval <= max_interval or backoff <= 1:
+            raise ValueError("Need 0 < min_interval <= max_interval and backoff > 1")
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.auto_poke = auto_poke
+        self.current = None
+        self.polls = 0
+        self.transitions = 0
+        self.errors = 0
+        self.last_error = None
+        self._callbacks = [callback] if callback is not None else []
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._interval = min_interval
+        # A poke while a poll is in flight must survive its backoff
+        self._poked = False
+        self._interval_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def add_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self._callbacks.remove(callback)
+
+    def start(self):
+        """
+        Start the watcher thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the watcher is already running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Power role watcher already running")
+        self._stop.clear()
+        self._interval = self.min_interval
+        self._poked = False
+        if self.auto_poke:
+            self.session.add_command_listener(self._on_command)
+        self._thread = threading.Thread(target=self._run, name='mutt-role-watcher',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the watcher thread and wait for it to exit.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            if self.auto_poke:
+                self.session.remove_command_listener(self._on_command)
+
+    def poke(self):
+        """
+        Switch back to fast polling immediately.
+
+        Call this after issuing a command that can trigger a role
+        swap (reconnect, CD stress, charge profile or PD routing).
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._interval_lock:
+            self._poked = True
+            self._interval = self.min_interval
+        self._wake.set()
+
+    def _on_command(self, command, args, result):
+        self.poke()
+
+    def _run(self):
+        buffers = (array('B', bytes(POWER_ROLE_LENGTH)),
+                   array('B', bytes(POWER_ROLE_LENGTH)))
+        have_previous = False
+        flip = 0
+        last_poll = None
+        read_power_role = self.session.read_power_role
+        monotonic = time.monotonic
+
+        while not self._stop.is_set():
+            buffer = buffers[flip]
+            poll_time = monotonic()
+            try:
+                response = read_power_role(buffer)
+            except Exception as e:
+                response = None
+                self.errors += 1
+                self.last_error = e
+            self.polls += 1
+
+            changed = stable = False
+            if response is not None and response is not False:
+                if not have_previous or buffer != buffers[flip ^ 1]:
+                    self._transition(buffer, poll_time, last_poll, have_previous)
+                    have_previous = True
+                    flip ^= 1
+                    changed = True
+                else:
+                    stable = True
+                last_poll = poll_time
+
+            with self._interval_lock:
+                if changed or self._poked:
+                    self._interval = self.min_interval
+                elif stable:
+                    self._interval = min(self._interval * self.backoff,
+                                         self.max_interval)
+                self._poked = False
+
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+    def _transition(self, buffer, poll_time, last_poll, counted):
+        new = decode_power_role(buffer)
+        old = self.current
+        self.current = new
+        if not counted:
+            return
+        self.transitions += 1
+        # The change happened between the previous poll and this one;
+        # half that gap is the expected detection latency.
+        if last_poll is not None:
+            self._latencies.append((poll_time - last_poll) / 2.0)
+        for callback in list(self._callbacks):
+            callback(old, new, poll_time)
+
+    def stats(self):
+        """
+        Report polling and detection latency statistics.
+
+        Detection latency of a transition is estimated as half the
+        gap between the poll that saw the old role and the poll
+        that saw the new one; the worst case is the full gap.
+
+        Args:
+            None
+
+        Returns:
+            dict: polls, transitions, errors, current interval and
+            mean / median / max detection latency in seconds.
+
+        Raises:
+            None
+        """
+        latencies = list(self._latencies)
+        return {
+            'polls': self.polls,
+            'transitions': self.transitions,
+            'errors': self.errors,
+            'interval_s': self._interval,
+            'latency_mean_s': statistics.fmean(latencies) if latencies else None,
+            'latency_median_s': statistics.median(latencies) if latencies else None,
+            'latency_max_s': max(latencies) if latencies else None,
+        }
@@ -0,0 +1,265 @@
+##############################################################################
+#
+# Module: rdo_sampler.py
+#
+# Description:
+#     Background sampler polling the RDO of the current power
+#     contract at a fixed rate into a preallocated ring buffer of
+#     (monotonic timestamp, 16 raw response bytes). Readers take
+#     snapshots without locking the sampler.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+import time
+from array import array
+
+# Lib imports
+# (None)
+
+# Own modules
+from .getrdo import RDO_LENGTH
+
+
+class RdoSampler:
+    """
+    Poll the RDO of one MUTT into a fixed-size ring buffer.
+
+    The sampler thread is the only writer. It fills a slot and then
+    publishes it by advancing ``written``; readers copy slots and
+    re-check ``written`` afterwards to discard slots that were
+    overwritten meanwhile, so no lock is shared with the sampler.
+
+    Other threads may keep using the session while sampling: each
+    RDO query holds the session and device locks for its write/read
+    pair on the E4 mailbox, so their commands run between samples
+    and only delay the next one.
+
+    Attributes:
+        session (MuttSession): Session of the sampled device.
+        rate_hz (float): Target sampling rate.
+        capacity (int): Number of samples kept.
+        timestamps (array.array): Sample times (time.monotonic()).
+        data (bytearray): capacity * 16 raw response bytes.
+        written (int): Total number of samples published.
+        missed (int): Sample periods skipped because the sampler
+            fell behind schedule.
+        failed (int): Reads that returned no RDO or raised an error.
+    """
+    def __init__(self, session, rate_hz=500.0, capacity=8192):
+        """
+        Initialize RDO sampler.
+
+        Args:
+            session (MuttSession): Session of the device to sample.
+            rate_hz (float): Target sampling rate in Hz.
+            capacity (int): Ring buffer size in samples.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If rate_hz or capacity is not positive.
+        """
+        if rate_hz <= 0 or capacity <= 0:
+            raise ValueError("rate_hz and capacity must be positive")
+        self.session = session
+        self.rate_hz = float(rate_hz)
+        self.capacity = int(capacity)
+        self.timestamps = array('d', bytes(8 * self.capacity))
+        self.data = bytearray(RDO_LENGTH * self.capacity)
+        self.written = 0
+        self.missed = 0
+        self.failed = 0
+        self.last_error = None
+        # (time.monotonic(), written) at the start of the current or
+        # last run, set together so the achieved rate covers one run
+        self._started = None
+        self._stopped = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Start the sampler thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the sampler is already running.
+        """
+        if self.running:
+            raise RuntimeError("RDO sampler already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='mutt-rdo-sampler',
+                                        daemon=True)
+        self._started = (time.monotonic(), self.written)
+        self._stopped = None
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the sampler thread and wait for it to exit.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._started is not None and self._stopped is None:
+            self._stopped = time.monotonic()
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        capacity = self.capacity
+        timestamps = self.timestamps
+        data = self.data
+        scratch = array('B', bytes(RDO_LENGTH))
+        read_rdo = self.session.read_rdo
+        monotonic = time.monotonic
+        sleep = time.sleep
+        stop = self._stop
+
+        next_due = monotonic()
+        while not stop.is_set():
+            now = monotonic()
+            try:
+                response = read_rdo(scratch)
+            except Exception as e:
+                response = None
+                self.last_error = e
+            if response is None or response is False:
+                self.failed += 1
+            else:
+                slot = self.written % capacity
+                offset = slot * RDO_LENGTH
+                data[offset:offset + RDO_LENGTH] = scratch
+                timestamps[slot] = now
+                # Publish only after the slot is complete
+                self.written += 1
+
+            next_due += period
+            delay = next_due - monotonic()
+            if delay > 0:
+                sleep(delay)
+            elif delay < -period:
+                # Fell behind: skip the periods that cannot be caught up
+                skipped = int(-delay / period)
+                self.missed += skipped
+                next_due += skipped * period
+
+    def snapshot(self, count=None):
+        """
+        Copy the most recent samples out of the ring buffer.
+
+        Args:
+            count (int): Maximum number of samples; all buffered
+                samples when omitted.
+
+        Returns:
+            list: (timestamp, bytes) tuples, oldest first.
+
+        Raises:
+            None
+        """
+        end = self.written
+        available = min(end, self.capacity)
+        if count is not None:
+            available = min(available, count)
+        first = end - available
+
+        samples = []
+        for index in range(first, end):
+            slot = index % self.capacity
+            offset = slot * RDO_LENGTH
+            samples.append((self.timestamps[slot],
+                            bytes(self.data[offset:offset + RDO_LENGTH])))
+
+        # Drop slots the sampler overwrote (or is overwriting) while
+        # they were copied
+        in_progress = 1 if self.running else 0
+        overwritten = self.written + in_progress - self.capacity - first
+        if overwritten > 0:
+            del samples[:overwritten]
+        return samples
+
+    def latest(self):
+        """
+        Return the most recent sample.
+
+        Args:
+            None
+
+        Returns:
+            tuple: (timestamp, bytes), or None if nothing sampled yet.
+
+        Raises:
+            None
+        """
+        samples = self.snapshot(1)
+        return samples[0] if samples else None
+
+    def stats(self):
+        """
+        Report sampling statistics.
+
+        Args:
+            None
+
+        Returns:
+            dict: target rate and rate achieved by the current or last
+            run (Hz), duration of that run, samples written, missed
+            periods, failed reads and samples lost to ring buffer
+            overwrite.
+
+        Raises:
+            None
+        """
+        written = self.written
+        if self._started is None:
+            elapsed = 0.0
+            sampled = 0
+        else:
+            began, base = self._started
+            elapsed = (self._stopped or time.monotonic()) - began
+            sampled = written - base
+        return {
+            'target_hz': self.rate_hz,
+            'achieved_hz': sampled / elapsed if elapsed > 0 else 0.0,
+            'elapsed_s': elapsed,
+            'samples': written,
+            'missed': self.missed,
+            'failed': self.failed,
+            'dropped': self.missed + self.failed,
+            'overwritten': max(0, written - self.capacity),
+        }
@@ -0,0 +1,173 @@
+##############################################################################
+#
+# Module: readcache.py
+#
+# Description:
+#     Read cache for the RDO and power role queries of one MUTT.
+#     Answers are reused for a time-to-live per query type, and
+#     concurrent callers of the same query share one in-flight
+#     mailbox exchange (single-flight), so N pollers of a device cost
+#     one bus round trip. Every write command on the device, and
+#     every change of handle, empties the cache.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+import time
+from concurrent.futures import Future
+
+# Lib imports
+# (None)
+
+# Own modules
+from .results import NO_RESPONSE, OK, CommandResult
+
+# Session queries served through the cache
+CACHED_QUERIES = ('get_rdo', 'get_power_role')
+
+# Answers worth reusing; errors and timeouts are always retried
+_CACHED_STATUSES = (OK, NO_RESPONSE)
+
+_COUNTERS = ('hits', 'misses', 'coalesced', 'invalidations')
+
+
+class ReadCache:
+    """
+    TTL cache with single-flight loading for one device.
+
+    Cached CommandResult objects are shared by every caller and must
+    not be modified.
+
+    Attributes:
+        ttl (dict): Query -> seconds an answer is reused. 0 still
+            coalesces concurrent callers but keeps no answer.
+    """
+    def __init__(self, ttl):
+        """
+        Initialize read cache.
+
+        Args:
+            ttl (float or dict): Seconds for every query, or a dict
+                of query name ('get_rdo', 'get_power_role') to
+                seconds; queries left out are not cached.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a query name is unknown.
+        """
+        if isinstance(ttl, dict):
+            unknown = set(ttl) - set(CACHED_QUERIES)
+            if unknown:
+                raise ValueError("Uncacheable queries: %s" % ', '.join(sorted(unknown)))
+            self.ttl = dict(ttl)
+        else:
+            self.ttl = dict.fromkeys(CACHED_QUERIES, ttl)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._flights = {}
+        self._generation = 0
+        self._counters = {query: dict.fromkeys(_COUNTERS, 0) for query in self.ttl}
+
+    def caches(self, query):
+        """
+        Check whether a query goes through the cache.
+        """
+        return query in self.ttl
+
+    def get(self, query, load):
+        """
+        Answer a query from the cache, a shared flight or ``load``.
+
+        Args:
+            query (str): Query name, one of the ttl keys.
+            load (callable): Runs the query on the device.
+
+        Returns:
+            object: Result of ``load``, possibly from another caller.
+
+        Raises:
+            Exception: Whatever ``load`` raised in the caller that ran it.
+        """
+        counters = self._counters[query]
+        leader = False
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None and entry[1] > time.monotonic():
+                counters['hits'] += 1
+                return entry[0]
+            flight = self._flights.get(query)
+            if flight is not None:
+                counters['coalesced'] += 1
+            else:
+                counters['misses'] += 1
+                flight = self._flights[query] = Future()
+                generation = self._generation
+                leader = True
+        if not leader:
+            return flight.result()
+
+        try:
+            result = load()
+        except BaseException as e:
+            with self._lock:
+                del self._flights[query]
+            flight.set_exception(e)
+            raise
+        with self._lock:
+            del self._flights[query]
+            # A write since the flight began makes the answer stale
+            if (generation == self._generation and isinstance(result, CommandResult)
+                    and result.status in _CACHED_STATUSES and self.ttl[query] > 0):
+                self._entries[query] = (result, time.monotonic() + self.ttl[query])
+        flight.set_result(result)
+        return result
+
+    def invalidate(self, *unused):
+        """
+        Drop every cached answer.
+
+        Has the command listener signature of MuttSession, so it can
+        be registered with add_command_listener().
+
+        Args:
+            *unused: Listener arguments (command, args, result).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                for query in self._entries:
+                    self._counters[query]['invalidations'] += 1
+                self._entries.clear()
+
+    def stats(self):
+        """
+        Counters per query.
+
+        Args:
+            None
+
+        Returns:
+            dict: query -> 'hits', 'misses' (device reads),
+            'coalesced' (callers served by another caller's read)
+            and 'invalidations'.
+
+        Raises:
+            None
+        """
+        with self._lock:
+            return {query: dict(counters) for query, counters in self._counters.items()}
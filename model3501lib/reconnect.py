@@ -13,16 +13,22 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
-import usb.util
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import OK, CommandResult, not_found
+from .vendor_commands import RECONNECT
 
 class ReconnectController:
     """
@@ -68,9 +74,33 @@ class ReconnectController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
 
+    def is_configured(self):
+        """
+        Check whether the device already has an active configuration.
+
+        pyusb caches the active configuration on the device handle,
+        so repeated checks on the same handle cost no USB traffic.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if a configuration is active, False otherwise.
+
+        Raises:
+            None
+        """
+        # usb.core.USBError is an OSError: catching that needs no pyusb
+        try:
+            return self.device.get_active_configuration() is not None
+        except OSError:
+            return False
+
     def disconnect_and_reconnect(self, delay_disconnect_ms, delay_reconnect_ms):
         """
         Perform disconnect and reconnect sequence.
@@ -87,36 +117,37 @@ class ReconnectController:
                 Delay before reconnect (milliseconds).
 
         Returns:
-            bool: True if command executed successfully,
-                  False otherwise.
+            CommandResult: Outcome of the command; value is the
+            (disconnect, reconnect) delay pair.
 
         Raises:
             usb.core.USBError:
                 If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        
-        # Set configuration
-        self.device.set_configuration()
-        
-        # Setup packet details
-        bmRequestType = 0x40  # Request type: Vendor, Host-to-device, Device-to-interface
-        bRequest = 0x10       # Request code
-        wLength = 0x00
-
-        # Send control transfer for disconnect
-        self.device.ctrl_transfer(bmRequestType, bRequest, delay_disconnect_ms, delay_reconnect_ms, wLength)
-        print(f"Device disconnected for {delay_disconnect_ms}ms and reconnected for {delay_reconnect_ms}ms")
-        return True
+            emit(WARNING, "Device not found")
+            return not_found('reconnect')
+
+        began = time.perf_counter()
+        # Set configuration only when none is active yet
+        if not self.is_configured():
+            self.device.set_configuration()
+
+        # Send control transfer for disconnect (0x10, delays in wValue/wIndex)
+        RECONNECT.issue(self.device, value=delay_disconnect_ms, index=delay_reconnect_ms)
+        duration = time.perf_counter() - began
+        emit(INFO, "Device disconnected for %dms and reconnected for %dms",
+             delay_disconnect_ms, delay_reconnect_ms)
+        return CommandResult('reconnect', OK, (delay_disconnect_ms, delay_reconnect_ms),
+                             duration=duration)
 
 def reconnect_status(delay_disconnect_ms, delay_reconnect_ms):
     """
     Entry function to trigger reconnect operation.
 
-    Initializes controller and executes disconnect/
-    reconnect workflow with provided delay timings.
+    Executes disconnect/reconnect workflow with
+    provided delay timings through the default
+    cached session.
 
     Args:
         delay_disconnect_ms (int):
@@ -126,14 +157,11 @@ def reconnect_status(delay_disconnect_ms, delay_reconnect_ms):
             Delay before reconnect (milliseconds).
 
     Returns:
-        None
+        CommandResult: Outcome of the command.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045e  # Replace with your vendor ID
-    PRODUCT_ID = 0x078f  # Replace with your product ID
+    from .session import default_session
 
-    controller = ReconnectController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.disconnect_and_reconnect(delay_disconnect_ms, delay_reconnect_ms)
+    return default_session().reconnect(delay_disconnect_ms, delay_reconnect_ms)
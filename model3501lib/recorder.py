@@ -0,0 +1,566 @@
+##############################################################################
+#
+# Module: recorder.py
+#
+# Description:
+#     Record and replay of control-transfer traffic. TransferRecorder
+#     is a transfer hook appending every control transfer of a
+#     session or fleet to a compact binary log. Replayer turns the
+#     log of one MUTT back into session commands and runs them
+#     through a ReplayBus, a fake device answering each transfer
+#     with the recorded response or error - at the recorded speed to
+#     reproduce a failure off the rig, or as fast as possible to
+#     measure the overhead of the library itself.
+#
+#     Log layout (little endian):
+#         header      b'MUTTREC\x01', start time (double, time.time())
+#         device      b'D', id (u16), name length (u8), name (utf-8)
+#         transfer    b'T', device id (u16), offset from start in s
+#                     (double), bmRequestType (u8), bRequest (u8),
+#                     wValue (u16), wIndex (u16), wLength (u16),
+#                     duration in s (float), errno (i16, 0 if none),
+#                     data length (u16), data (OUT payload or IN
+#                     response), then for errors a message length
+#                     (u8) and message (utf-8)
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import struct
+import threading
+import time
+from array import array
+
+# Lib imports
+import usb.core
+
+# Own modules
+from .pd_decode import OPCODE_POWER_ROLE, OPCODE_RDO
+from .pd_profile import TIERS, FixedPdo, PdProfile
+from .pipeline import Pipeline
+from .session import PRODUCT_ID, VENDOR_ID, MuttSession
+from .vendor_commands import SPEED_COMMANDS
+
+MAGIC = b'MUTTREC\x01'
+
+_HEADER = struct.Struct('<d')
+_DEVICE = struct.Struct('<HB')
+_TRANSFER = struct.Struct('<HdBBHHHfhH')
+_MESSAGE = struct.Struct('<B')
+
+# errno recorded for errors that carry none
+_UNKNOWN_ERRNO = -1
+
+_SPEEDS = {command.request: speed for speed, command in SPEED_COMMANDS.items()}
+_QUERIES = {OPCODE_RDO: 'get_rdo', OPCODE_POWER_ROLE: 'get_power_role'}
+
+
+class ReplayError(Exception):
+    """
+    Library traffic departs from the log being replayed.
+    """
+
+
+class RecordedTransfer:
+    """
+    One control transfer read from a log.
+
+    Attributes:
+        device (str): Device identity (serial number or bus/port path).
+        timestamp (float): Start, in seconds from the log start.
+        request_type (int): bmRequestType.
+        request (int): bRequest.
+        value (int): wValue.
+        index (int): wIndex.
+        length (int): wLength.
+        duration (float): Transfer time in seconds.
+        errno (int): errno of the error raised, 0 if none.
+        message (str): Error message, or None.
+        data (bytes): OUT payload or IN response.
+    """
+    __slots__ = ('device', 'timestamp', 'request_type', 'request', 'value', 'index',
+                 'length', 'duration', 'errno', 'message', 'data')
+
+    def __init__(self, device, timestamp, request_type, request, value, index,
+                 length, duration, errno, message, data):
+        self.device = device
+        self.timestamp = timestamp
+        self.request_type = request_type
+        self.request = request
+        self.value = value
+        self.index = index
+        self.length = length
+        self.duration = duration
+        self.errno = errno
+        self.message = message
+        self.data = data
+
+    @property
+    def setup(self):
+        """
+        (bmRequestType, bRequest, wValue, wIndex).
+        """
+        return (self.request_type, self.request, self.value, self.index)
+
+    def __repr__(self):
+        return "RecordedTransfer(%s, +%.6fs, 0x%02X 0x%02X %d %d, %d bytes, %s)" % (
+            self.device, self.timestamp, self.request_type, self.request, self.value,
+            self.index, len(self.data), self.message or 'ok')
+
+
+class TransferRecorder:
+    """
+    Transfer hook writing every control transfer to a binary log.
+
+    Attributes:
+        path (str): Log file path.
+        count (int): Transfers recorded.
+    """
+    def __init__(self, path):
+        """
+        Create the log and write its header.
+
+        Args:
+            path (str): Log file path; an existing file is replaced.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file cannot be created.
+        """
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC + _HEADER.pack(time.time()))
+        self._began = time.perf_counter()
+        self._devices = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, event):
+        """
+        Append one transfer; registered as transfer hook.
+
+        Args:
+            event (hooks.TransferEvent): Completed or failed transfer.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        offset = time.perf_counter() - event.duration - self._began
+        data = event.data
+        if event.request_type & 0x80:
+            length = data if isinstance(data, int) else len(data)
+            response = event.response
+            payload = bytes(response[:event.nbytes]) if response is not None else b''
+        else:
+            payload = bytes(data) if data else b''
+            length = len(payload)
+        error = event.error
+        if error is None:
+            number = 0
+        else:
+            number = getattr(error, 'errno', None) or _UNKNOWN_ERRNO
+
+        with self._lock:
+            if self._file is None:
+                return
+            device = self._devices.get(event.device)
+            if device is None:
+                device = self._devices[event.device] = len(self._devices)
+                name = str(event.device).encode('utf-8')[:255]
+                self._file.write(b'D' + _DEVICE.pack(device, len(name)) + name)
+            self._file.write(b'T' + _TRANSFER.pack(
+                device, offset, event.request_type, event.request, event.value,
+                event.index, length, event.duration, number, len(payload)) + payload)
+            if error is not None:
+                message = str(getattr(error, 'strerror', None) or error).encode('utf-8')[:255]
+                self._file.write(_MESSAGE.pack(len(message)) + message)
+            self.count += 1
+
+    def attach(self, target):
+        """
+        Record the transfers of a session or of every fleet session,
+        including those of devices a later rescan finds.
+
+        Args:
+            target (MuttSession or MuttFleet): Where to record from.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        target.add_transfer_hook(self.record)
+
+    def detach(self, target):
+        """
+        Stop recording the transfers of a session or of every fleet
+        session.
+
+        Args:
+            target (MuttSession or MuttFleet): Where to stop recording.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the recorder is not attached to it.
+        """
+        target.remove_transfer_hook(self.record)
+
+    def close(self):
+        """
+        Flush and close the log; later transfers are not recorded.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_log(path):
+    """
+    Read every transfer of a log.
+
+    Args:
+        path (str): Log file path.
+
+    Returns:
+        list: RecordedTransfer entries in recording order.
+
+    Raises:
+        ValueError: If the file is not a transfer log or is cut short.
+        OSError: If the file cannot be read.
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    if not content.startswith(MAGIC):
+        raise ValueError("%s is not a MUTT transfer log" % path)
+    position = len(MAGIC) + _HEADER.size
+    if position > len(content):
+        raise ValueError("%s: truncated or corrupt log" % path)
+    names = {}
+    transfers = []
+    try:
+        while position < len(content):
+            kind = content[position:position + 1]
+            position += 1
+            if kind == b'D':
+                device, size = _DEVICE.unpack_from(content, position)
+                position += _DEVICE.size
+                names[device] = content[position:position + size].decode('utf-8')
+                position += size
+                if position > len(content):
+                    raise struct.error("truncated record")
+            elif kind == b'T':
+                (device, offset, request_type, request, value, index, length,
+                 duration, number, size) = _TRANSFER.unpack_from(content, position)
+                position += _TRANSFER.size
+                data = content[position:position + size]
+                position += size
+                message = None
+                if number:
+                    (count,) = _MESSAGE.unpack_from(content, position)
+                    position += _MESSAGE.size
+                    message = content[position:position + count].decode('utf-8')
+                    position += count
+                if position > len(content):
+                    # A payload or message cut short reads as fewer bytes
+                    raise struct.error("truncated record")
+                transfers.append(RecordedTransfer(
+                    names[device], offset, request_type, request, value, index,
+                    length, duration, number, message, data))
+            else:
+                raise ValueError("%s: bad record at byte %d" % (path, position - 1))
+    except (struct.error, KeyError, UnicodeDecodeError):
+        raise ValueError("%s: truncated or corrupt log" % path) from None
+    return transfers
+
+
+def _profile(payload):
+    """
+    Rebuild the PdProfile of a 0xEE payload, keeping tier names.
+    """
+    count = payload[1]
+    pdos = [FixedPdo.decode(pdo) for pdo in struct.unpack_from('<%dI' % count, payload, 2)]
+    profile = PdProfile(pdos)
+    for _, tier in TIERS:
+        if tier == profile:
+            return tier
+    return profile
+
+
+def _step(transfer):
+    """
+    Session command started by a transfer, as (operation, *args).
+    """
+    request = transfer.request
+    if transfer.request_type & 0x80:
+        return None
+    if request in _SPEEDS:
+        return ('set_speed', _SPEEDS[request])
+    if request == 0x10:
+        return ('reconnect', transfer.value, transfer.index)
+    if request == 0xE4 and len(transfer.data) > 1 and transfer.data[1] in _QUERIES:
+        return (_QUERIES[transfer.data[1]],)
+    if request == 0xE8:
+        return ('cdstress_on',) if transfer.index else ('cdstress_off',)
+    if request == 0xE9:
+        return ('pd_charger_port',) if transfer.index else ('pd_captive_cables',)
+    if request == 0xEE:
+        return ('set_profile', _profile(transfer.data))
+    return None
+
+
+def decode_steps(transfers):
+    """
+    Recover the session commands that produced the transfers.
+
+    A transfer repeating the first transfer of the command before
+    it, after that command saw an error, is taken as the session's
+    retry of the same command.
+
+    Args:
+        transfers (list): RecordedTransfer entries of one device.
+
+    Returns:
+        list: (operation, *args) pipeline steps.
+
+    Raises:
+        ReplayError: If a transfer starts no known command.
+    """
+    steps = []
+    first = None
+    failed = False
+    for transfer in transfers:
+        if failed and first is not None and transfer.setup == first.setup \
+                and transfer.data == first.data:
+            failed = False
+            continue
+        step = _step(transfer)
+        if step is not None:
+            steps.append(step)
+            first = transfer
+            failed = False
+        elif first is None:
+            raise ReplayError("No command starts with %r" % (transfer,))
+        if transfer.errno:
+            failed = True
+    return steps
+
+
+class ReplayDevice:
+    """
+    Fake device handle answering from a ReplayBus.
+    """
+    idVendor = VENDOR_ID
+    idProduct = PRODUCT_ID
+    bcdDevice = 0x0100
+    manufacturer = 'Microsoft'
+    product = 'Type-C MUTT (replay)'
+    bus = 1
+    address = 1
+    port_numbers = (1,)
+    port_number = 1
+    speed = None
+
+    def __init__(self, bus, serial_number):
+        self._bus = bus
+        self.serial_number = serial_number
+        self.default_timeout = 1000
+
+    def __repr__(self):
+        return "ReplayDevice(%s)" % (self.serial_number,)
+
+    def get_active_configuration(self):
+        return None
+
+    def set_configuration(self, configuration=None):
+        pass
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        return self._bus.serve(bmRequestType, bRequest, wValue, wIndex, data_or_wLength)
+
+
+class ReplayBus:
+    """
+    Transport serving the recorded transfers of one MUTT in order.
+
+    Pass it as ``transport`` to MuttSession. Each transfer must match
+    the setup (and OUT payload) of the next recorded one; it gets the
+    recorded response or raises the recorded error. Retries of failed
+    commands follow the replaying session's own policy.
+
+    Attributes:
+        transfers (list): RecordedTransfer entries served in order.
+        realtime (bool): Keep the recorded start times and durations
+            instead of answering at once.
+        served (int): Transfers answered so far.
+    """
+    def __init__(self, transfers, realtime=False):
+        self.transfers = list(transfers)
+        self.realtime = realtime
+        self.served = 0
+        self._lock = threading.Lock()
+        self._began = None
+        self._last = None
+        self._name = self.transfers[0].device if self.transfers else None
+
+    def find(self, find_all=False, **kwargs):
+        device = ReplayDevice(self, self._name)
+        return [device] if find_all else device
+
+    def dispose(self, device):
+        pass
+
+    def _next(self, setup, payload):
+        """
+        Recorded transfer answering the given one; holds self._lock.
+
+        A session retrying a failed command more often than recorded
+        gets the recorded failure again, and one retrying less skips
+        the recorded retries of that command.
+        """
+        last = self._last
+        while True:
+            if self.served < len(self.transfers):
+                transfer = self.transfers[self.served]
+                if transfer.setup == setup and (payload is None or payload == transfer.data):
+                    self.served += 1
+                    self._last = transfer if transfer.errno else None
+                    return transfer
+            if last is None:
+                break
+            if last.setup == setup and (payload is None or payload == last.data):
+                return last
+            if self.served >= len(self.transfers):
+                break
+            # Drop the recorded retries of the failed command
+            transfer = self.transfers[self.served]
+            if (transfer.setup, transfer.data) != (last.setup, last.data) \
+                    and _step(transfer) is not None:
+                break
+            self.served += 1
+        if self.served >= len(self.transfers):
+            raise ReplayError("Log exhausted after %d transfers" % self.served)
+        raise ReplayError("Transfer %d: expected %r, got 0x%02X 0x%02X %d %d"
+                          % ((self.served, self.transfers[self.served]) + setup))
+
+    def serve(self, request_type, request, value, index, data):
+        """
+        Answer one transfer from the log.
+
+        Args:
+            request_type (int): bmRequestType.
+            request (int): bRequest.
+            value (int): wValue.
+            index (int): wIndex.
+            data: data_or_wLength of the transfer.
+
+        Returns:
+            int or array.array: Like usb.core.Device.ctrl_transfer.
+
+        Raises:
+            ReplayError: If the transfer is not the next recorded one.
+            usb.core.USBError: The recorded error of the transfer.
+        """
+        setup = (request_type, request, value, index)
+        payload = None if request_type & 0x80 else bytes(data or b'')
+        with self._lock:
+            transfer = self._next(setup, payload)
+            if self._began is None:
+                self._began = time.perf_counter() - transfer.timestamp
+        if self.realtime:
+            delay = self._began + transfer.timestamp - time.perf_counter()
+            time.sleep(max(0.0, delay) + transfer.duration)
+        if transfer.errno:
+            raise usb.core.USBError(transfer.message, None, transfer.errno)
+        if not request_type & 0x80:
+            return transfer.length
+        if isinstance(data, array):
+            count = min(len(data), len(transfer.data))
+            data[:count] = array('B', transfer.data[:count])
+            return count
+        return array('B', transfer.data)
+
+
+class Replayer:
+    """
+    Re-run the commands of a recorded MUTT through a ReplayBus.
+
+    Attributes:
+        transfers (list): RecordedTransfer entries of the device.
+        steps (list): Session commands decoded from the transfers.
+        realtime (bool): Replay at recorded speed.
+    """
+    def __init__(self, path, device=None, realtime=False):
+        """
+        Load one device's traffic from a log.
+
+        Args:
+            path (str): Log file path.
+            device (str): Device identity to replay; may be omitted
+                when the log holds a single device.
+            realtime (bool): Keep recorded timing; as fast as
+                possible otherwise.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the log is invalid, or the device is
+                missing or not named while several are recorded.
+            ReplayError: If the traffic cannot be decoded.
+        """
+        transfers = read_log(path)
+        names = list(dict.fromkeys(transfer.device for transfer in transfers))
+        if device is None:
+            if len(names) != 1:
+                raise ValueError("Log holds %d devices, name one of: %s"
+                                 % (len(names), ', '.join(names)))
+            device = names[0]
+        elif device not in names:
+            raise ValueError("Device %r is not in the log" % (device,))
+        self.device = device
+        self.realtime = realtime
+        self.transfers = [transfer for transfer in transfers if transfer.device == device]
+        self.steps = decode_steps(self.transfers)
+
+    def run(self, session_options=None):
+        """
+        Replay every command, continuing after failures.
+
+        Args:
+            session_options (dict): Extra MuttSession arguments, for
+                example a timeout_policy, to replay with.
+
+        Returns:
+            tuple: (PipelineResult, ReplayBus); the bus tells how many
+            recorded transfers were served.
+
+        Raises:
+            None
+        """
+        bus = ReplayBus(self.transfers, self.realtime)
+        session = MuttSession(transport=bus, **(session_options or {}))
+        result = Pipeline(self.steps).run(session, stop_on_error=False)
+        session.close()
+        return result, bus
@@ -0,0 +1,524 @@
+##############################################################################
+#
+# Module: reenum_tracer.py
+#
+# Description:
+#     Measure how long the host takes to re-enumerate the Type-C MUTT
+#     after a reconnect or a speed change. The tracer timestamps the
+#     command, then the departure of the device, its arrival, the
+#     appearance of its device node and the moment its descriptors
+#     are readable, using netlink uevents or sysfs polling on Linux.
+#     Recorded event streams can be replayed for hardware-free runs.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import bisect
+import json
+import os
+import queue
+import socket
+import threading
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+from .findDevice import SYSFS_USB_DEVICES
+
+COMMAND = 'command'
+DEPARTURE = 'departure'
+ARRIVAL = 'arrival'
+NODE = 'node'
+DESCRIPTORS = 'descriptors'
+
+# Order of the events of one re-enumeration cycle
+PHASES = (COMMAND, DEPARTURE, ARRIVAL, NODE, DESCRIPTORS)
+
+NETLINK_KOBJECT_UEVENT = 15
+
+# Shortest valid USB device descriptor
+_DEVICE_DESCRIPTOR_LENGTH = 18
+
+
+class TraceEvent:
+    """
+    One timestamped re-enumeration event.
+
+    Attributes:
+        time (float): time.monotonic() timestamp.
+        kind (str): One of PHASES.
+        detail (str): Free text (command, device path, ...).
+    """
+    __slots__ = ('time', 'kind', 'detail')
+
+    def __init__(self, time, kind, detail=''):
+        self.time = time
+        self.kind = kind
+        self.detail = detail
+
+    def to_json(self):
+        return json.dumps({'t': self.time, 'event': self.kind, 'detail': self.detail})
+
+    @classmethod
+    def from_json(cls, line):
+        record = json.loads(line)
+        return cls(record['t'], record['event'], record.get('detail', ''))
+
+    def __repr__(self):
+        return "TraceEvent(%.6f, %s, %r)" % (self.time, self.kind, self.detail)
+
+
+class CycleLatency:
+    """
+    Latency breakdown of one re-enumeration cycle, in seconds.
+
+    Attributes:
+        command (str): Command that triggered the cycle.
+        to_departure (float): Command to device departure.
+        to_arrival (float): Departure to device arrival.
+        to_node (float): Arrival to device node present.
+        to_descriptors (float): Node present to descriptors readable.
+        total (float): Command to descriptors readable.
+        complete (bool): True if every phase was observed.
+        result (CommandResult): Result of a command that failed, in
+            which case no phase was waited for; None otherwise.
+    """
+    __slots__ = ('command', 'to_departure', 'to_arrival', 'to_node',
+                 'to_descriptors', 'total', 'complete', 'result')
+
+    def __init__(self, command, times, result=None):
+        def gap(start, end):
+            if times.get(start) is None or times.get(end) is None:
+                return None
+            return times[end] - times[start]
+
+        self.command = command
+        self.to_departure = gap(COMMAND, DEPARTURE)
+        self.to_arrival = gap(DEPARTURE, ARRIVAL)
+        self.to_node = gap(ARRIVAL, NODE)
+        self.to_descriptors = gap(NODE, DESCRIPTORS)
+        self.total = gap(COMMAND, DESCRIPTORS)
+        self.complete = all(times.get(phase) is not None for phase in PHASES)
+        self.result = result
+
+    def as_dict(self):
+        values = {name: getattr(self, name) for name in self.__slots__}
+        if self.result is not None:
+            values['result'] = self.result.to_dict()
+        return values
+
+    def __repr__(self):
+        if self.result is not None:
+            return "CycleLatency(%s: %s)" % (self.command, self.result.status)
+        fmt = lambda v: '-' if v is None else '%.1fms' % (v * 1000.0)
+        return "CycleLatency(%s: departure %s, arrival %s, node %s, descriptors %s, total %s)" % (
+            self.command, fmt(self.to_departure), fmt(self.to_arrival),
+            fmt(self.to_node), fmt(self.to_descriptors), fmt(self.total))
+
+
+def cycles_from_events(events):
+    """
+    Split an event stream into per-cycle latency breakdowns.
+
+    A cycle starts at each COMMAND event; the first occurrence of
+    every later phase up to the next COMMAND belongs to it.
+
+    Args:
+        events (iterable): TraceEvent objects in time order.
+
+    Returns:
+        list: CycleLatency per command.
+
+    Raises:
+        None
+    """
+    cycles = []
+    cycle = None
+    for event in events:
+        if event.kind == COMMAND:
+            if cycle is not None:
+                cycles.append(CycleLatency(cycle[0].detail, _phase_times(cycle)))
+            cycle = []
+        if cycle is not None:
+            cycle.append(event)
+    if cycle is not None:
+        cycles.append(CycleLatency(cycle[0].detail, _phase_times(cycle)))
+    return cycles
+
+
+def _phase_times(cycle):
+    """
+    Timestamps of one cycle: the first occurrence of every phase
+    in events that start at its COMMAND event.
+    """
+    times = {}
+    for event in cycle:
+        if event.kind in PHASES:
+            times.setdefault(event.kind, event.time)
+    return times
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Attributes:
+        bounds (tuple): Bucket upper bounds in seconds.
+        counts (list): Samples per bucket; the last bucket counts
+            samples above the largest bound.
+    """
+    DEFAULT_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.samples = []
+
+    def add(self, value):
+        if value is None:
+            return
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.samples.append(value)
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+
+    def as_dict(self):
+        labels = ['le_%g' % bound for bound in self.bounds] + ['gt_%g' % self.bounds[-1]]
+        return {
+            'count': len(self.samples),
+            'min': min(self.samples) if self.samples else None,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p99': self.percentile(0.99),
+            'max': max(self.samples) if self.samples else None,
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+def histograms(cycles):
+    """
+    Build one histogram per latency phase.
+
+    Args:
+        cycles (iterable): CycleLatency objects.
+
+    Returns:
+        dict: Phase name -> LatencyHistogram.
+
+    Raises:
+        None
+    """
+    result = {name: LatencyHistogram()
+              for name in ('to_departure', 'to_arrival', 'to_node', 'to_descriptors', 'total')}
+    for cycle in cycles:
+        for name, histogram in result.items():
+            histogram.add(getattr(cycle, name))
+    return result
+
+
+def read_events(path):
+    """
+    Read a recorded event stream (one JSON object per line).
+    """
+    with open(path) as f:
+        return [TraceEvent.from_json(line) for line in f if line.strip()]
+
+
+def replay(path):
+    """
+    Rebuild latency breakdowns and histograms from a recorded stream.
+
+    Args:
+        path (str): Event file written by ReenumTracer(record=...).
+
+    Returns:
+        tuple: (list of CycleLatency, dict of LatencyHistogram).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    cycles = cycles_from_events(read_events(path))
+    return cycles, histograms(cycles)
+
+
+class _UeventListener:
+    """
+    Netlink uevent listener reporting add/remove of one USB port path.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.events = queue.Queue()
+        self._sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM,
+                                   NETLINK_KOBJECT_UEVENT)
+        self._sock.bind((0, 1))
+        self._sock.settimeout(0.1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='mutt-uevent', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                message = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            now = time.monotonic()
+            header, _, body = message.partition(b'\0')
+            action, _, devpath = header.decode('ascii', 'replace').partition('@')
+            props = dict(item.split('=', 1) for item in
+                         body.decode('ascii', 'replace').split('\0') if '=' in item)
+            if props.get('DEVTYPE') != 'usb_device':
+                continue
+            if os.path.basename(devpath) != self.path:
+                continue
+            if action == 'remove':
+                self.events.put(TraceEvent(now, DEPARTURE, devpath))
+            elif action == 'add':
+                self.events.put(TraceEvent(now, ARRIVAL, devpath))
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self._sock.close()
+
+
+class ReenumTracer:
+    """
+    Trace re-enumeration of one MUTT after reconnect or speed change.
+
+    Attributes:
+        session (MuttSession): Session used to issue commands.
+        path (str): sysfs bus/port path of the MUTT (e.g. '1-4.2').
+        sysfs_root (str): sysfs USB devices directory.
+        dev_root (str): usbfs device node directory.
+        poll_interval (float): sysfs polling interval in seconds.
+        events (list): Every TraceEvent observed so far.
+    """
+    def __init__(self, session, path, source='auto', sysfs_root=SYSFS_USB_DEVICES,
+                 dev_root='/dev/bus/usb', poll_interval=0.0005, record=None):
+        """
+        Initialize re-enumeration tracer.
+
+        Args:
+            session (MuttSession): Session used to issue commands.
+            path (str): Bus/port path of the MUTT.
+            source (str): 'uevent', 'sysfs' or 'auto' (uevent when
+                netlink is available, sysfs polling otherwise).
+            sysfs_root (str): sysfs USB devices directory.
+            dev_root (str): usbfs device node directory.
+            poll_interval (float): Polling interval in seconds.
+            record (str): Optional file appending every event as JSON.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If source is 'uevent' and netlink is unavailable,
+                or the record file cannot be opened.
+        """
+        self.session = session
+        self.path = path
+        self.sysfs_root = sysfs_root
+        self.dev_root = dev_root
+        self.poll_interval = poll_interval
+        self.events = []
+        self._record = None
+        self._uevents = None
+        if source in ('uevent', 'auto'):
+            try:
+                self._uevents = _UeventListener(path)
+            except (OSError, AttributeError):
+                if source == 'uevent':
+                    raise
+        if record:
+            try:
+                self._record = open(record, 'a')
+            except OSError:
+                self.close()
+                raise
+
+    def close(self):
+        if self._uevents is not None:
+            self._uevents.close()
+            self._uevents = None
+        if self._record is not None:
+            self._record.close()
+            self._record = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _emit(self, kind, detail='', when=None):
+        event = TraceEvent(time.monotonic() if when is None else when, kind, detail)
+        self.events.append(event)
+        if self._record is not None:
+            self._record.write(event.to_json() + '\n')
+            self._record.flush()
+        return event
+
+    def _sysdir(self):
+        return os.path.join(self.sysfs_root, self.path)
+
+    def _devnum(self):
+        try:
+            with open(os.path.join(self._sysdir(), 'devnum')) as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _node(self):
+        try:
+            with open(os.path.join(self._sysdir(), 'busnum')) as f:
+                busnum = int(f.read())
+        except (OSError, ValueError):
+            return None
+        devnum = self._devnum()
+        if devnum is None:
+            return None
+        return os.path.join(self.dev_root, '%03d' % busnum, '%03d' % devnum)
+
+    def _descriptors_readable(self):
+        try:
+            with open(os.path.join(self._sysdir(), 'descriptors'), 'rb') as f:
+                return len(f.read()) >= _DEVICE_DESCRIPTOR_LENGTH
+        except OSError:
+            return False
+
+    def _wait(self, predicate, deadline):
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(self.poll_interval)
+        return False
+
+    def _wait_uevent(self, kind, deadline):
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                event = self._uevents.events.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if event.kind == kind:
+                return event
+
+    def _trace(self, command, issue, timeout):
+        if self._uevents is not None:
+            # Drop events left over from an earlier cycle
+            while not self._uevents.events.empty():
+                self._uevents.events.get_nowait()
+        old_devnum = self._devnum()
+        self._emit(COMMAND, command)
+        result = issue()
+        if not result:
+            # Rejected or never reached the MUTT: nothing will re-enumerate
+            return CycleLatency(command, self._times_since_command(), result)
+        deadline = time.monotonic() + timeout
+
+        if self._uevents is not None:
+            for kind in (DEPARTURE, ARRIVAL):
+                event = self._wait_uevent(kind, deadline)
+                if event is None:
+                    return CycleLatency(command, self._times_since_command())
+                self._emit(kind, event.detail, event.time)
+        else:
+            sysdir = self._sysdir()
+            # The device is gone once its sysfs directory disappears or,
+            # if the gap was too short to observe, its address changes.
+            gone = lambda: (not os.path.isdir(sysdir)
+                            or self._devnum() not in (None, old_devnum))
+            if not self._wait(gone, deadline):
+                return CycleLatency(command, self._times_since_command())
+            self._emit(DEPARTURE, self.path)
+            back = lambda: os.path.isdir(sysdir) and self._devnum() not in (None, old_devnum)
+            if not self._wait(back, deadline):
+                return CycleLatency(command, self._times_since_command())
+            self._emit(ARRIVAL, self.path)
+
+        node = lambda: self._node() is not None and os.path.exists(self._node())
+        if self._wait(node, deadline):
+            self._emit(NODE, self._node())
+            if self._wait(self._descriptors_readable, deadline):
+                self._emit(DESCRIPTORS, self.path)
+        return CycleLatency(command, self._times_since_command())
+
+    def _times_since_command(self):
+        # Same rule as cycles_from_events, for the cycle in progress
+        start = len(self.events) - 1
+        while start > 0 and self.events[start].kind != COMMAND:
+            start -= 1
+        return _phase_times(self.events[start:])
+
+    def trace_reconnect(self, delay_disconnect_ms, delay_reconnect_ms, timeout=15.0):
+        """
+        Reconnect the MUTT and trace its re-enumeration.
+
+        Args:
+            delay_disconnect_ms (int): Delay before disconnect (ms).
+            delay_reconnect_ms (int): Delay before reconnect (ms).
+            timeout (float): Seconds to wait for the full cycle, on
+                top of the requested delays.
+
+        Returns:
+            CycleLatency: Latency breakdown of the cycle; when the
+            command fails it returns at once, with the CommandResult
+            in its result attribute.
+
+        Raises:
+            usb.core.USBError: If the command fails.
+        """
+        command = 'reconnect %d %d' % (delay_disconnect_ms, delay_reconnect_ms)
+        return self._trace(
+            command,
+            lambda: self.session.reconnect(delay_disconnect_ms, delay_reconnect_ms),
+            timeout + (delay_disconnect_ms + delay_reconnect_ms) / 1000.0)
+
+    def trace_speed(self, speed_type, timeout=15.0):
+        """
+        Change the MUTT speed and trace its re-enumeration.
+
+        Args:
+            speed_type (str): 's', 'h' or 'f'.
+            timeout (float): Seconds to wait for the full cycle.
+
+        Returns:
+            CycleLatency: Latency breakdown of the cycle; when the
+            command fails it returns at once, with the CommandResult
+            in its result attribute.
+
+        Raises:
+            usb.core.USBError: If the command fails.
+        """
+        return self._trace('speed %s' % speed_type,
+                           lambda: self.session.set_speed(speed_type), timeout)
+
+    def cycles(self):
+        """
+        Latency breakdowns of every traced cycle.
+        """
+        return cycles_from_events(self.events)
+
+    def histograms(self):
+        """
+        Per-phase latency histograms of every traced cycle.
+        """
+        return histograms(self.cycles())
@@ -0,0 +1,127 @@
+##############################################################################
+#
+# Module: results.py
+#
+# Description:
+#     Typed outcome of every MUTT command. Controllers return a
+#     CommandResult instead of printing, so callers learn the
+#     status, the raw response and the transfer time without
+#     scraping stdout.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+# (None)
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+# Command completed
+OK = 'ok'
+# The MUTT did not accept the request (short or failed transfer)
+FAILED = 'failed'
+# The MUTT answered but reported nothing (e.g. no power contract)
+NO_RESPONSE = 'no_response'
+# No device handle: the MUTT is not attached
+NOT_FOUND = 'not_found'
+# Rejected before any transfer (bad argument)
+INVALID = 'invalid'
+# Transfers timed out or the operation deadline expired
+TIMEOUT = 'timeout'
+
+# Values passed through to_dict() unchanged; others become text
+_JSON_TYPES = (bool, int, float, str, list, tuple, dict)
+
+
+class CommandResult:
+    """
+    Outcome of one MUTT command.
+
+    A result is true only when the status is OK, so
+    ``if session.set_speed('s'):`` reads naturally.
+
+    Attributes:
+        command (str): Command name, e.g. 'set_speed'.
+        status (str): OK, FAILED, NO_RESPONSE, NOT_FOUND, INVALID or
+            TIMEOUT.
+        value (object): Decoded value (RdoResult, PowerRoleResult,
+            speed letter, ...) or None.
+        raw (bytes): Raw response bytes, or None for OUT commands.
+        duration (float): Time spent in the transfers, in seconds.
+        message (str): Short human-readable detail, or None.
+    """
+    __slots__ = ('command', 'status', 'value', 'raw', 'duration', 'message')
+
+    def __init__(self, command, status, value=None, raw=None, duration=0.0, message=None):
+        self.command = command
+        self.status = status
+        self.value = value
+        self.raw = raw
+        self.duration = duration
+        self.message = message
+
+    @property
+    def ok(self):
+        return self.status == OK
+
+    def __bool__(self):
+        return self.status == OK
+
+    def __repr__(self):
+        text = "CommandResult(%s, %s" % (self.command, self.status)
+        if self.value is not None:
+            text += ", %s" % (self.value,)
+        if self.message:
+            text += ", %r" % self.message
+        return text + ", %.6fs)" % self.duration
+
+    def to_dict(self):
+        """
+        Convert to a JSON-serializable dict.
+
+        Args:
+            None
+
+        Returns:
+            dict: command, status, value (as text), raw (hex),
+            duration and message.
+
+        Raises:
+            None
+        """
+        value = self.value
+        if value is not None and not isinstance(value, _JSON_TYPES):
+            value = str(value)
+        return {
+            'command': self.command,
+            'status': self.status,
+            'value': value,
+            'raw': bytes(self.raw).hex() if self.raw is not None else None,
+            'duration': self.duration,
+            'message': self.message,
+        }
+
+
+def not_found(command):
+    """
+    Result of a command issued without an attached MUTT.
+
+    Args:
+        command (str): Command name.
+
+    Returns:
+        CommandResult: NOT_FOUND result.
+
+    Raises:
+        None
+    """
+    return CommandResult(command, NOT_FOUND, message="Device not found")
@@ -0,0 +1,1010 @@
+##############################################################################
+#
+# Module: session.py
+#
+# Description:
+#     Persistent session for the Type-C MUTT device. The session
+#     resolves the device once, caches the USB backend and the open
+#     device handle, and exposes the operations of every controller
+#     as methods so repeated commands skip the libusb bus enumeration.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+import os
+import threading
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+from .cdstress_off import CDstressOFFController
+from .cdstress_on import CDstressONController
+from .emulate_charge import ChargeController
+from .findDevice import SYSFS_USB_DEVICES, FindDeviceController, device_path
+from .getpower_role import getpowerRoleController
+from .getrdo import getrdoController
+from .hooks import HookedDevice
+from .pdcaptive_cables import PDCaptiveCablesController
+from .pdcharger_port import PDChargerPortController
+from .reconnect import ReconnectController
+from .readcache import ReadCache
+from .results import TIMEOUT, CommandResult, not_found
+from .set_speed import DeviceController
+from .shadow import DeviceShadow
+
+VENDOR_ID = 0x045E
+PRODUCT_ID = 0x078F
+
+# Seconds a stale handle's MUTT gets to re-enumerate, and the
+# first / largest poll interval while waiting for it
+REENUM_TIMEOUT = 5.0
+_REENUM_POLL = 0.01
+_REENUM_POLL_MAX = 0.2
+
+# libusb error codes meaning the cached handle no longer
+# refers to an attached device (it has re-enumerated). Only
+# NO_DEVICE qualifies: after an IO error the request may have
+# reached the MUTT, and writes such as reconnect must not be sent
+# twice.
+_STALE_BACKEND_ERRORS = (-4,)        # LIBUSB_ERROR_NO_DEVICE
+_STALE_ERRNOS = (errno.ENODEV,)
+
+
+def _is_stale(error):
+    """
+    Check whether a USB error indicates a stale device handle.
+
+    Args:
+        error (usb.core.USBError): Error raised by a transfer.
+
+    Returns:
+        bool: True if the device has gone away, False otherwise.
+
+    Raises:
+        None
+    """
+    return (getattr(error, 'backend_error_code', None) in _STALE_BACKEND_ERRORS
+            or getattr(error, 'errno', None) in _STALE_ERRNOS)
+
+
+class MuttSession:
+    """
+    Persistent session bound to one Type-C MUTT device.
+
+    The device is located on first use and the handle is reused
+    by every subsequent command. When the handle goes stale (for
+    example after a reconnect or a speed change re-enumerates the
+    MUTT) the session waits for the device to come back on the same
+    port, up to reenum_timeout, and retries once.
+
+    A session may be shared between threads: its commands run one
+    at a time, and mailbox queries hold the lock of their device
+    (locks.device_lock) against other sessions on the same MUTT.
+
+    Attributes:
+        vendor_id (int): USB Vendor ID of DUT device.
+        product_id (int): USB Product ID of DUT device.
+        serial_number (str): Serial number pinning the session to
+            one MUTT when several are attached, or None.
+        path (str): Bus/port path pinning the session to one USB
+            port, or None.
+        backend (usb.backend.IBackend): Cached pyusb backend.
+        transport (object): Device source replacing pyusb, or None.
+        timeout_policy (TimeoutPolicy): Timeouts, deadline and
+            retries of every command, or None for pyusb defaults.
+        shadow (DeviceShadow): Settings last confirmed on the MUTT,
+            used to skip redundant writes, or None.
+        read_cache (ReadCache): Cache of RDO and power role answers,
+            or None.
+        reenum_timeout (float): Seconds to wait for a re-enumerating
+            MUTT before a command reports NOT_FOUND.
+        device (usb.core.Device): Cached USB device instance.
+    """
+    def __init__(self, vendor_id=VENDOR_ID, product_id=PRODUCT_ID,
+                 backend=None, device=None, serial_number=None, path=None,
+                 transport=None, timeout_policy=None, shadow=False,
+                 cache_ttl=None, reenum_timeout=REENUM_TIMEOUT):
+        """
+        Initialize MUTT session.
+
+        Args:
+            vendor_id (int): USB Vendor ID.
+            product_id (int): USB Product ID.
+            backend (usb.backend.IBackend): Optional pyusb backend;
+                resolved once on first open when omitted.
+            device (usb.core.Device): Optional already located device.
+            serial_number (str): Optional serial number used to
+                locate the same MUTT again after re-enumeration.
+            path (str): Optional bus/port path (for example '1-4.2')
+                used the same way; cheaper to match than the serial
+                number since it needs no string descriptor read.
+            transport (object): Optional device source used instead
+                of pyusb, such as simulator.SimulatedBus. It provides
+                ``find(**kwargs)`` following usb.core.find and
+                ``dispose(device)``.
+            timeout_policy (TimeoutPolicy): Optional transfer timeouts,
+                operation deadlines and retries of transient errors.
+            shadow (bool): Skip writes of settings already active on
+                the MUTT (see shadow.DeviceShadow).
+            cache_ttl (float or dict): Seconds to reuse get_rdo and
+                get_power_role answers, or a dict of query name to
+                seconds (see readcache.ReadCache). Write commands
+                empty the cache.
+            reenum_timeout (float): Seconds a command waits for the
+                MUTT to re-enumerate when its handle has gone stale,
+                for example right after set_speed or reconnect.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.backend = backend
+        self.transport = transport
+        self.serial_number = serial_number
+        self.path = path
+        self.device = device
+        self.reenum_timeout = reenum_timeout
+        self._controllers = {}
+        self._command_listeners = []
+        self._transfer_hooks = []
+        self._hooked = None
+        self.timeout_policy = timeout_policy
+        # Budget of the command running under the timeout policy;
+        # created with the first policy run, so pyusb (imported by
+        # timeouts) loads no earlier than the first command
+        self._budget = None
+        self._timed = None
+        # Per-thread deadline of the call in progress, see set_call_deadline
+        self._call = threading.local()
+        # Serializes commands and handle changes of this session
+        self._lock = threading.RLock()
+        self.shadow = DeviceShadow() if shadow else None
+        if self.shadow is not None and device is not None:
+            self.shadow.attach(device)
+        self.read_cache = None
+        if cache_ttl is not None:
+            self.read_cache = ReadCache(cache_ttl)
+            self.add_command_listener(self.read_cache.invalidate)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Locate the USB device unless a handle is already cached.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if device available, False otherwise.
+
+        Raises:
+            usb.core.NoBackendError: If no pyusb backend is available.
+        """
+        with self._lock:
+            return self._open()
+
+    def _open(self, path=None):
+        if self.device is not None:
+            return True
+
+        path = path or self.path
+        match = {}
+        if self.serial_number is not None or path is not None:
+            match['custom_match'] = lambda device: self._match(device, path)
+
+        if self.transport is not None:
+            self.device = self.transport.find(
+                idVendor=self.vendor_id,
+                idProduct=self.product_id,
+                **match
+            )
+        else:
+            import usb.core
+
+            if self.backend is None:
+                self.backend = _resolve_backend()
+
+            self.device = usb.core.find(
+                idVendor=self.vendor_id,
+                idProduct=self.product_id,
+                backend=self.backend,
+                **match
+            )
+        if self.device is None:
+            return False
+        if self.shadow is not None:
+            # Possibly a re-enumerated or re-plugged MUTT
+            self.shadow.attach(self.device)
+        return True
+
+    def _match(self, device, path):
+        """
+        Match a candidate device against a path and the pinned serial number.
+
+        Args:
+            device (usb.core.Device): Candidate device.
+            path (str): Bus/port path to match, or None for any.
+
+        Returns:
+            bool: True if the device matches.
+
+        Raises:
+            None
+        """
+        if path is not None and device_path(device) != path:
+            return False
+        if self.serial_number is None:
+            return True
+        # usb.core.USBError is an OSError: catching that needs no pyusb
+        try:
+            return device.serial_number == self.serial_number
+        except (OSError, ValueError):
+            return False
+
+    def close(self):
+        """
+        Release the cached device handle.
+
+        The backend stays cached, so a later open only pays for
+        the device lookup.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            if self.transport is not None and self.device is not None:
+                self.transport.dispose(self.device)
+            elif self.device is not None:
+                import usb.core
+                import usb.util
+
+                if isinstance(self.device, usb.core.Device):
+                    try:
+                        usb.util.dispose_resources(self.device)
+                    except usb.core.USBError:
+                        pass
+            self.device = None
+            if self.shadow is not None:
+                self.shadow.detach()
+            if self.read_cache is not None:
+                self.read_cache.invalidate()
+
+    def _controller(self, cls):
+        """
+        Return the cached controller of a class bound to the handle.
+
+        Args:
+            cls (type): Controller class.
+
+        Returns:
+            object: Controller instance sharing the session device.
+
+        Raises:
+            None
+        """
+        controller = self._controllers.get(cls)
+        if controller is None:
+            controller = cls(self.vendor_id, self.product_id)
+            self._controllers[cls] = controller
+        controller.device = self._handle()
+        return controller
+
+    def _handle(self):
+        """
+        Device handle given to controllers: the cached device, wrapped
+        in a HookedDevice while transfer hooks are registered and in
+        a TimedDevice while a call deadline or timeout policy is set.
+        """
+        handle = self.device
+        if handle is None:
+            return None
+        if self._transfer_hooks:
+            hooked = self._hooked
+            if hooked is None or hooked.device is not handle:
+                identity = self.serial_number or self.path or device_path(handle)
+                hooked = self._hooked = HookedDevice(handle, identity,
+                                                     self._transfer_hooks)
+            handle = hooked
+        deadline = getattr(self._call, 'deadline', None)
+        if deadline is not None:
+            from .timeouts import Budget, TimedDevice
+
+            handle = TimedDevice(handle, Budget(deadline=deadline))
+        if self.timeout_policy is not None:
+            timed = self._timed
+            if timed is None or timed.device is not handle:
+                from .timeouts import TimedDevice
+
+                timed = self._timed = TimedDevice(handle, self._policy_budget())
+            handle = timed
+        return handle
+
+    def _run(self, cls, method, *args):
+        """
+        Run a controller operation on the cached handle.
+
+        Args:
+            cls (type): Controller class.
+            method (str): Controller method name, also the command
+                name looked up in the timeout policy and read cache.
+            *args: Arguments passed to the method.
+
+        Returns:
+            object: Controller method result, or a NOT_FOUND
+            CommandResult when the device is not found.
+
+        Raises:
+            usb.core.USBError: If USB communication fails for a
+                reason other than a stale handle.
+        """
+        cache = self.read_cache
+        if cache is not None and not args and cache.caches(method):
+            # Outside the session lock, so concurrent callers can
+            # join the read in flight instead of queueing behind it
+            return cache.get(method, lambda: self._locked_run(cls, method, args))
+        return self._locked_run(cls, method, args)
+
+    def _locked_run(self, cls, method, args):
+        with self._lock:
+            if self.timeout_policy is not None:
+                return self._run_timed(method, cls, method, args)
+            return self._attempt(method, cls, method, args)
+
+    def _attempt(self, command, cls, method, args):
+        """
+        Run an operation once, re-resolving a re-enumerated MUTT.
+        """
+        if not self.open():
+            return not_found(command)
+
+        # usb.core.USBError is an OSError: catching that needs no pyusb
+        try:
+            return getattr(self._controller(cls), method)(*args)
+        except OSError as e:
+            if not _is_stale(e):
+                raise
+
+        # The MUTT re-enumerated under us; resolve it again once, on
+        # the same port so an unpinned session keeps its device.
+        path = self.path or device_path(self.device)
+        self.close()
+        if not self._reopen(path):
+            return not_found(command)
+        return getattr(self._controller(cls), method)(*args)
+
+    def _reopen(self, path):
+        """
+        Poll for the MUTT at ``path`` until it is back on the bus.
+
+        Waits at most reenum_timeout, cut to the operation deadline
+        of the timeout policy.
+
+        Args:
+            path (str): Bus/port path the MUTT re-enumerates on.
+
+        Returns:
+            bool: True if the device was found again.
+
+        Raises:
+            None
+        """
+        deadline = time.monotonic() + self.reenum_timeout
+        if self._budget is not None and self._budget.deadline is not None:
+            deadline = min(deadline, self._budget.deadline)
+        delay = _REENUM_POLL
+        while not self._open(path):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _REENUM_POLL_MAX)
+        return True
+
+    def _run_timed(self, command, cls, method, args):
+        """
+        Run an operation within the timeout policy.
+
+        Every transfer gets the command timeout, cut to the time left
+        before the operation deadline. Transient errors are retried
+        with bounded exponential backoff while retries and time are
+        left.
+
+        Args:
+            command (str): Command name for the policy and results.
+            cls (type): Controller class.
+            method (str): Controller method name.
+            args (tuple): Arguments passed to the method.
+
+        Returns:
+            object: Controller method result, or a TIMEOUT
+            CommandResult when the deadline expired or transfers kept
+            timing out.
+
+        Raises:
+            usb.core.USBError: If a non-transient error occurs, or a
+                transient one other than a timeout persists.
+        """
+        from .timeouts import DeadlineExceeded, is_timeout, is_transient
+
+        policy = self.timeout_policy
+        stats = policy.stats
+        timeout, seconds, retries = policy.resolve(command)
+        began = time.monotonic()
+        budget = self._policy_budget()
+        budget.timeout = timeout
+        budget.deadline = None if seconds is None else began + seconds
+        budget.command = command
+        stats.count(command, 'operations')
+        attempt = 0
+        try:
+            while True:
+                try:
+                    result = self._attempt(command, cls, method, args)
+                except OSError as e:
+                    error = e
+                else:
+                    if attempt:
+                        stats.count(command, 'recovered')
+                    return result
+
+                if isinstance(error, DeadlineExceeded):
+                    stats.count(command, 'deadline_exceeded')
+                    return self._timed_out(command, began, str(error))
+                if is_timeout(error):
+                    stats.count(command, 'timeouts')
+                if not is_transient(error):
+                    raise error
+                delay = policy.backoff_delay(attempt)
+                if attempt >= retries or (budget.deadline is not None
+                                          and time.monotonic() + delay >= budget.deadline):
+                    stats.count(command, 'gave_up')
+                    if is_timeout(error):
+                        return self._timed_out(command, began, str(error))
+                    raise error
+                stats.count(command, 'retries')
+                stats.count(command, 'backoff_seconds', delay)
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            budget.timeout = budget.deadline = budget.command = None
+
+    def _policy_budget(self):
+        budget = self._budget
+        if budget is None:
+            from .timeouts import Budget
+
+            budget = self._budget = Budget()
+        return budget
+
+    def _timed_out(self, command, began, message):
+        return CommandResult(command, TIMEOUT, duration=time.monotonic() - began,
+                             message=message)
+
+    def _write(self, command, cls, method, *args, force=False):
+        """
+        Run a state-changing controller operation and notify listeners.
+
+        With a shadow, a write that would not change the MUTT is
+        skipped unless forced; listeners are not notified of it.
+
+        Args:
+            command (str): Session command name.
+            cls (type): Controller class.
+            method (str): Controller method name.
+            *args: Arguments passed to the method.
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            object: Controller method result.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        with self._lock:
+            shadow = self.shadow
+            if shadow is not None and not force:
+                skipped = shadow.unchanged(command, args, self._confirm_device)
+                if skipped is not None:
+                    return skipped
+            try:
+                if self.timeout_policy is not None:
+                    result = self._run_timed(command, cls, method, args)
+                else:
+                    result = self._attempt(command, cls, method, args)
+            except Exception as e:
+                # The write may have reached the MUTT: drop what the
+                # shadow and the listeners (read cache) hold about it
+                if shadow is not None:
+                    shadow.forget(command)
+                self._notify(command, args, e)
+                raise
+            if shadow is not None:
+                shadow.record(command, args, result)
+            self._notify(command, args, result)
+        return result
+
+    def _confirm_device(self):
+        """
+        Check that the cached handle still addresses the MUTT.
+
+        A MUTT unplugged and plugged back between commands is at its
+        power-on defaults under a new address, while the handle keeps
+        the old one. On Linux sysfs tells without touching the bus;
+        elsewhere the port is looked up again. A handle that no
+        longer matches is replaced: the shadow starts over on the new
+        one, unless the MUTT was re-enumerating after a recorded
+        set_speed or reconnect.
+
+        Returns:
+            bool: True if the session holds a current handle.
+        """
+        device = self.device
+        if device is None:
+            return False
+        path = device_path(device)
+        address = getattr(device, 'address', None)
+        if self.transport is None and os.path.isdir(SYSFS_USB_DEVICES):
+            try:
+                with open(os.path.join(SYSFS_USB_DEVICES, path, 'devnum')) as f:
+                    same = int(f.read()) == address
+            except (OSError, ValueError):
+                same = False
+        else:
+            if self.transport is not None:
+                find = self.transport.find
+            else:
+                import usb.core
+
+                find = usb.core.find
+            current = find(idVendor=self.vendor_id, idProduct=self.product_id,
+                           backend=self.backend,
+                           custom_match=lambda candidate: device_path(candidate) == path)
+            same = current is not None and current.address == address
+        if same:
+            return True
+        self.close()
+        return self._reopen(path)
+
+    def _notify(self, command, args, result):
+        # Called under the lock: no other command sees the device
+        # before the listeners have
+        for listener in self._command_listeners:
+            listener(command, args, result)
+
+    def set_call_deadline(self, deadline):
+        """
+        Bound the transfers of the commands issued by this thread.
+
+        Every transfer timeout is cut to the time left before the
+        deadline; once it has passed no transfer is started. Other
+        threads sharing the session are not affected.
+
+        Args:
+            deadline (float): time.monotonic() deadline, or None to
+                clear it.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._call.deadline = deadline
+
+    def add_command_listener(self, listener):
+        """
+        Register a callable notified after every write command.
+
+        The listener is called as ``listener(command, args, result)``
+        after set_speed, set_charge, set_profile, cdstress_on, cdstress_off,
+        pd_captive_cables, pd_charger_port and reconnect. When the
+        write raised, ``result`` is the exception, re-raised after
+        the listeners ran.
+
+        Args:
+            listener (callable): Listener to add.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._command_listeners.append(listener)
+
+    def remove_command_listener(self, listener):
+        """
+        Unregister a command listener.
+
+        Args:
+            listener (callable): Listener to remove.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        self._command_listeners.remove(listener)
+
+    def add_transfer_hook(self, hook):
+        """
+        Register a callable notified after every control transfer.
+
+        The hook is called as ``hook(event)`` with a
+        hooks.TransferEvent, from the thread that issued the
+        transfer, also when the transfer raised.
+
+        Args:
+            hook (callable): Hook to add.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._transfer_hooks.append(hook)
+
+    def remove_transfer_hook(self, hook):
+        """
+        Unregister a transfer hook.
+
+        Args:
+            hook (callable): Hook to remove.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._transfer_hooks.remove(hook)
+
+    def find_devices(self):
+        """
+        List all matching MUTT devices with descriptor details.
+
+        Args:
+            None
+
+        Returns:
+            list: List of dictionaries containing device details.
+
+        Raises:
+            usb.core.USBError: If descriptor retrieval fails.
+        """
+        return FindDeviceController(self.vendor_id, self.product_id).find_device()
+
+    def set_speed(self, speed_type, force=False):
+        """
+        Set MUTT USB operating speed ('s', 'h' or 'f').
+
+        Args:
+            speed_type (str): Desired speed mode.
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('set_speed', DeviceController, 'set_device_speed', speed_type,
+                           force=force)
+
+    def set_charge(self, watts, force=False):
+        """
+        Emulate a PD charger with max watts.
+
+        Args:
+            watts (int): Desired charger wattage.
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('set_charge', ChargeController, 'set_charge', watts, force=force)
+
+    def set_profile(self, profile, force=False):
+        """
+        Emulate a PD charger advertising the given source PDOs.
+
+        Args:
+            profile (PdProfile): Source capabilities to advertise.
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('set_profile', ChargeController, 'set_profile', profile,
+                           force=force)
+
+    def get_rdo(self):
+        """
+        Read the RDO for the current power contract.
+
+        Args:
+            None
+
+        Returns:
+            CommandResult: Decoded RdoResult in value; status
+            NO_RESPONSE if no power contract.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._run(getrdoController, 'get_rdo')
+
+    def read_rdo(self, buffer=None):
+        """
+        Read the raw 16-byte RDO response without printing.
+
+        Args:
+            buffer (array.array): Optional 16-byte array to read into.
+
+        Returns:
+            array.array: Response bytes, or None if no power contract.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        if self.device is None and not self.open():
+            return None
+        response = self._run(getrdoController, 'read_rdo', buffer)
+        # A NOT_FOUND result is falsy, as is None
+        return response or None
+
+    def get_power_role(self):
+        """
+        Read the current DUT power role.
+
+        Args:
+            None
+
+        Returns:
+            CommandResult: Decoded PowerRoleResult in value.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._run(getpowerRoleController, 'get_power_role')
+
+    def read_power_role(self, buffer=None):
+        """
+        Read the raw 16-byte power role response without printing.
+
+        Args:
+            buffer (array.array): Optional 16-byte array to read into.
+
+        Returns:
+            array.array: Response bytes, or None if not accepted.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        if self.device is None and not self.open():
+            return None
+        response = self._run(getpowerRoleController, 'read_power_role', buffer)
+        # A NOT_FOUND result is falsy, as is None
+        return response or None
+
+    def cdstress_on(self, force=False):
+        """
+        Enable connect-disconnect stress.
+
+        Args:
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('cdstress_on', CDstressONController, 'set_cdstress_on', force=force)
+
+    def cdstress_off(self, force=False):
+        """
+        Disable connect-disconnect stress.
+
+        Args:
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('cdstress_off', CDstressOFFController, 'set_cdstress_off',
+                           force=force)
+
+    def pd_captive_cables(self, force=False):
+        """
+        Switch PD to captive cable.
+
+        Args:
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('pd_captive_cables', PDCaptiveCablesController,
+                           'pd_captive_cables', force=force)
+
+    def pd_charger_port(self, force=False):
+        """
+        Switch PD to charger receptacle.
+
+        Args:
+            force (bool): Send the write even if the shadow has the
+                setting already active.
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('pd_charger_port', PDChargerPortController,
+                           'pd_charger_port', force=force)
+
+    def reconnect(self, delay_disconnect_ms, delay_reconnect_ms):
+        """
+        Disconnect and reconnect the MUTT one time.
+
+        Args:
+            delay_disconnect_ms (int): Delay before disconnect (ms).
+            delay_reconnect_ms (int): Delay before reconnect (ms).
+
+        Returns:
+            CommandResult: Outcome of the command.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return self._write('reconnect', ReconnectController,
+                           'disconnect_and_reconnect',
+                           delay_disconnect_ms, delay_reconnect_ms)
+
+
+def _resolve_backend():
+    """
+    Resolve the first available pyusb backend.
+
+    Uses the same preference order as usb.core.find so the
+    result matches what an uncached lookup would pick.
+
+    Args:
+        None
+
+    Returns:
+        usb.backend.IBackend: Backend, or None if none available.
+
+    Raises:
+        None
+    """
+    import usb.backend.libusb1
+    import usb.backend.openusb
+    import usb.backend.libusb0
+
+    for module in (usb.backend.libusb1, usb.backend.openusb, usb.backend.libusb0):
+        backend = module.get_backend()
+        if backend is not None:
+            return backend
+    return None
+
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def default_session():
+    """
+    Return the process-wide cached MUTT session.
+
+    The module-level entry functions route through this
+    session so only the first command enumerates the bus.
+
+    Args:
+        None
+
+    Returns:
+        MuttSession: Default session.
+
+    Raises:
+        None
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = MuttSession()
+        return _default_session
+
+
+def set_default_session(session):
+    """
+    Replace the process-wide default session.
+
+    Lets the module-level entry functions run on a session of the
+    caller's choice, for example one pinned to a serial number or
+    one using a SimulatedBus transport. The previous default
+    session is closed.
+
+    Args:
+        session (MuttSession): New default session, or None to
+            create a fresh one on next use.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is not None and _default_session is not session:
+            _default_session.close()
+        _default_session = session
+
+
+def close_default_session():
+    """
+    Release the handle held by the default session.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is not None:
+            _default_session.close()
+            _default_session = None
@@ -17,15 +17,22 @@
 #     V2.0.0 Mon Feb 16 2026 17:00:00   Vinay N
 #         Module created
 #
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Issue requests through the vendor command registry
+#         Return CommandResult, report through the event log
+#         Import pyusb on first use
+#
 ##############################################################################
 # Built-in imports
-# (None)
+import time
 
 # Lib imports
-import usb.core
+# (None)
 
 # Own modules
-# (None)
+from .events import INFO, WARNING, emit
+from .results import FAILED, INVALID, OK, CommandResult, not_found
+from .vendor_commands import SPEED_COMMANDS
 
 class DeviceController:
     """
@@ -71,6 +78,8 @@ class DeviceController:
         Raises:
             None
         """
+        import usb.core
+
         self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         return self.device is not None
     
@@ -86,44 +95,40 @@ class DeviceController:
                     'f' → Full Speed
 
         Returns:
-            bool: True if command successful, False otherwise.
+            CommandResult: value is the requested speed type; status
+            INVALID for an unknown speed type.
 
         Raises:
             usb.core.USBError:
                 If USB communication fails.
         """
         if self.device is None:
-            print("Device not found")
-            return False
-        
-        bmRequestType = 0x40
-        if speed_type == 's':
-            bRequest = 0x15  # Super Speed request
-        elif speed_type == 'h':
-            bRequest = 0x14  # High Speed request
-        elif speed_type == 'f':
-            bRequest = 0x13  # Full Speed request
-        else:
-            print("Invalid speed type")
-            return False
-        
-        wValue = 0x0000
-        wIndex = 0x0000
-        wLength = 0x0000
-
-        result = self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex, wLength)
+            emit(WARNING, "Device not found")
+            return not_found('set_speed')
+
+        # 0x15 Super Speed, 0x14 High Speed, 0x13 Full Speed request
+        command = SPEED_COMMANDS.get(speed_type)
+        if command is None:
+            emit(WARNING, "Invalid speed type %r", speed_type)
+            return CommandResult('set_speed', INVALID, speed_type,
+                                 message="Invalid speed type")
+
+        began = time.perf_counter()
+        result = command.issue(self.device)
+        duration = time.perf_counter() - began
 
         if result == 0:
-            print(f"Set {speed_type} speed successfully\n")
-        else:
-            print("Device is not found:\n")
+            emit(INFO, "Set %s speed successfully", speed_type)
+            return CommandResult('set_speed', OK, speed_type, duration=duration)
+        emit(WARNING, "Set %s speed not accepted: %d bytes transferred", speed_type, result)
+        return CommandResult('set_speed', FAILED, speed_type, duration=duration)
 
 def set_speed(speed_type):
     """
     Entry function to configure device speed.
 
-    Initializes controller and applies requested
-    USB speed configuration.
+    Applies requested USB speed configuration
+    through the default cached session.
 
     Args:
         speed_type (str):
@@ -133,14 +138,11 @@ def set_speed(speed_type):
                 'f' → Full Speed
 
     Returns:
-        None
+        CommandResult: Outcome of the speed change.
 
     Raises:
         None
     """
-    VENDOR_ID = 0x045e  # Replace with your vendor ID
-    PRODUCT_ID = 0x078f  # Replace with your product ID
+    from .session import default_session
 
-    controller = DeviceController(VENDOR_ID, PRODUCT_ID)
-    if controller.find_device():
-        controller.set_device_speed(speed_type)
+    return default_session().set_speed(speed_type)
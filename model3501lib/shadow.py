@@ -0,0 +1,277 @@
+##############################################################################
+#
+# Module: shadow.py
+#
+# Description:
+#     Shadow of the settings last confirmed on one MUTT: USB speed,
+#     charger profile, PD routing and CD stress. A session with a
+#     shadow skips writes that would not change anything, so the
+#     defensive set_speed / set_charge / pd_captive_cables /
+#     cdstress_off calls before every test cost no transfer, and an
+#     unchanged speed no re-enumeration.
+#
+#     Only successful writes are recorded; a failed write forgets
+#     its setting. Everything is forgotten when the MUTT reconnects
+#     or re-enumerates, or when the session changes handles. Before
+#     a write is skipped the session confirms that its handle still
+#     addresses the MUTT, so an unplug between commands is noticed.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+
+# Lib imports
+# (None)
+
+# Own modules
+from .pd_profile import profile_for_watts
+from .results import OK, CommandResult
+
+# Write command -> shadowed setting
+_SETTINGS = {
+    'set_speed': 'speed',
+    'set_charge': 'profile',
+    'set_profile': 'profile',
+    'pd_captive_cables': 'route',
+    'pd_charger_port': 'route',
+    'cdstress_on': 'cd_stress',
+    'cdstress_off': 'cd_stress',
+}
+
+# Commands after which the MUTT re-enumerates
+_REENUMERATING = frozenset(('set_speed', 'reconnect'))
+
+
+def _target(command, args):
+    """
+    Setting value a write command asks for, or None if unknown.
+    """
+    if command == 'set_speed':
+        return args[0]
+    if command == 'set_charge':
+        return profile_for_watts(args[0])
+    if command == 'set_profile':
+        return args[0]
+    if command == 'pd_captive_cables':
+        return 'captive'
+    if command == 'pd_charger_port':
+        return 'charger'
+    if command == 'cdstress_on':
+        return True
+    if command == 'cdstress_off':
+        return False
+    return None
+
+
+class DeviceShadow:
+    """
+    Last confirmed settings of one MUTT and skip counters.
+
+    Attributes:
+        state (dict): Setting ('speed', 'profile', 'route',
+            'cd_stress') -> confirmed value; missing when unknown.
+        skipped (dict): Command -> writes skipped.
+        sent (dict): Command -> writes sent.
+        invalidations (int): Times every setting was forgotten.
+    """
+    def __init__(self):
+        self.state = {}
+        self.skipped = {}
+        self.sent = {}
+        self.invalidations = 0
+        # Set by a recorded set_speed / reconnect: the MUTT is
+        # re-enumerating into the recorded state, which the next
+        # handle inherits
+        self._reenumerating = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "DeviceShadow(%r)" % (self.state,)
+
+    def unchanged(self, command, args, confirm=None):
+        """
+        Check whether a write would leave the MUTT as it is.
+
+        Args:
+            command (str): Session write command.
+            args (tuple): Command arguments.
+            confirm (callable): Optional check, called only when the
+                shadow holds the setting, that the MUTT is still the
+                device the shadow describes; False sends the write.
+
+        Returns:
+            CommandResult: OK result to return instead of sending
+            the write, or None if the write must be sent.
+
+        Raises:
+            None
+        """
+        setting = _SETTINGS.get(command)
+        if setting is None:
+            return None
+        target = _target(command, args)
+        if target is None:
+            return None
+        with self._lock:
+            if self.state.get(setting) != target:
+                return None
+        if confirm is not None and not confirm():
+            return None
+        with self._lock:
+            # The confirmation may have moved to a new handle
+            if self.state.get(setting) != target:
+                return None
+            self.skipped[command] = self.skipped.get(command, 0) + 1
+        value = target if setting == 'profile' else None
+        return CommandResult(command, OK, value, message="Already set")
+
+    def record(self, command, args, result):
+        """
+        Update the shadow after a write was sent.
+
+        Has the command listener signature of MuttSession.
+
+        Args:
+            command (str): Session write command.
+            args (tuple): Command arguments.
+            result (object): Command result, or the exception the
+                write raised.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if not (isinstance(result, CommandResult) and result.ok):
+            self.forget(command)
+            return
+        with self._lock:
+            self.sent[command] = self.sent.get(command, 0) + 1
+        if command in _REENUMERATING:
+            self.invalidate()
+        setting = _SETTINGS.get(command)
+        with self._lock:
+            if setting is not None:
+                self.state[setting] = _target(command, args)
+            if command in _REENUMERATING:
+                self._reenumerating = True
+
+    def forget(self, command):
+        """
+        Forget the setting of a write that failed or raised.
+
+        The MUTT may be anywhere between the old and the new setting,
+        so the next write of it is sent.
+
+        Args:
+            command (str): Session write command.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            self.sent[command] = self.sent.get(command, 0) + 1
+        if command in _REENUMERATING:
+            # The MUTT may or may not be re-enumerating
+            self.invalidate()
+        setting = _SETTINGS.get(command)
+        if setting is not None:
+            with self._lock:
+                self.state.pop(setting, None)
+
+    def invalidate(self):
+        """
+        Forget every setting; the next write of each is sent.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            self.state.clear()
+            self._reenumerating = False
+            self.invalidations += 1
+
+    def detach(self):
+        """
+        Note that the session released its handle.
+
+        Everything is forgotten, unless the handle was dropped
+        because the MUTT is re-enumerating after a recorded write.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            if self._reenumerating:
+                return
+        self.invalidate()
+
+    def attach(self, device):
+        """
+        Start over, knowing nothing, on a newly opened handle.
+
+        Only the handle the MUTT comes back with after a recorded
+        set_speed or reconnect inherits the recorded state. The link
+        speed of the handle is what the host negotiated on its port,
+        not the speed the MUTT is set to, so it is never taken.
+
+        Args:
+            device (usb.core.Device): New device handle.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            if self._reenumerating:
+                self._reenumerating = False
+                return
+        self.invalidate()
+
+    def stats(self):
+        """
+        Counters of the shadow.
+
+        Args:
+            None
+
+        Returns:
+            dict: 'skipped' and 'sent' per command, total 'skipped',
+            'invalidations' and the current 'state'.
+
+        Raises:
+            None
+        """
+        with self._lock:
+            return {
+                'skipped': dict(self.skipped),
+                'sent': dict(self.sent),
+                'skipped_total': sum(self.skipped.values()),
+                'invalidations': self.invalidations,
+                'state': dict(self.state),
+            }
@@ -0,0 +1,511 @@
+##############################################################################
+#
+# Module: shards.py
+#
+# Description:
+#     Process-pool fleet executor. Devices are grouped into shards
+#     by USB host controller (the PCI device behind the root hubs on
+#     Linux, the bus number elsewhere) and every shard is served by
+#     one worker process holding persistent sessions for its MUTTs.
+#     Within a shard at most max_in_flight commands - and so control
+#     transfers - run at a time, which keeps one controller from
+#     being flooded; shards run in parallel without sharing a GIL.
+#
+#     Results stream back to the parent as they complete, so a
+#     fleet-wide set_charge or RDO sweep scales with the number of
+#     host controllers.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+# Lib imports
+# (None)
+
+# Own modules
+from .fleet import COMMANDS, FleetResult, MuttFleet, SYSFS_USB_DEVICES
+from .session import MuttSession, PRODUCT_ID, VENDOR_ID
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Seconds close() and discover() let the workers finish their
+# commands before terminating them
+STOP_TIMEOUT = 10.0
+
+# Seconds between checks that the shard workers are still alive
+_POLL_INTERVAL = 0.5
+
+# Seconds a terminated worker gets to exit before it is killed
+_KILL_TIMEOUT = 1.0
+
+
+class ShardError(Exception):
+    """
+    Error raised by a command in a shard worker, or loss of the worker.
+    """
+
+
+def host_controller(bus, sysfs_root=SYSFS_USB_DEVICES):
+    """
+    Identify the host controller of a USB bus.
+
+    On Linux the USB 2 and USB 3 root hubs of one xHCI are two
+    buses under the same PCI device; both map to that device.
+
+    Args:
+        bus (int): USB bus number.
+        sysfs_root (str): sysfs USB devices directory, or None to
+            use the bus number.
+
+    Returns:
+        str: PCI device name such as '0000:00:14.0', or 'bus<N>'
+        when the topology is not available.
+
+    Raises:
+        None
+    """
+    if sysfs_root is not None:
+        root_hub = os.path.join(sysfs_root, 'usb%d' % bus)
+        if os.path.exists(root_hub):
+            return os.path.basename(os.path.dirname(os.path.realpath(root_hub)))
+    return 'bus%d' % bus
+
+
+def _shard_main(devices, transport_factory, vendor_id, product_id,
+                timeout_policy, max_in_flight, requests, results):
+    """
+    Worker process of one shard.
+
+    Keeps one session per device open for the life of the process
+    and runs up to max_in_flight commands at a time.
+    """
+    transport = transport_factory() if transport_factory is not None else None
+    sessions = {path: MuttSession(vendor_id, product_id, serial_number=serial, path=path,
+                                  transport=transport, timeout_policy=timeout_policy)
+                for serial, path in devices}
+
+    def call(job_id, path, command, args):
+        began = time.perf_counter()
+        try:
+            value = getattr(sessions[path], command)(*args)
+            error = None
+        except Exception as e:
+            value = None
+            # Exceptions of pyusb do not survive pickling intact
+            error = "%s: %s" % (type(e).__name__, e)
+        elapsed = time.perf_counter() - began
+        try:
+            # Pickled here, not in the queue feeder thread, so an
+            # unpicklable value still answers the request
+            message = pickle.dumps((job_id, value, error, elapsed))
+        except Exception as e:
+            message = pickle.dumps((job_id, None, "Unpicklable result: %s" % e, elapsed))
+        results.put(message)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight,
+                            thread_name_prefix='mutt-shard') as pool:
+        while True:
+            job = requests.get()
+            if job is None:
+                break
+            pool.submit(call, *job)
+    for session in sessions.values():
+        session.close()
+
+
+class _Shard:
+    """
+    Worker process, request queue and devices of one shard.
+
+    lost is the reason the worker is gone (set once its exit has been
+    noticed), or None while it runs.
+    """
+    def __init__(self, key, entries):
+        self.key = key
+        self.entries = entries
+        self.requests = None
+        self.process = None
+        self.lost = None
+
+
+class ShardedFleet:
+    """
+    Run fleet commands in one worker process per host controller.
+
+    Devices are discovered in the parent, grouped by host controller
+    and handed to the worker processes, which open them. The parent
+    keeps no handle open.
+
+    Attributes:
+        vendor_id (int): USB Vendor ID of DUT devices.
+        product_id (int): USB Product ID of DUT devices.
+        max_in_flight (int): Commands in flight per host controller.
+        transport_factory (callable): Picklable callable returning the
+            device source of each process (see MuttSession
+            ``transport``), or None for pyusb.
+        timeout_policy (TimeoutPolicy): Policy copied to every worker,
+            or None. Each worker counts its own stats.
+        stop_timeout (float): Seconds the workers get to finish their
+            commands when stopped, before they are terminated.
+        devices (list): FleetDevice entries in discovery order.
+        shards (dict): Host controller -> FleetDevice entries.
+    """
+    def __init__(self, vendor_id=VENDOR_ID, product_id=PRODUCT_ID, labels=None,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, transport_factory=None,
+                 timeout_policy=None, start_method='spawn', stop_timeout=STOP_TIMEOUT):
+        """
+        Initialize the sharded fleet; no process starts before discover().
+
+        Args:
+            vendor_id (int): USB Vendor ID.
+            product_id (int): USB Product ID.
+            labels (dict): Optional mapping of serial number or path
+                to user label.
+            max_in_flight (int): Concurrent commands per host controller.
+            transport_factory (callable): Builds the transport in the
+                parent and in every worker, e.g.
+                functools.partial(SimulatedBus, count=32, per_bus=8).
+                Must be picklable and build the same devices each time.
+            timeout_policy (TimeoutPolicy): Optional timeouts of the
+                worker sessions.
+            start_method (str): multiprocessing start method; 'spawn'
+                avoids forking a process that runs threads.
+            stop_timeout (float): Seconds close() and discover() wait
+                for the workers before terminating them; commands
+                still unanswered then fail with a ShardError.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If max_in_flight is below 1.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.max_in_flight = max_in_flight
+        self.transport_factory = transport_factory
+        self.timeout_policy = timeout_policy
+        self.stop_timeout = stop_timeout
+        self.devices = []
+        self.shards = {}
+        self._labels = dict(labels or {})
+        self._context = multiprocessing.get_context(start_method)
+        self._results = None
+        self._shards = []
+        self._by_path = {}
+        self._index = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._collector = None
+        # Stopped or lost shards whose marker the collector has not read
+        self._stopped = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.devices)
+
+    def discover(self):
+        """
+        Scan for MUTTs, group them by host controller and (re)start
+        one worker process per shard.
+
+        Args:
+            None
+
+        Returns:
+            list: FleetDevice entries.
+
+        Raises:
+            usb.core.NoBackendError: If no pyusb backend is available.
+        """
+        self._stop_workers()
+        transport = self.transport_factory() if self.transport_factory is not None else None
+        fleet = MuttFleet(self.vendor_id, self.product_id, labels=self._labels,
+                          transport=transport)
+        try:
+            devices = fleet.discover()
+        finally:
+            # The workers open the devices, not the parent
+            fleet.close()
+        sysfs_root = SYSFS_USB_DEVICES if transport is None else None
+
+        groups = {}
+        for entry in devices:
+            bus = int(entry.path.split('-', 1)[0].split(':', 1)[0])
+            groups.setdefault(host_controller(bus, sysfs_root), []).append(entry)
+
+        self.devices = devices
+        self.shards = groups
+        self._by_path = {}
+        self._index = {}
+        if self._results is None:
+            self._results = self._context.Queue()
+        self._shards = []
+        for key, entries in groups.items():
+            shard = _Shard(key, entries)
+            shard.requests = self._context.Queue()
+            shard.process = self._context.Process(
+                target=_shard_main, name='mutt-shard-%s' % key, daemon=True,
+                args=([(entry.serial, entry.path) for entry in entries],
+                      self.transport_factory, self.vendor_id, self.product_id,
+                      self.timeout_policy, self.max_in_flight,
+                      shard.requests, self._results))
+            shard.process.start()
+            self._shards.append(shard)
+            for entry in entries:
+                self._by_path[entry.path] = shard
+                for name in (entry.serial, entry.path, entry.label):
+                    if name is not None:
+                        self._index[name] = entry
+        if self._collector is None:
+            self._collector = threading.Thread(target=self._collect, daemon=True,
+                                               name='mutt-shard-results')
+            self._collector.start()
+        return devices
+
+    def get(self, key):
+        """
+        Look up a device by serial number, path or label.
+
+        Args:
+            key (str): Serial number, path or label.
+
+        Returns:
+            FleetDevice: Matching device.
+
+        Raises:
+            KeyError: If no device matches.
+        """
+        return self._index[key]
+
+    def select(self, keys=None):
+        """
+        Resolve a subset of devices; None selects every device.
+        """
+        if keys is None:
+            return list(self.devices)
+        if isinstance(keys, str):
+            keys = (keys,)
+        return [self.get(key) for key in keys]
+
+    def _collect(self):
+        next_check = time.monotonic() + _POLL_INTERVAL
+        while True:
+            try:
+                message = self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                return
+            if message is not None:
+                job_id, value, error, elapsed = pickle.loads(message)
+                if job_id is None:
+                    # Marker sent by the parent: None closes the
+                    # collector, otherwise a shard is gone
+                    if value is None:
+                        return
+                    self._fail_shard(self._stopped.pop(value))
+                    continue
+                with self._lock:
+                    pending = self._pending.pop(job_id, None)
+                if pending is not None:
+                    entry, _, future = pending
+                    future.set_result(FleetResult(
+                        entry, value, ShardError(error) if error is not None else None,
+                        elapsed))
+            # Checked on a timer, so a crashed worker is noticed even
+            # while the other shards keep the result queue busy
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + _POLL_INTERVAL
+                for shard in list(self._shards):
+                    if not shard.process.is_alive():
+                        self._mark_lost(shard, "Shard worker exited")
+
+    def _mark_lost(self, shard, reason):
+        """
+        Record that a shard worker is gone and queue its marker.
+
+        The marker reaches the collector after every answer the
+        worker sent before exiting, so only unanswered requests fail.
+        """
+        with self._lock:
+            if shard.lost is not None:
+                return
+            shard.lost = reason
+        self._stopped[id(shard)] = shard
+        self._results.put(pickle.dumps((None, id(shard), None, 0.0)))
+
+    def _fail_shard(self, shard):
+        """
+        Fail the unanswered requests of a shard whose worker is gone.
+        """
+        with self._lock:
+            lost = [job_id for job_id, (_, owner, _) in self._pending.items()
+                    if owner is shard]
+            failed = [self._pending.pop(job_id) for job_id in lost]
+        for entry, _, future in failed:
+            future.set_result(FleetResult(entry, None, ShardError(shard.lost), 0.0))
+
+    def submit(self, command, *args, devices=None):
+        """
+        Send a command to the shard workers without waiting.
+
+        Args:
+            command (str): Session method name, one of fleet.COMMANDS.
+            *args: Picklable command arguments.
+            devices (iterable): Device keys; None for all devices.
+
+        Returns:
+            list: concurrent.futures.Future per device, in selection
+            order, each resolving to a FleetResult.
+
+        Raises:
+            ValueError: If the command is unknown.
+            KeyError: If a device key matches no device.
+        """
+        if command not in COMMANDS:
+            raise ValueError("Unknown fleet command: %r" % (command,))
+        futures = []
+        for entry in self.select(devices):
+            shard = self._by_path[entry.path]
+            job_id = next(self._ids)
+            future = Future()
+            futures.append(future)
+            with self._lock:
+                lost = shard.lost
+                if lost is None:
+                    self._pending[job_id] = (entry, shard, future)
+            if lost is not None:
+                future.set_result(FleetResult(entry, None, ShardError(lost), 0.0))
+                continue
+            shard.requests.put((job_id, entry.path, command, args))
+        return futures
+
+    def stream(self, command, *args, devices=None):
+        """
+        Run a command on several devices, yielding results as they
+        complete.
+
+        Args:
+            command (str): Session method name.
+            *args: Picklable command arguments.
+            devices (iterable): Device keys; None for all devices.
+
+        Returns:
+            iterator: FleetResult per device in completion order.
+
+        Raises:
+            ValueError: If the command is unknown.
+            KeyError: If a device key matches no device.
+        """
+        for future in as_completed(self.submit(command, *args, devices=devices)):
+            yield future.result()
+
+    def run(self, command, *args, devices=None):
+        """
+        Run a command on several devices and wait for all of them.
+
+        Returns:
+            list: FleetResult per device, in selection order.
+        """
+        return [future.result() for future in self.submit(command, *args, devices=devices)]
+
+    def set_speed(self, speed_type, devices=None):
+        return self.run('set_speed', speed_type, devices=devices)
+
+    def set_charge(self, watts, devices=None):
+        return self.run('set_charge', watts, devices=devices)
+
+    def set_profile(self, profile, devices=None):
+        return self.run('set_profile', profile, devices=devices)
+
+    def get_rdo(self, devices=None):
+        return self.run('get_rdo', devices=devices)
+
+    def get_power_role(self, devices=None):
+        return self.run('get_power_role', devices=devices)
+
+    def cdstress_on(self, devices=None):
+        return self.run('cdstress_on', devices=devices)
+
+    def cdstress_off(self, devices=None):
+        return self.run('cdstress_off', devices=devices)
+
+    def pd_captive_cables(self, devices=None):
+        return self.run('pd_captive_cables', devices=devices)
+
+    def pd_charger_port(self, devices=None):
+        return self.run('pd_charger_port', devices=devices)
+
+    def reconnect(self, delay_disconnect_ms, delay_reconnect_ms, devices=None):
+        return self.run('reconnect', delay_disconnect_ms, delay_reconnect_ms,
+                        devices=devices)
+
+    def _stop_workers(self):
+        """
+        Stop every worker, waiting up to stop_timeout for their
+        commands; late workers are terminated and their unanswered
+        requests fail.
+        """
+        for shard in self._shards:
+            if shard.lost is None:
+                shard.requests.put(None)
+        deadline = time.monotonic() + self.stop_timeout
+        for shard in self._shards:
+            shard.process.join(max(0.0, deadline - time.monotonic()))
+            if shard.process.is_alive():
+                shard.process.terminate()
+                shard.process.join(_KILL_TIMEOUT)
+                if shard.process.is_alive():
+                    shard.process.kill()
+                    shard.process.join()
+                self._mark_lost(shard, "Shard worker terminated after %.1fs"
+                                % self.stop_timeout)
+            else:
+                # Answers still queued are delivered first
+                self._mark_lost(shard, "Shard worker exited")
+        self._shards = []
+
+    def close(self):
+        """
+        Let the workers finish their commands, stop them and release
+        their devices. Workers still busy after stop_timeout are
+        terminated and their unanswered commands fail.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._stop_workers()
+        if self._collector is not None:
+            self._results.put(pickle.dumps((None, None, None, 0.0)))
+            self._collector.join()
+            self._collector = None
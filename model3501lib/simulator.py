@@ -0,0 +1,454 @@
+##############################################################################
+#
+# Module: simulator.py
+#
+# Description:
+#     In-process SuperMUTT simulator. SimulatedBus stands in for
+#     pyusb as the transport of MuttSession and MuttFleet: it finds
+#     SimulatedMutt handles that answer the vendor requests the
+#     library uses, with per-transfer latency and the re-enumeration
+#     behaviour of the real device (stale handles, new addresses).
+#
+#     State transitions are evaluated lazily from timestamps when a
+#     device is touched, so no thread runs per virtual device and
+#     hundreds of devices fit in one process.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+import random
+import struct
+import threading
+import time
+from array import array
+
+# Lib imports
+import usb.core
+
+# Own modules
+from .pd_decode import OPCODE_POWER_ROLE, OPCODE_RDO, PowerRole
+from .session import PRODUCT_ID, VENDOR_ID
+from .vendor_commands import MAILBOX_LENGTH
+
+# libusb speed codes reported by Device.speed
+_SPEED_CODES = {'f': 2, 'h': 3, 's': 4}
+_SPEED_REQUESTS = {0x13: 'f', 0x14: 'h', 0x15: 's'}
+
+ROUTE_CAPTIVE = 0
+ROUTE_CHARGER = 1
+
+# Mailbox status byte
+_STATUS_OK = 0x00
+_STATUS_UNKNOWN_OPCODE = 0xFF
+
+
+def _error(message, code):
+    return usb.core.USBError(message, None, code)
+
+
+class _Config:
+    """
+    Stand-in for the active configuration returned by pyusb.
+    """
+    bConfigurationValue = 1
+
+
+class MuttState:
+    """
+    State of one virtual MUTT, surviving re-enumeration.
+
+    Attributes:
+        serial (str): Serial number.
+        bus (int): Bus number.
+        port_numbers (tuple): Port chain on the bus.
+        address (int): Current device address, or None while detached.
+        speed (str): 's', 'h' or 'f'.
+        cd_stress (bool): CD stress running.
+        route (int): ROUTE_CAPTIVE or ROUTE_CHARGER.
+        pdos (tuple): Source PDOs (32-bit values) of the emulated
+            charger; empty until a 0xEE profile is sent.
+        rdo (int): RDO of the current contract, or None.
+        enumerations (int): Times the device has (re-)enumerated.
+        transfers (int): Control transfers handled.
+        hang_until (float): time.monotonic() until which transfers
+            get no answer, see SimulatedBus.hang().
+        mailbox (int): Opcode selected by the last E4 request, or
+            None. The MUTT has one mailbox, shared by all handles.
+    """
+    def __init__(self, bus, serial, port_numbers, allocate_address, cd_period):
+        self.bus = bus
+        self.serial = serial
+        self.port_numbers = port_numbers
+        self.cd_period = cd_period
+        self._allocate_address = allocate_address
+        self.address = allocate_address()
+        self.speed = 's'
+        self.cd_stress = False
+        self.cd_stress_since = 0.0
+        self.route = ROUTE_CAPTIVE
+        self.pdos = ()
+        self.rdo = None
+        self.enumerations = 1
+        self.transfers = 0
+        self.hang_until = 0.0
+        self.mailbox = None
+        self.generation = 0
+        self.detached_at = None
+        self.attach_at = None
+        self.lock = threading.Lock()
+        self._negotiate()
+
+    @property
+    def path(self):
+        return "%d-%s" % (self.bus, '.'.join(str(p) for p in self.port_numbers))
+
+    def _negotiate(self):
+        """
+        Let the sink pick the highest power PDO and form a contract.
+        """
+        if not self.pdos:
+            self.rdo = None
+            return
+        best = max(range(len(self.pdos)),
+                   key=lambda i: ((self.pdos[i] >> 10) & 0x3FF) * (self.pdos[i] & 0x3FF))
+        current = self.pdos[best] & 0x3FF
+        # object position, USB communications capable, operating / max current
+        self.rdo = (best + 1) << 28 | 1 << 25 | current << 10 | current
+
+    def detach(self, at, attach_at):
+        """
+        Schedule a detach at ``at`` and re-attach at ``attach_at``.
+        """
+        self.detached_at = at
+        self.attach_at = attach_at
+
+    def advance(self, now):
+        """
+        Apply scheduled transitions up to ``now``.
+
+        Returns:
+            bool: True if the device is attached.
+        """
+        if self.detached_at is not None and now >= self.detached_at:
+            if self.address is not None:
+                self.address = None
+                self.rdo = None
+                self.generation += 1
+            if now >= self.attach_at:
+                self.detached_at = self.attach_at = None
+                self.reattach()
+        return self.address is not None
+
+    def reattach(self):
+        self.address = self._allocate_address()
+        self.enumerations += 1
+        self._negotiate()
+
+    def connected(self, now):
+        """
+        Whether the Type-C link is up (CD stress toggles it).
+        """
+        if not self.cd_stress:
+            return True
+        return int((now - self.cd_stress_since) / self.cd_period) % 2 == 0
+
+    def power_role(self, now):
+        """
+        DUT power role: SINK while it has a contract with the emulated
+        charger, SOURCE otherwise, UNKNOWN while the link is down.
+        """
+        if not self.connected(now):
+            return PowerRole.UNKNOWN
+        return PowerRole.SINK if self.rdo is not None else PowerRole.SOURCE
+
+
+class SimulatedMutt:
+    """
+    Device handle of one enumeration of a virtual MUTT.
+
+    Mirrors the parts of usb.core.Device the library uses. A handle
+    goes stale when its MUTT re-enumerates: transfers then raise
+    usb.core.USBError with errno ENODEV, as with real hardware.
+
+    Attributes:
+        state (MuttState): Virtual device behind the handle.
+        default_timeout (int): Transfer timeout in ms used when a
+            transfer gives none.
+    """
+    idVendor = VENDOR_ID
+    idProduct = PRODUCT_ID
+    bcdDevice = 0x0100
+    manufacturer = 'Microsoft'
+    product = 'Type-C MUTT (simulated)'
+
+    def __init__(self, bus, state):
+        self._bus = bus
+        self.state = state
+        self.default_timeout = 1000
+        self._generation = state.generation
+        self.bus = state.bus
+        self.address = state.address
+        self.port_numbers = state.port_numbers
+        self.port_number = state.port_numbers[-1]
+        self.speed = _SPEED_CODES[state.speed]
+
+    @property
+    def serial_number(self):
+        return self.state.serial
+
+    def __repr__(self):
+        return "SimulatedMutt(%s, address=%s)" % (self.state.path, self.address)
+
+    def get_active_configuration(self):
+        return _Config()
+
+    def set_configuration(self, configuration=None):
+        pass
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        """
+        Handle one vendor control request.
+
+        Args:
+            bmRequestType (int): 0x40 (OUT) or 0xC0 (IN).
+            bRequest (int): Vendor request code.
+            wValue (int): wValue field.
+            wIndex (int): wIndex field.
+            data_or_wLength: OUT payload, IN length or IN array.
+            timeout (int): Timeout in ms; default_timeout if None.
+
+        Returns:
+            int or array.array: Like usb.core.Device.ctrl_transfer.
+
+        Raises:
+            usb.core.USBError: ENODEV on a stale handle, EPIPE (stall)
+                on unsupported requests, ETIMEDOUT when the answer
+                takes longer than the timeout.
+        """
+        bus = self._bus
+        state = self.state
+        delay = bus.latency + (bus.jitter * bus.rng.random() if bus.jitter else 0.0)
+        hang = state.hang_until - time.monotonic()
+        if hang > delay:
+            delay = hang
+        if delay > 0:
+            limit = (timeout or self.default_timeout) / 1000.0
+            if delay > limit:
+                time.sleep(limit)
+                raise _error('Operation timed out', errno.ETIMEDOUT)
+            time.sleep(delay)
+        with state.lock:
+            now = time.monotonic()
+            state.advance(now)
+            if state.generation != self._generation or state.address is None:
+                raise _error('No such device (it may have been disconnected)', errno.ENODEV)
+            state.transfers += 1
+            if bmRequestType & 0x80:
+                response = self._read(state, bRequest, now)
+                if isinstance(data_or_wLength, array):
+                    count = min(len(response), len(data_or_wLength))
+                    data_or_wLength[:count] = array('B', response[:count])
+                    return count
+                return array('B', response[:data_or_wLength])
+            payload = bytes(data_or_wLength) if data_or_wLength else b''
+            self._write(state, bRequest, wValue, wIndex, payload, now)
+            return len(payload)
+
+    def _write(self, state, request, value, index, payload, now):
+        bus = self._bus
+        if request in _SPEED_REQUESTS:
+            state.speed = _SPEED_REQUESTS[request]
+            state.detach(now, now + bus.reenum_delay)
+        elif request == 0x10:
+            at = now + value / 1000.0
+            state.detach(at, at + index / 1000.0 + bus.reenum_delay)
+        elif request == 0xE4:
+            state.mailbox = payload[1] if len(payload) > 1 else None
+        elif request == 0xE8:
+            state.cd_stress = bool(index)
+            state.cd_stress_since = now
+        elif request == 0xE9:
+            state.route = ROUTE_CHARGER if index else ROUTE_CAPTIVE
+        elif request == 0xEE:
+            count = payload[1] if len(payload) > 1 else 0
+            if count != value or len(payload) != 2 + 4 * count or not count:
+                raise _error('Pipe error', errno.EPIPE)
+            state.pdos = struct.unpack_from('<%dI' % count, payload, 2)
+            # The new capabilities trigger a renegotiation
+            state._negotiate()
+        else:
+            raise _error('Pipe error', errno.EPIPE)
+
+    def _read(self, state, request, now):
+        if request != 0xE4:
+            raise _error('Pipe error', errno.EPIPE)
+        opcode = state.mailbox
+        state.mailbox = None
+        if opcode == OPCODE_RDO:
+            if state.rdo is None or not state.connected(now):
+                # No power contract: short answer
+                return bytes([_STATUS_OK, OPCODE_RDO, 0])
+            body = struct.pack('<BBBI', _STATUS_OK, OPCODE_RDO, 4, state.rdo)
+        elif opcode == OPCODE_POWER_ROLE:
+            # The MUTT reports a length of 2: the role byte and a zero
+            body = bytes([_STATUS_OK, OPCODE_POWER_ROLE, 2, state.power_role(now), 0])
+        else:
+            body = bytes([_STATUS_UNKNOWN_OPCODE, opcode or 0, 0])
+        return body + bytes(MAILBOX_LENGTH - len(body))
+
+
+class SimulatedBus:
+    """
+    Transport holding any number of virtual MUTTs.
+
+    Pass it as ``transport`` to MuttSession, MuttFleet (and through
+    them to the asyncio classes); ``find`` follows usb.core.find.
+
+    Attributes:
+        latency (float): Seconds added to every control transfer.
+        jitter (float): Extra uniformly random latency, in seconds.
+        reenum_delay (float): Seconds a MUTT stays off the bus when
+            it re-enumerates (on top of requested reconnect delays).
+        cd_period (float): Half period of CD stress link toggling.
+        states (list): MuttState of every virtual device.
+    """
+    def __init__(self, count=1, latency=0.0, jitter=0.0, reenum_delay=0.05,
+                 cd_period=0.5, seed=0, bus_number=1, per_bus=100):
+        """
+        Initialize simulated bus.
+
+        Args:
+            count (int): Number of virtual MUTTs to attach.
+            latency (float): Per-transfer latency in seconds.
+            jitter (float): Random extra latency in seconds.
+            reenum_delay (float): Re-enumeration time in seconds.
+            cd_period (float): CD stress toggle half period in seconds.
+            seed (int): Seed of the jitter generator.
+            bus_number (int): Number of the first bus.
+            per_bus (int): Devices per bus; the next ones go on the
+                next bus, as behind another host controller.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.reenum_delay = reenum_delay
+        self.cd_period = cd_period
+        self.rng = random.Random(seed)
+        self.bus_number = bus_number
+        self.per_bus = per_bus
+        self.states = []
+        self._addresses = {}
+        self._lock = threading.Lock()
+        for _ in range(count):
+            self.add_device()
+
+    def _allocate_address(self, bus):
+        # Addresses cycle through 1..127 like the host controller's
+        address = self._addresses.get(bus, 0) % 127 + 1
+        self._addresses[bus] = address
+        return address
+
+    def add_device(self, serial=None):
+        """
+        Attach one more virtual MUTT.
+
+        Args:
+            serial (str): Serial number; generated when omitted.
+
+        Returns:
+            MuttState: State of the new device.
+
+        Raises:
+            None
+        """
+        with self._lock:
+            index = len(self.states)
+            bus = self.bus_number + index // self.per_bus
+            # Hubs of ten ports
+            slot = index % self.per_bus
+            ports = (slot // 10 + 1, slot % 10 + 1)
+            state = MuttState(bus, serial or 'SIM%05d' % index, ports,
+                              lambda: self._allocate_address(bus), self.cd_period)
+            self.states.append(state)
+            return state
+
+    def detach(self, state):
+        """
+        Unplug a virtual MUTT until re-attached with attach().
+        """
+        with state.lock:
+            state.detach(time.monotonic(), float('inf'))
+            state.advance(time.monotonic())
+
+    def hang(self, state, seconds):
+        """
+        Leave the transfers of a virtual MUTT unanswered for
+        ``seconds``: they time out, or complete late if their timeout
+        outlasts the hang.
+        """
+        state.hang_until = time.monotonic() + seconds
+
+    def attach(self, state):
+        """
+        Plug a detached virtual MUTT back in.
+        """
+        with state.lock:
+            state.detached_at = state.attach_at = None
+            if state.address is None:
+                state.reattach()
+
+    def find(self, find_all=False, custom_match=None, idVendor=None,
+             idProduct=None, backend=None, **kwargs):
+        """
+        Find attached virtual MUTTs, like usb.core.find.
+
+        Args:
+            find_all (bool): Return every match instead of the first.
+            custom_match (callable): Extra predicate on the handle.
+            idVendor (int): Vendor ID to match.
+            idProduct (int): Product ID to match.
+            backend: Ignored.
+
+        Returns:
+            SimulatedMutt, list or None: First match, all matches
+            (find_all) or None.
+
+        Raises:
+            None
+        """
+        now = time.monotonic()
+        found = []
+        for state in self.states:
+            with state.lock:
+                attached = state.advance(now)
+            if not attached:
+                continue
+            if idVendor is not None and idVendor != SimulatedMutt.idVendor:
+                continue
+            if idProduct is not None and idProduct != SimulatedMutt.idProduct:
+                continue
+            handle = SimulatedMutt(self, state)
+            if custom_match is not None and not custom_match(handle):
+                continue
+            if not find_all:
+                return handle
+            found.append(handle)
+        return found if find_all else None
+
+    def dispose(self, device):
+        """
+        Release a handle (nothing to free for simulated devices).
+        """
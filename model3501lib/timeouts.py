@@ -0,0 +1,313 @@
+##############################################################################
+#
+# Module: timeouts.py
+#
+# Description:
+#     Transfer timeouts, operation deadlines and bounded retries.
+#
+#     A TimeoutPolicy gives every session command a per-transfer
+#     timeout (instead of pyusb's 1000 ms default), an optional
+#     deadline spanning the whole operation - both transfers of the
+#     E4 mailbox pair and any retries - and a retry budget used only
+#     for transient errors (timeout, busy, interrupted). Stalls and
+#     vanished devices are never retried here; the session already
+#     re-resolves a re-enumerated MUTT once.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+import threading
+import time
+
+# Lib imports
+import usb.core
+
+# Own modules
+# (None)
+
+# libusb error codes and errno values worth retrying
+_TRANSIENT_BACKEND_ERRORS = (-6, -7, -10)   # BUSY, TIMEOUT, INTERRUPTED
+_TRANSIENT_ERRNOS = (errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.ETIMEDOUT)
+_TIMEOUT_BACKEND_ERROR = -7
+
+# Commands that must not be sent twice: both re-enumerate the MUTT,
+# and a retry would hit a device already dropping off the bus
+NOT_RETRIED = frozenset(('reconnect', 'set_speed'))
+
+# Counters kept per command
+_COUNTERS = ('operations', 'timeouts', 'deadline_exceeded', 'retries',
+             'recovered', 'gave_up', 'backoff_seconds')
+
+
+class DeadlineExceeded(usb.core.USBError):
+    """
+    Operation deadline expired before a transfer could start.
+    """
+    def __init__(self, command=None):
+        message = "Deadline exceeded" + (" in %s" % command if command else "")
+        super().__init__(message, None, errno.ETIMEDOUT)
+
+
+def is_timeout(error):
+    """
+    Check whether a transfer error is a timeout.
+
+    Args:
+        error (Exception): Error raised by a transfer.
+
+    Returns:
+        bool: True for libusb / errno timeouts and DeadlineExceeded.
+
+    Raises:
+        None
+    """
+    return (getattr(error, 'backend_error_code', None) == _TIMEOUT_BACKEND_ERROR
+            or getattr(error, 'errno', None) == errno.ETIMEDOUT)
+
+
+def is_transient(error):
+    """
+    Check whether a transfer error may succeed when retried.
+
+    Args:
+        error (Exception): Error raised by a transfer.
+
+    Returns:
+        bool: True for timeout, busy and interrupted errors; False
+        for stalls, I/O errors, vanished devices and deadlines.
+
+    Raises:
+        None
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    return (getattr(error, 'backend_error_code', None) in _TRANSIENT_BACKEND_ERRORS
+            or getattr(error, 'errno', None) in _TRANSIENT_ERRNOS)
+
+
+class TimeoutStats:
+    """
+    Thread-safe timeout and retry counters per command.
+
+    Counters: operations, timeouts (transfers that timed out),
+    deadline_exceeded, retries, recovered (operations that succeeded
+    after a retry), gave_up (transient failures left after the retry
+    budget or deadline) and backoff_seconds.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def __getstate__(self):
+        # Picklable for worker processes (shards.ShardedFleet)
+        return self.snapshot()
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._counters = state
+
+    def count(self, command, counter, amount=1):
+        with self._lock:
+            counters = self._counters.get(command)
+            if counters is None:
+                counters = self._counters[command] = dict.fromkeys(_COUNTERS, 0)
+            counters[counter] += amount
+
+    def snapshot(self):
+        """
+        Copy of the counters.
+
+        Args:
+            None
+
+        Returns:
+            dict: command -> counter name -> value.
+
+        Raises:
+            None
+        """
+        with self._lock:
+            return {command: dict(counters) for command, counters in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class TimeoutPolicy:
+    """
+    Timeouts, deadline and retry budget of session commands.
+
+    One policy may be shared by many sessions (for example all
+    devices of a fleet); its stats then cover all of them.
+
+    Attributes:
+        timeout (int): Per-transfer timeout in ms, or None for the
+            device default (pyusb: 1000 ms).
+        deadline (float): Seconds allowed for a whole operation,
+            including retries and backoff, or None.
+        retries (int): Maximum retries of a transient failure.
+        backoff (float): First backoff delay in seconds; doubles per
+            retry.
+        max_backoff (float): Upper bound of one backoff delay.
+        overrides (dict): Command name -> dict with any of 'timeout',
+            'deadline' and 'retries' replacing the defaults.
+        stats (TimeoutStats): Counters of every session using the policy.
+    """
+    def __init__(self, timeout=None, deadline=None, retries=0, backoff=0.005,
+                 max_backoff=0.1, overrides=None):
+        """
+        Initialize timeout policy.
+
+        Args:
+            timeout (int): Per-transfer timeout in ms.
+            deadline (float): Operation deadline in seconds.
+            retries (int): Retries of transient failures.
+            backoff (float): First backoff delay in seconds.
+            max_backoff (float): Largest backoff delay in seconds.
+            overrides (dict): Per-command settings, for example
+                {'get_rdo': {'timeout': 50, 'deadline': 0.2}}.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If an override has an unknown setting.
+        """
+        self.timeout = timeout
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.overrides = {}
+        for command, settings in (overrides or {}).items():
+            self.override(command, **settings)
+        self.stats = TimeoutStats()
+
+    def override(self, command, **settings):
+        """
+        Set per-command timeout, deadline or retries.
+
+        Args:
+            command (str): Session command name, e.g. 'get_rdo'.
+            **settings: timeout (ms), deadline (s) and/or retries.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a setting name is unknown.
+        """
+        unknown = set(settings) - {'timeout', 'deadline', 'retries'}
+        if unknown:
+            raise ValueError("Unknown timeout settings: %s" % ', '.join(sorted(unknown)))
+        self.overrides.setdefault(command, {}).update(settings)
+
+    def resolve(self, command):
+        """
+        Effective settings of one command.
+
+        Args:
+            command (str): Session command name.
+
+        Returns:
+            tuple: (timeout ms, deadline seconds, retries).
+
+        Raises:
+            None
+        """
+        settings = self.overrides.get(command, {})
+        retries = settings.get('retries', 0 if command in NOT_RETRIED else self.retries)
+        return (settings.get('timeout', self.timeout),
+                settings.get('deadline', self.deadline),
+                retries)
+
+    def backoff_delay(self, attempt):
+        """
+        Delay before retry number ``attempt`` (0-based).
+        """
+        return min(self.max_backoff, self.backoff * (2 ** attempt))
+
+
+class Budget:
+    """
+    Transfer timeout and deadline of the operation in progress.
+
+    The policy budget is owned by a session and shared by its
+    TimedDevice proxies, so it follows the MUTT across
+    re-enumeration. A call deadline gets a budget of its own.
+
+    Attributes:
+        timeout (int): Per-transfer timeout in ms, or None.
+        deadline (float): time.monotonic() deadline, or None.
+        command (str): Command in progress, used in error messages.
+    """
+    __slots__ = ('timeout', 'deadline', 'command')
+
+    def __init__(self, timeout=None, deadline=None, command=None):
+        self.timeout = timeout
+        self.deadline = deadline
+        self.command = command
+
+
+class TimedDevice:
+    """
+    Device handle proxy applying the session budget to every transfer.
+
+    The transfer timeout is the policy timeout, shortened to the time
+    left before the deadline; once the deadline has passed no
+    transfer is started. Everything else is forwarded to the wrapped
+    device.
+
+    Attributes:
+        device (usb.core.Device): Wrapped device handle.
+        budget (Budget): Budget of the owning session.
+    """
+    __slots__ = ('device', 'budget')
+
+    def __init__(self, device, budget):
+        object.__setattr__(self, 'device', device)
+        object.__setattr__(self, 'budget', budget)
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.device, name, value)
+
+    def __repr__(self):
+        return "TimedDevice(%r)" % (self.device,)
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        """
+        Forward a control transfer within the budget.
+
+        Args:
+            Same as usb.core.Device.ctrl_transfer.
+
+        Returns:
+            int or array.array: Result of the wrapped transfer.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+            usb.core.USBError: If the transfer fails.
+        """
+        budget = self.budget
+        if timeout is None:
+            timeout = budget.timeout
+        if budget.deadline is not None:
+            remaining = int((budget.deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                raise DeadlineExceeded(budget.command)
+            if timeout is None or timeout > remaining:
+                timeout = remaining
+        return self.device.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex,
+                                         data_or_wLength, timeout)
@@ -0,0 +1,177 @@
+##############################################################################
+#
+# Module: vendor_commands.py
+#
+# Description:
+#     Registry of every SuperMUTT vendor request used by the library.
+#     Setup fields and payloads are built once at import time as
+#     'B' arrays, which pyusb passes to the backend without copying,
+#     so issuing a command with a caller-owned receive buffer
+#     allocates nothing per call.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+from array import array
+
+# Lib imports
+# (None)
+
+# Own modules
+from .pd_decode import OPCODE_POWER_ROLE, OPCODE_RDO, RESPONSE_LENGTH
+
+# bmRequestType: vendor request to the device
+VENDOR_OUT = 0x40
+VENDOR_IN = 0xC0
+
+MAILBOX_LENGTH = RESPONSE_LENGTH
+
+# No-data OUT stage, shared by every command without payload
+_NO_DATA = array('B')
+
+# Payload arrays of the charge profiles sent so far, keyed by bytes
+_payload_arrays = {}
+
+
+class VendorCommand:
+    """
+    One vendor control request with its precompiled setup fields.
+
+    Attributes:
+        name (str): Registry name.
+        request_type (int): bmRequestType.
+        request (int): bRequest.
+        value (int): Default wValue.
+        index (int): Default wIndex.
+        data (array.array or int): OUT payload, or IN length.
+    """
+    __slots__ = ('name', 'request_type', 'request', 'value', 'index', 'data')
+
+    def __init__(self, name, request_type, request, value=0, index=0, data=None):
+        self.name = name
+        self.request_type = request_type
+        self.request = request
+        self.value = value
+        self.index = index
+        if request_type & 0x80:
+            self.data = data
+        else:
+            self.data = _NO_DATA if data is None else array('B', data)
+
+    @property
+    def is_in(self):
+        return bool(self.request_type & 0x80)
+
+    def new_buffer(self):
+        """
+        Allocate a receive buffer sized for this IN command.
+
+        Args:
+            None
+
+        Returns:
+            array.array: Zeroed 'B' array of the command length.
+
+        Raises:
+            None
+        """
+        return array('B', bytes(self.data))
+
+    def issue(self, device, data=None, value=None, index=None, timeout=None):
+        """
+        Send the request.
+
+        Args:
+            device (usb.core.Device): Target device.
+            data (array.array): OUT payload or IN receive buffer
+                replacing the registry default.
+            value (int): wValue replacing the registry default.
+            index (int): wIndex replacing the registry default.
+            timeout (int): Timeout in ms; the device default when None.
+
+        Returns:
+            int: Bytes transferred when data is an array or the
+            command is OUT; otherwise the array read.
+
+        Raises:
+            usb.core.USBError: If USB communication fails.
+        """
+        return device.ctrl_transfer(self.request_type, self.request,
+                                    self.value if value is None else value,
+                                    self.index if index is None else index,
+                                    self.data if data is None else data,
+                                    timeout)
+
+    def __repr__(self):
+        return "VendorCommand(%s, 0x%02X, 0x%02X, 0x%04X, 0x%04X)" % (
+            self.name, self.request_type, self.request, self.value, self.index)
+
+
+def payload_array(payload):
+    """
+    Return a cached 'B' array holding a bytes payload.
+
+    Lets immutable payloads (such as PdProfile.payload) be sent
+    without pyusb converting them on every call.
+
+    Args:
+        payload (bytes): OUT payload.
+
+    Returns:
+        array.array: Array with the same bytes; must not be modified.
+
+    Raises:
+        None
+    """
+    buffer = _payload_arrays.get(payload)
+    if buffer is None:
+        buffer = _payload_arrays[payload] = array('B', payload)
+    return buffer
+
+
+def _mailbox_request(opcode):
+    return bytes([0x00, opcode]) + bytes(MAILBOX_LENGTH - 2)
+
+
+RECONNECT = VendorCommand('reconnect', VENDOR_OUT, 0x10)
+SET_FULL_SPEED = VendorCommand('set_full_speed', VENDOR_OUT, 0x13)
+SET_HIGH_SPEED = VendorCommand('set_high_speed', VENDOR_OUT, 0x14)
+SET_SUPER_SPEED = VendorCommand('set_super_speed', VENDOR_OUT, 0x15)
+MAILBOX_RDO = VendorCommand('mailbox_rdo', VENDOR_OUT, 0xE4,
+                            data=_mailbox_request(OPCODE_RDO))
+MAILBOX_POWER_ROLE = VendorCommand('mailbox_power_role', VENDOR_OUT, 0xE4,
+                                   data=_mailbox_request(OPCODE_POWER_ROLE))
+MAILBOX_READ = VendorCommand('mailbox_read', VENDOR_IN, 0xE4, data=MAILBOX_LENGTH)
+CD_STRESS_ON = VendorCommand('cd_stress_on', VENDOR_OUT, 0xE8, index=0x0001)
+CD_STRESS_OFF = VendorCommand('cd_stress_off', VENDOR_OUT, 0xE8, index=0x0000)
+PD_CAPTIVE_CABLES = VendorCommand('pd_captive_cables', VENDOR_OUT, 0xE9, index=0x0000)
+PD_CHARGER_PORT = VendorCommand('pd_charger_port', VENDOR_OUT, 0xE9, index=0x0001)
+CHARGE_PROFILE = VendorCommand('charge_profile', VENDOR_OUT, 0xEE)
+
+REGISTRY = {command.name: command for command in (
+    RECONNECT,
+    SET_FULL_SPEED,
+    SET_HIGH_SPEED,
+    SET_SUPER_SPEED,
+    MAILBOX_RDO,
+    MAILBOX_POWER_ROLE,
+    MAILBOX_READ,
+    CD_STRESS_ON,
+    CD_STRESS_OFF,
+    PD_CAPTIVE_CABLES,
+    PD_CHARGER_PORT,
+    CHARGE_PROFILE,
+)}
+
+# set_speed() argument -> command
+SPEED_COMMANDS = {
+    's': SET_SUPER_SPEED,
+    'h': SET_HIGH_SPEED,
+    'f': SET_FULL_SPEED,
+}
@@ -30,6 +30,14 @@ setup(
     install_requires=[
         'pyusb',  # Add other dependencies if necessary
     ],
+    extras_require={
+        'numpy': ['numpy'],  # bulk decoding of captured responses
+    },
+    entry_points={
+        'console_scripts': [
+            'mutt = model3501lib.cli:main',
+        ],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: zlib/libpng License',
@@ -0,0 +1,28 @@
+##############################################################################
+#
+# Module: conftest.py
+#
+# Description:
+#     Shared pytest setup: puts the repository root on sys.path so
+#     the tests run against the working tree without installing it.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import os
+import sys
+
+# Lib imports
+# (None)
+
+# Own modules
+# (None)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
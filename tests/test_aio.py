@@ -0,0 +1,173 @@
+##############################################################################
+#
+# Module: test_aio.py
+#
+# Description:
+#     asyncio session, controller and fleet tests on the simulated
+#     bus: ordering, per-call deadlines, cancellation and close.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import asyncio
+import time
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.aio import AsyncChargeController, AsyncMuttFleet, AsyncMuttSession
+from model3501lib.pd_decode import PowerRole
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_session_commands_run_in_order():
+    bus = SimulatedBus(count=1)
+
+    async def scenario():
+        async with AsyncMuttSession(transport=bus) as session:
+            results = await asyncio.gather(session.set_charge(27), session.get_power_role(),
+                                           session.cdstress_on(), session.cdstress_off())
+        return results, session
+
+    results, session = run(scenario())
+    assert all(result.ok for result in results)
+    assert results[1].value.role == PowerRole.SINK
+    assert session.session.device is None
+
+
+def test_deadline_bounds_a_hung_transfer():
+    bus = SimulatedBus(count=1)
+    state = bus.states[0]
+
+    async def scenario():
+        session = AsyncMuttSession(transport=bus)
+        await session.open()
+        bus.hang(state, 0.5)
+        began = time.monotonic()
+        with pytest.raises((asyncio.TimeoutError, OSError)):
+            await session.get_power_role(timeout=0.1)
+        elapsed = time.monotonic() - began
+        await session.close()
+        return elapsed
+
+    assert run(scenario()) < 0.4
+
+
+def test_deadline_leaves_the_shared_session_alone():
+    bus = SimulatedBus(count=1)
+    state = bus.states[0]
+    session = MuttSession(transport=bus)
+    async_session = AsyncMuttSession(session)
+
+    async def scenario():
+        assert (await async_session.set_charge(15, timeout=0.05)).ok
+
+    run(scenario())
+    assert session.device.default_timeout == 1000
+    # A blocking caller of the same session keeps the default timeout
+    bus.hang(state, 0.2)
+    assert session.get_power_role().ok
+    run(async_session.close())
+
+
+def test_call_cancelled_while_queued_never_reaches_the_bus():
+    bus = SimulatedBus(count=1)
+    state = bus.states[0]
+
+    async def scenario():
+        session = AsyncMuttSession(transport=bus)
+        await session.open()
+        bus.hang(state, 0.2)
+        blocking = asyncio.ensure_future(session.get_power_role())
+        queued = asyncio.ensure_future(session.cdstress_on())
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await blocking
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await session.close()
+
+    run(scenario())
+    assert state.transfers == 2
+    assert not state.cd_stress
+
+
+def test_deadline_expired_in_the_queue_skips_the_transfer():
+    bus = SimulatedBus(count=1)
+    state = bus.states[0]
+
+    async def scenario():
+        session = AsyncMuttSession(transport=bus)
+        await session.open()
+        bus.hang(state, 0.2)
+        blocking = asyncio.ensure_future(session.get_power_role())
+        await asyncio.sleep(0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await session.cdstress_on(timeout=0.05)
+        await blocking
+        await session.close()
+
+    run(scenario())
+    assert not state.cd_stress
+
+
+def test_controller_keeps_its_device_handle():
+    bus = SimulatedBus(count=1)
+    device = bus.find()
+
+    async def scenario():
+        async with AsyncChargeController(device=device) as controller:
+            result = await controller.set_charge(45, timeout=0.5)
+            return result, controller.device
+
+    result, handle = run(scenario())
+    assert result
+    assert handle is device
+    assert bus.states[0].rdo is not None
+
+
+def test_fleet_commands_and_per_device_deadline():
+    bus = SimulatedBus(count=3)
+
+    async def scenario():
+        fleet = AsyncMuttFleet(transport=bus)
+        await fleet.discover()
+        charged = await fleet.set_charge(27)
+        subset = await fleet.set_speed('h', devices=['SIM00002'])
+        bus.hang(bus.states[1], 0.5)
+        roles = await fleet.get_power_role(timeout=0.1)
+        await fleet.close()
+        return charged, subset, roles
+
+    charged, subset, roles = run(scenario())
+    assert [result.ok for result in charged] == [True] * 3
+    assert [result.device.serial for result in subset] == ['SIM00002']
+    assert [state.speed for state in bus.states] == ['s', 's', 'h']
+    assert [result.ok for result in roles] == [True, False, True]
+    assert roles[1].error is not None
+    assert roles[1].elapsed < 0.4
+
+
+def test_fleet_rejects_unknown_commands():
+    async def scenario():
+        fleet = AsyncMuttFleet(transport=SimulatedBus(count=1))
+        await fleet.discover()
+        try:
+            with pytest.raises(ValueError):
+                await fleet.run('close')
+        finally:
+            await fleet.close()
+
+    run(scenario())
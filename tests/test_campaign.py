@@ -0,0 +1,77 @@
+##############################################################################
+#
+# Module: test_campaign.py
+#
+# Description:
+#     Campaign tests: delay distribution bounds, and CD stress cycles
+#     on simulated MUTTs that always switch the stress off again.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+import random
+
+# Lib imports
+import pytest
+import usb.core
+
+# Own modules
+from model3501lib.campaign import MAX_DELAY_MS, CampaignRunner, Fixed, Normal, Uniform
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+
+
+@pytest.mark.parametrize('distribution, args', [
+    (Uniform, (-1, 10)),
+    (Uniform, (10, 5)),
+    (Normal, (100, 10, -1, 200)),
+    (Normal, (100, 10, 0, MAX_DELAY_MS + 1)),
+    (Normal, (100, 10, 300, 200)),
+])
+def test_bad_bounds_are_rejected(distribution, args):
+    with pytest.raises(ValueError):
+        distribution(*args)
+
+
+def test_normal_stays_within_bounds():
+    normal = Normal(100, 1000, 50, 150)
+    rng = random.Random(1)
+    assert all(50 <= normal(rng) <= 150 for _ in range(200))
+
+
+def cdstress_campaign(tmp_path, session):
+    return CampaignRunner(str(tmp_path), {'SIM00000': session}, 2, kind='cdstress',
+                          dwell=Fixed(1), settle=Fixed(0))
+
+
+def test_cdstress_cycles_leave_the_stress_off(tmp_path):
+    bus = SimulatedBus(count=1)
+    session = MuttSession(transport=bus)
+    summary = cdstress_campaign(tmp_path, session).run()
+    assert summary['SIM00000']['ok'] == 2
+    assert not bus.states[0].cd_stress
+    session.close()
+
+
+def test_cdstress_is_switched_off_after_a_raising_cycle(tmp_path):
+    bus = SimulatedBus(count=1)
+    session = MuttSession(transport=bus)
+    switch_on = session.cdstress_on
+
+    def cdstress_on():
+        # Reaches the MUTT, then the answer is lost
+        switch_on()
+        raise usb.core.USBError('Input/Output Error', None, errno.EIO)
+
+    session.cdstress_on = cdstress_on
+    summary = cdstress_campaign(tmp_path, session).run()
+    assert summary['SIM00000']['error'] == 2
+    assert not bus.states[0].cd_stress
+    session.close()
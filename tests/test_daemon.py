@@ -0,0 +1,128 @@
+##############################################################################
+#
+# Module: test_daemon.py
+#
+# Description:
+#     Device daemon tests: response fields on simulated MUTTs, and
+#     requests queued or blocked for a device that a rescan drops
+#     are answered instead of left hanging.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+import time
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.client import MuttClient
+from model3501lib.daemon import MuttDaemon, _DeviceWorker
+from model3501lib.fleet import FleetDevice, MuttFleet
+from model3501lib.results import OK, CommandResult
+from model3501lib.simulator import SimulatedBus
+
+
+@pytest.fixture
+def served(tmp_path):
+    bus = SimulatedBus(count=2)
+    daemon = MuttDaemon(str(tmp_path / 'mutt.sock'), MuttFleet(transport=bus),
+                        queue_limit=1)
+    daemon.start()
+    client = MuttClient(daemon.path, timeout=5.0)
+    yield bus, daemon, client
+    client.close()
+    daemon.stop()
+
+
+def test_device_responses_report_the_queue_depth(served):
+    _, _, client = served
+    answer = client.request('get_power_role', device='SIM00001').result(5.0)
+    assert answer['ok']
+    assert answer['queue_depth'] == 0
+    devices = client.request('devices').result(5.0)
+    assert 'queue_depth' not in devices
+
+
+class GatedSession:
+    """
+    Session whose commands wait until the gate opens.
+    """
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.ran = []
+
+    def get_power_role(self):
+        self.started.set()
+        self.gate.wait(5.0)
+        self.ran.append('get_power_role')
+        return CommandResult('get_power_role', OK)
+
+    def cdstress_on(self):
+        self.ran.append('cdstress_on')
+        return CommandResult('cdstress_on', OK)
+
+
+class Replies:
+    """
+    Connection stand-in collecting the worker's replies.
+    """
+    def __init__(self):
+        self.answers = {}
+
+    def reply(self, message):
+        self.answers[message['id']] = message
+
+
+def test_retired_worker_answers_queued_and_blocked_requests():
+    session = GatedSession()
+    worker = _DeviceWorker(FleetDevice('SIM00000', '1-1.1', session), 1)
+    replies = Replies()
+    assert worker.submit((replies, 1, 'get_power_role', ()), True)
+    assert session.started.wait(5.0)
+    assert worker.submit((replies, 2, 'cdstress_on', ()), True)
+    # The queue is full: this reader blocks until the worker retires
+    blocked = threading.Thread(target=worker.submit,
+                               args=((replies, 3, 'cdstress_on', ()), True))
+    blocked.start()
+    time.sleep(0.05)
+    stopping = threading.Thread(target=worker.stop)
+    stopping.start()
+    time.sleep(0.05)
+    session.gate.set()
+    stopping.join(5.0)
+    blocked.join(5.0)
+    assert not stopping.is_alive() and not blocked.is_alive()
+
+    assert replies.answers[1]['ok']
+    for request_id in (2, 3):
+        assert replies.answers[request_id]['error'] == 'device no longer served'
+        assert replies.answers[request_id]['queue_depth'] == 0
+    assert session.ran == ['get_power_role']
+
+
+def test_submit_after_retirement_is_answered():
+    session = GatedSession()
+    worker = _DeviceWorker(FleetDevice('SIM00000', '1-1.1', session), 1)
+    worker.stop()
+    replies = Replies()
+    assert worker.submit((replies, 1, 'cdstress_on', ()), True)
+    assert replies.answers[1]['error'] == 'device no longer served'
+    assert session.ran == []
+
+
+def test_dropped_device_is_no_longer_served(served):
+    bus, daemon, client = served
+    bus.detach(bus.states[0])
+    assert [entry['serial'] for entry in client.discover()] == ['SIM00001']
+    answer = client.request('get_power_role', device='SIM00000').result(5.0)
+    assert not answer['ok']
+    assert answer['error'].startswith('KeyError')
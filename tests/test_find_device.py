@@ -0,0 +1,130 @@
+##############################################################################
+#
+# Module: test_find_device.py
+#
+# Description:
+#     sysfs discovery tests against a fake /sys tree: attribute
+#     parsing, filtering, fleet discovery without touching the
+#     devices, and host controller grouping.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+# (None)
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.findDevice import FindDeviceController
+from model3501lib.fleet import MuttFleet
+from model3501lib.session import PRODUCT_ID, VENDOR_ID
+from model3501lib.shards import host_controller
+from model3501lib.simulator import SimulatedBus
+
+# Attributes of a MUTT as the kernel lists them
+MUTT_ATTRS = {
+    'idVendor': '%04x' % VENDOR_ID,
+    'idProduct': '%04x' % PRODUCT_ID,
+    'manufacturer': 'MCCI',
+    'product': 'Type-C MUTT',
+    'bcdDevice': '0210',
+    'busnum': '1',
+}
+
+
+def add_device(root, controller, name, **attrs):
+    """
+    Create a device directory under a PCI controller and link it
+    into the bus devices directory, the way sysfs lays them out.
+    """
+    target = root / 'devices' / 'pci0000:00' / controller
+    if not name.startswith('usb'):
+        target = target / ('usb%s' % name.split('-')[0])
+    target = target / name
+    target.mkdir(parents=True, exist_ok=True)
+    for key, value in attrs.items():
+        (target / key).write_text(value + '\n')
+    (root / 'bus' / name).symlink_to(target, target_is_directory=True)
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    (tmp_path / 'bus').mkdir()
+    add_device(tmp_path, '0000:00:14.0', 'usb1', idVendor='1d6b', idProduct='0002')
+    add_device(tmp_path, '0000:00:14.0', '1-1.1', serial='SIM00000', speed='480',
+               devnum='5', **MUTT_ATTRS)
+    add_device(tmp_path, '0000:00:14.0', '1-1.1:1.0', bInterfaceClass='ff')
+    add_device(tmp_path, '0000:00:14.0', '1-1.2', serial='SIM00001', speed='12',
+               devnum='6', **MUTT_ATTRS)
+    add_device(tmp_path, '0000:00:14.0', '1-1.3', idVendor='046d', idProduct='c52b',
+               busnum='1', devnum='7')
+    add_device(tmp_path, '0000:05:00.0', 'usb2', idVendor='1d6b', idProduct='0003')
+    add_device(tmp_path, '0000:05:00.0', '2-4', idVendor=MUTT_ATTRS['idVendor'],
+               idProduct=MUTT_ATTRS['idProduct'], busnum='2', devnum='2', speed='5000')
+    return tmp_path / 'bus'
+
+
+def test_sysfs_lists_matching_devices_only(sysfs):
+    devices = FindDeviceController(VENDOR_ID, PRODUCT_ID).find_device_sysfs(str(sysfs))
+    assert [info['path'] for info in devices] == ['1-1.1', '1-1.2', '2-4']
+
+
+def test_sysfs_reads_every_attribute(sysfs):
+    first = FindDeviceController(VENDOR_ID, PRODUCT_ID).find_device_sysfs(str(sysfs))[0]
+    assert first == {
+        'vendor_id': hex(VENDOR_ID),
+        'product_id': hex(PRODUCT_ID),
+        'manufacturer': 'MCCI',
+        'product': 'Type-C MUTT',
+        'firmware_version': 0x0210,
+        'speed': 'High speed',
+        'serial': 'SIM00000',
+        'bus': 1,
+        'address': 5,
+        'path': '1-1.1',
+    }
+
+
+def test_sysfs_tolerates_missing_attributes(sysfs):
+    last = FindDeviceController(VENDOR_ID, PRODUCT_ID).find_device_sysfs(str(sysfs))[-1]
+    assert last['speed'] == 'Super speed'
+    assert last['serial'] is None
+    assert last['manufacturer'] is None
+    assert last['firmware_version'] is None
+
+
+def test_sysfs_without_a_tree_finds_nothing(tmp_path):
+    controller = FindDeviceController(VENDOR_ID, PRODUCT_ID)
+    assert controller.find_device_sysfs(str(tmp_path / 'missing')) == []
+
+
+def test_fleet_discovery_sends_nothing_to_the_devices(sysfs):
+    bus = SimulatedBus(count=2)
+    with MuttFleet(transport=bus, sysfs_root=str(sysfs)) as fleet:
+        fleet.discover()
+        assert fleet['SIM00001'].path == '1-1.2'
+        assert fleet['2-4'].serial is None
+        assert all(entry.session.device is None for entry in fleet)
+        assert [state.transfers for state in bus.states] == [0, 0]
+
+        # The first command opens the device found at the sysfs path
+        assert fleet.get_power_role(devices=['SIM00001'])[0].ok
+        assert [state.transfers for state in bus.states] == [0, 2]
+
+
+@pytest.mark.parametrize('bus, controller', [
+    (1, '0000:00:14.0'), (2, '0000:05:00.0'), (7, 'bus7'),
+])
+def test_host_controller_from_root_hub(sysfs, bus, controller):
+    assert host_controller(bus, str(sysfs)) == controller
+
+
+def test_host_controller_without_sysfs():
+    assert host_controller(3, None) == 'bus3'
@@ -0,0 +1,142 @@
+##############################################################################
+#
+# Module: test_fleet.py
+#
+# Description:
+#     MuttFleet regression tests on the simulated bus: discovery and
+#     the serial / path / label indexes, subset selection, fan-out
+#     results, handles surviving a rescan and a thread pool growing
+#     with the fleet.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import time
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.fleet import MuttFleet
+from model3501lib.pd_decode import PowerRole
+from model3501lib.results import NOT_FOUND
+from model3501lib.simulator import SimulatedBus
+
+
+@pytest.fixture
+def bus():
+    return SimulatedBus(count=4)
+
+
+@pytest.fixture
+def fleet(bus):
+    fleet = MuttFleet(transport=bus, labels={'SIM00001': 'bench', '1-1.3': 'rack'})
+    fleet.discover()
+    yield fleet
+    fleet.close()
+
+
+def test_discover_lists_every_device_in_bus_order(fleet, bus):
+    assert len(fleet) == 4
+    assert [entry.serial for entry in fleet] == [state.serial for state in bus.states]
+    assert [entry.path for entry in fleet] == [state.path for state in bus.states]
+
+
+def test_labels_apply_by_serial_or_path(fleet):
+    assert fleet.get('SIM00001').label == 'bench'
+    assert fleet.get('SIM00002').label == 'rack'
+    assert fleet.get('SIM00000').label is None
+
+
+@pytest.mark.parametrize('key', ['SIM00001', '1-1.2', 'bench'])
+def test_get_by_serial_path_or_label(fleet, key):
+    entry = fleet[key]
+    assert entry.serial == 'SIM00001'
+    assert key in fleet
+
+
+def test_get_unknown_key_raises(fleet):
+    assert 'SIM99999' not in fleet
+    with pytest.raises(KeyError):
+        fleet.get('SIM99999')
+
+
+def test_set_label_moves_the_index(fleet):
+    fleet.set_label('bench', 'spare')
+    assert 'bench' not in fleet
+    assert fleet['spare'].serial == 'SIM00001'
+    fleet.set_label('spare', None)
+    assert 'spare' not in fleet
+    assert fleet.get('SIM00001').label is None
+
+
+def test_select_keeps_the_requested_order(fleet):
+    assert fleet.select() == fleet.devices
+    assert [entry.serial for entry in fleet.select('rack')] == ['SIM00002']
+    assert [entry.serial for entry in fleet.select(['rack', '1-1.1', 'bench'])] == [
+        'SIM00002', 'SIM00000', 'SIM00001']
+    with pytest.raises(KeyError):
+        fleet.select(['bench', 'nowhere'])
+
+
+def test_fan_out_reaches_every_device(fleet, bus):
+    results = fleet.set_charge(27)
+    assert [result.device for result in results] == fleet.devices
+    assert all(result.ok for result in results)
+    assert all(result.elapsed >= 0.0 for result in results)
+    roles = fleet.get_power_role()
+    assert [result.value.value.role for result in roles] == [PowerRole.SINK] * 4
+
+
+def test_fan_out_on_a_subset_leaves_the_rest_alone(fleet, bus):
+    results = fleet.set_speed('h', devices=['bench', 'rack'])
+    assert [result.device.key for result in results] == ['bench', 'rack']
+    assert all(result.ok for result in results)
+    assert [state.speed for state in bus.states] == ['s', 'h', 'h', 's']
+
+
+def test_fan_out_reports_per_device_failure(fleet, bus):
+    fleet.get_power_role()
+    bus.detach(bus.states[2])
+    for entry in fleet:
+        entry.session.reenum_timeout = 0.05
+    results = fleet.get_power_role()
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert results[2].value.status == NOT_FOUND
+
+
+def test_run_rejects_unknown_commands(fleet):
+    with pytest.raises(ValueError):
+        fleet.run('close')
+
+
+def test_rediscover_keeps_sessions_of_attached_devices(fleet, bus):
+    sessions = {entry.serial: entry.session for entry in fleet}
+    bus.detach(bus.states[3])
+    fleet.discover()
+    assert [entry.serial for entry in fleet] == ['SIM00000', 'SIM00001', 'SIM00002']
+    assert all(entry.session is sessions[entry.serial] for entry in fleet)
+    assert 'SIM00003' not in fleet
+    assert fleet['bench'].serial == 'SIM00001'
+
+
+def test_pool_grows_with_the_fleet():
+    bus = SimulatedBus(count=1)
+    with MuttFleet(transport=bus) as fleet:
+        fleet.discover()
+        assert fleet.get_power_role()[0].ok
+        for _ in range(3):
+            bus.add_device()
+        fleet.discover()
+        # One thread per device: four slow answers come back together,
+        # not one after the other
+        bus.latency = 0.05
+        began = time.monotonic()
+        assert all(result.ok for result in fleet.get_power_role())
+        assert time.monotonic() - began < 0.3
@@ -0,0 +1,140 @@
+##############################################################################
+#
+# Module: test_locks.py
+#
+# Description:
+#     Threaded stress of the per-device locks on simulated MUTTs:
+#     mailbox queries from many threads never read each other's
+#     answers, and devices do not wait on each other's locks.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+import time
+
+# Lib imports
+# (None)
+
+# Own modules
+from model3501lib.getrdo import getrdoController
+from model3501lib.getpower_role import getpowerRoleController
+from model3501lib.hooks import HookedDevice
+from model3501lib.locks import device_lock
+from model3501lib.pd_decode import OPCODE_POWER_ROLE, OPCODE_RDO
+from model3501lib.session import MuttSession, PRODUCT_ID, VENDOR_ID
+from model3501lib.simulator import SimulatedBus
+
+# session method, opcode its answer must carry
+QUERIES = (('get_rdo', OPCODE_RDO), ('get_power_role', OPCODE_POWER_ROLE))
+
+
+def stress(sessions, operations):
+    """
+    Run alternating mailbox queries on every session from its own
+    thread, all released at once.
+
+    Returns:
+        tuple: (wrong answers, elapsed seconds)
+    """
+    start = threading.Barrier(len(sessions) + 1)
+    tally = []
+
+    def worker(session, offset):
+        bad = 0
+        start.wait()
+        for number in range(operations):
+            method, opcode = QUERIES[(number + offset) % 2]
+            result = getattr(session, method)()
+            if not result.ok or result.raw[1] != opcode:
+                bad += 1
+        tally.append(bad)
+
+    threads = [threading.Thread(target=worker, args=(session, index))
+               for index, session in enumerate(sessions)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return sum(tally), time.perf_counter() - began
+
+
+def sessions_per_device(bus, threads):
+    """
+    ``threads`` sessions per MUTT: every other one is shared, the
+    rest are sessions of their own on the same device.
+    """
+    sessions = []
+    for state in bus.states:
+        shared = MuttSession(transport=bus, path=state.path)
+        # A contract must exist for the RDO query to answer in full
+        shared.set_charge(45)
+        sessions.extend(shared if index % 2 else MuttSession(transport=bus, path=state.path)
+                        for index in range(threads))
+    return sessions
+
+
+def test_many_threads_see_no_cross_talk():
+    bus = SimulatedBus(count=4, latency=0.0002, jitter=0.0002)
+    bad, _ = stress(sessions_per_device(bus, 8), 40)
+    assert bad == 0
+
+
+def test_bare_controllers_on_separate_handles_see_no_cross_talk():
+    bus = SimulatedBus(count=1, latency=0.0002, jitter=0.0002)
+    MuttSession(transport=bus).set_charge(27)
+    controllers = []
+    for index in range(8):
+        cls = getrdoController if index % 2 else getpowerRoleController
+        controller = cls(VENDOR_ID, PRODUCT_ID)
+        controller.device = bus.find()
+        controllers.append(controller)
+    failures = []
+
+    def worker(controller):
+        if isinstance(controller, getrdoController):
+            query, opcode = controller.get_rdo, OPCODE_RDO
+        else:
+            query, opcode = controller.get_power_role, OPCODE_POWER_ROLE
+        for _ in range(40):
+            result = query()
+            if not result.ok or result.raw[1] != opcode:
+                failures.append(result)
+
+    threads = [threading.Thread(target=worker, args=(controller,))
+               for controller in controllers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failures == []
+
+
+def test_lock_is_per_device_not_per_handle():
+    bus = SimulatedBus(count=2)
+    first, again = bus.find(), bus.find()
+    other = bus.find(custom_match=lambda device: device.serial_number == 'SIM00001')
+    assert device_lock(first) is device_lock(again)
+    assert device_lock(HookedDevice(first, 'SIM00000', [])) is device_lock(first)
+    assert device_lock(first) is not device_lock(other)
+
+
+def test_devices_do_not_wait_on_each_other():
+    # Latency dominates, so one device per thread should take about
+    # as long as a single device, far from four times as long
+    operations = 20
+    one = SimulatedBus(count=1, latency=0.002)
+    bad, single = stress(sessions_per_device(one, 1), operations)
+    assert bad == 0
+    four = SimulatedBus(count=4, latency=0.002)
+    bad, parallel = stress(sessions_per_device(four, 1), operations)
+    assert bad == 0
+    assert parallel < 2 * single
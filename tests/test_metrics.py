@@ -0,0 +1,106 @@
+##############################################################################
+#
+# Module: test_metrics.py
+#
+# Description:
+#     Transfer metrics tests on simulated MUTTs: histograms rendered
+#     while threads record stay consistent, and metrics attached to
+#     a fleet count devices found by a later rescan.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import re
+import threading
+
+# Lib imports
+# (None)
+
+# Own modules
+from model3501lib.fleet import MuttFleet
+from model3501lib.hooks import OUTCOME_OK
+from model3501lib.metrics import TransferMetrics
+from model3501lib.simulator import SimulatedBus
+
+_SAMPLE = re.compile(r'^(\w+)\{(.*)\} (\S+)$')
+
+
+class Event:
+    """
+    Transfer event stand-in carrying the fields metrics count.
+    """
+    def __init__(self, duration):
+        self.device = 'SIM00000'
+        self.request = 0xE4
+        self.outcome = OUTCOME_OK
+        self.nbytes = 16
+        self.duration = duration
+
+
+def histogram_rows(text):
+    """
+    (bucket counts, +Inf count, _count) of every rendered histogram.
+    """
+    rows = {}
+    for line in text.splitlines():
+        match = _SAMPLE.match(line)
+        if not match:
+            continue
+        name, labels, value = match.groups()
+        series = re.sub(r',?le="[^"]*"', '', labels)
+        row = rows.setdefault(series, {'buckets': [], 'inf': None, 'count': None})
+        if name.endswith('_bucket'):
+            if 'le="+Inf"' in labels:
+                row['inf'] = int(value)
+            else:
+                row['buckets'].append(int(value))
+        elif name.endswith('_duration_seconds_count'):
+            row['count'] = int(value)
+    return [row for row in rows.values() if row['inf'] is not None]
+
+
+def test_render_while_recording_stays_consistent():
+    metrics = TransferMetrics()
+    stop = threading.Event()
+
+    def record(duration):
+        while not stop.is_set():
+            metrics.record(Event(duration))
+
+    threads = [threading.Thread(target=record, args=(duration,))
+               for duration in (0.00005, 0.003, 2.0)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(200):
+            for row in histogram_rows(metrics.render()):
+                assert row['buckets'] == sorted(row['buckets'])
+                assert row['buckets'][-1] <= row['inf'] == row['count']
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_fleet_metrics_count_devices_found_later():
+    bus = SimulatedBus(count=1)
+    fleet = MuttFleet(transport=bus)
+    fleet.discover()
+    metrics = TransferMetrics()
+    metrics.attach(fleet)
+    bus.add_device()
+    fleet.discover()
+    assert all(result.ok for result in fleet.get_power_role())
+    devices = {key[0] for key in metrics.snapshot()}
+    assert devices == {'SIM00000', 'SIM00001'}
+
+    metrics.detach(fleet)
+    fleet.get_power_role()
+    assert sum(total['count'] for total in metrics.snapshot().values()) == 4
+    fleet.close()
@@ -0,0 +1,114 @@
+##############################################################################
+#
+# Module: test_pd_decode.py
+#
+# Description:
+#     Mailbox response decoding tests: answers are only decoded with
+#     an OK status, the right opcode and the right length byte, one
+#     at a time and in bulk, and the simulator answers the way the
+#     MUTT does.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import struct
+from array import array
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.getrdo import getrdoController
+from model3501lib.pd_decode import (OPCODE_POWER_ROLE, OPCODE_RDO, PowerRole,
+                                    decode_power_role, decode_power_role_array,
+                                    decode_rdo, decode_rdo_array)
+from model3501lib.results import FAILED
+from model3501lib.session import PRODUCT_ID, VENDOR_ID, MuttSession
+from model3501lib.simulator import SimulatedBus
+
+# Answers as the MUTT sends them
+SINK = bytes([0x00, OPCODE_POWER_ROLE, 0x02, 0x01]) + bytes(12)
+SOURCE = bytes([0x00, OPCODE_POWER_ROLE, 0x02, 0x02]) + bytes(12)
+RDO = struct.pack('<BBBI9x', 0x00, OPCODE_RDO, 4, 0x2304B12C)
+
+
+def patch(answer, offset, value):
+    return answer[:offset] + bytes([value]) + answer[offset + 1:]
+
+
+def test_power_role_answers():
+    assert decode_power_role(SINK).role == PowerRole.SINK
+    assert decode_power_role(SOURCE).role == PowerRole.SOURCE
+
+
+@pytest.mark.parametrize('offset, value', [
+    (0, 0xFF),                  # status: query rejected
+    (1, OPCODE_RDO),            # another query's answer
+    (2, 0x01),                  # length byte
+    (2, 0x00),
+    (3, 0x07),                  # no such role
+])
+def test_power_role_rejects_bad_answers(offset, value):
+    assert decode_power_role(patch(SINK, offset, value)).role == PowerRole.UNKNOWN
+
+
+def test_rdo_answer():
+    result = decode_rdo(RDO)
+    assert result.rdo == 0x2304B12C
+    assert result.object_position == 2
+    assert result.operating_current_ma == 3000
+
+
+@pytest.mark.parametrize('offset, value', [
+    (0, 0xFF), (1, OPCODE_POWER_ROLE), (2, 0x00), (2, 0x02),
+])
+def test_rdo_rejects_bad_answers(offset, value):
+    with pytest.raises(ValueError):
+        decode_rdo(patch(RDO, offset, value))
+
+
+def test_bulk_decoding_applies_the_same_checks():
+    pytest.importorskip('numpy')
+    roles = decode_power_role_array(SINK + patch(SOURCE, 0, 0xFF) + patch(SOURCE, 2, 1))
+    assert list(roles['role']) == [PowerRole.SINK, PowerRole.UNKNOWN, PowerRole.UNKNOWN]
+    rdos = decode_rdo_array(RDO + patch(RDO, 0, 0xFF) + patch(RDO, 2, 0))
+    assert list(rdos['valid']) == [True, False, False]
+
+
+def test_simulated_answers_decode():
+    bus = SimulatedBus(count=1)
+    session = MuttSession(transport=bus)
+    assert session.set_charge(45).ok
+    role = session.get_power_role()
+    assert role.raw[:3] == bytes([0x00, OPCODE_POWER_ROLE, 0x02])
+    assert role.value.role != PowerRole.UNKNOWN
+    assert session.get_rdo().value.object_position > 0
+    session.close()
+
+
+class RejectingMutt:
+    """
+    Device handle answering every mailbox read with ``answer``.
+    """
+    def __init__(self, answer):
+        self.answer = answer
+
+    def ctrl_transfer(self, request_type, request, value, index, data, timeout=None):
+        if not request_type & 0x80:
+            return len(data)
+        data[:] = array('B', self.answer)
+        return len(self.answer)
+
+
+def test_rejected_rdo_query_fails():
+    controller = getrdoController(VENDOR_ID, PRODUCT_ID)
+    controller.device = RejectingMutt(patch(RDO, 0, 0xFF))
+    result = controller.get_rdo()
+    assert result.status == FAILED
+    assert result.raw[0] == 0xFF
@@ -0,0 +1,82 @@
+##############################################################################
+#
+# Module: test_pd_profile.py
+#
+# Description:
+#     Table-driven checks of the 0xEE profile encoder against the
+#     payloads of the original hardcoded 15W / 27W / 45W commands.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import struct
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.pd_profile import (
+    MAX_PDOS, PROFILE_15W, PROFILE_27W, PROFILE_45W, USB_COMMUNICATIONS_CAPABLE,
+    FixedPdo, PdProfile, profile_for_watts)
+
+# Profile, wValue and payload sent by the original commands
+LEGACY_PAYLOADS = [
+    (PROFILE_15W, 0x0001, bytes([0x01, 0x01, 0x2C, 0x91, 0x01, 0x04])),
+    (PROFILE_27W, 0x0002, bytes([0x01, 0x02, 0x2C, 0x91, 0x01, 0x04,
+                                 0xB1, 0xD0, 0x02, 0x00])),
+    (PROFILE_45W, 0x0003, bytes([0x01, 0x03, 0x2C, 0x91, 0x01, 0x04,
+                                 0x2C, 0xD1, 0x02, 0x00,
+                                 0x2C, 0xB1, 0x04, 0x00])),
+]
+
+
+@pytest.mark.parametrize('profile, wvalue, payload', LEGACY_PAYLOADS,
+                         ids=[str(entry[0]) for entry in LEGACY_PAYLOADS])
+def test_tier_matches_legacy_payload(profile, wvalue, payload):
+    assert profile.count == wvalue
+    assert profile.payload == payload
+
+
+@pytest.mark.parametrize('watts, profile', [
+    (5, PROFILE_15W), (15, PROFILE_15W), (16, PROFILE_27W),
+    (27, PROFILE_27W), (45, PROFILE_45W), (46, None),
+])
+def test_profile_for_watts_rounds_up(watts, profile):
+    assert profile_for_watts(watts) is profile
+
+
+def test_custom_profile_payload_layout():
+    pdos = [FixedPdo(5000, 3000, USB_COMMUNICATIONS_CAPABLE),
+            FixedPdo(9000, 2000), FixedPdo(20000, 2250)]
+    payload = PdProfile(pdos).payload
+    assert payload[:2] == bytes([0x01, 3])
+    assert struct.unpack('<3I', payload[2:]) == tuple(pdo.encode() for pdo in pdos)
+
+
+@pytest.mark.parametrize('profile', [PROFILE_15W, PROFILE_27W, PROFILE_45W])
+def test_decode_inverts_encode(profile):
+    assert [FixedPdo.decode(pdo.encode()) for pdo in profile.pdos] == list(profile.pdos)
+
+
+@pytest.mark.parametrize('voltage_mv, current_ma', [
+    (5025, 3000), (0, 3000), (52000, 1000), (5000, 3005), (5000, 10240),
+])
+def test_pdo_rejects_unencodable_values(voltage_mv, current_ma):
+    with pytest.raises(ValueError):
+        FixedPdo(voltage_mv, current_ma)
+
+
+@pytest.mark.parametrize('pdos', [
+    [],
+    [FixedPdo(9000, 3000)],
+    [FixedPdo(5000, 3000)] * (MAX_PDOS + 1),
+])
+def test_profile_rejects_invalid_pdo_lists(pdos):
+    with pytest.raises(ValueError):
+        PdProfile(pdos)
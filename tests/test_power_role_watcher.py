@@ -0,0 +1,92 @@
+##############################################################################
+#
+# Module: test_power_role_watcher.py
+#
+# Description:
+#     Power role watcher tests: the interval backs off while the role
+#     is stable, a poke during a poll keeps fast polling, and role
+#     swaps on a simulated MUTT reach the callback.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import threading
+from array import array
+
+# Lib imports
+# (None)
+
+# Own modules
+from model3501lib.pd_decode import PowerRole
+from model3501lib.power_role_watcher import PowerRoleWatcher
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+
+SINK = bytes([0x00, 0x28, 0x02, 0x01]) + bytes(12)
+
+
+class StableSession:
+    """
+    Session answering SINK forever, poking the watcher mid-poll
+    while ``poking`` is set.
+    """
+    def __init__(self, polls):
+        self.watcher = None
+        self.poking = False
+        self.remaining = polls
+        self.done = threading.Event()
+
+    def read_power_role(self, buffer):
+        if self.poking:
+            self.watcher.poke()
+        buffer[:] = array('B', SINK)
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.done.set()
+        return buffer
+
+
+def watch(session):
+    watcher = PowerRoleWatcher(session, min_interval=0.001, max_interval=0.004,
+                               backoff=2.0, auto_poke=False)
+    session.watcher = watcher
+    watcher.start()
+    assert session.done.wait(5.0)
+    watcher.stop()
+    return watcher
+
+
+def test_stable_role_backs_off():
+    watcher = watch(StableSession(6))
+    assert watcher.stats()['interval_s'] == 0.004
+    assert watcher.transitions == 0
+
+
+def test_poke_during_a_poll_keeps_fast_polling():
+    session = StableSession(6)
+    session.poking = True
+    watcher = watch(session)
+    assert watcher.stats()['interval_s'] == 0.001
+
+
+def test_role_swap_reaches_the_callback():
+    bus = SimulatedBus(count=1)
+    session = MuttSession(transport=bus)
+    swaps = []
+    seen = threading.Event()
+
+    def callback(old, new, detected_at):
+        swaps.append((old.role, new.role))
+        seen.set()
+
+    with PowerRoleWatcher(session, callback, max_interval=0.01):
+        assert session.set_charge(27).ok
+        assert seen.wait(5.0)
+    assert swaps[0][1] == PowerRole.SINK
+    session.close()
@@ -0,0 +1,140 @@
+##############################################################################
+#
+# Module: test_recorder.py
+#
+# Description:
+#     Transfer record and replay tests: a simulated MUTT session is
+#     recorded, decoded and replayed in full, the replay bus copes
+#     with sessions retrying more or less often than recorded, and
+#     damaged logs are rejected.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import errno
+
+# Lib imports
+import pytest
+import usb.core
+
+# Own modules
+from model3501lib.pd_profile import PROFILE_27W
+from model3501lib.recorder import (RecordedTransfer, ReplayBus, ReplayError, Replayer,
+                                   TransferRecorder, decode_steps, read_log)
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+
+# Setups of the vendor commands used below
+CDSTRESS_ON = (0x40, 0xE8, 0, 1)
+CDSTRESS_OFF = (0x40, 0xE8, 0, 0)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """
+    Log of a simulated session, one command of which hits a stale
+    handle after the MUTT was re-plugged.
+    """
+    bus = SimulatedBus(count=1, reenum_delay=0.01)
+    session = MuttSession(transport=bus)
+    path = str(tmp_path / 'mutt.rec')
+    with TransferRecorder(path) as recorder:
+        recorder.attach(session)
+        assert session.set_charge(27).ok
+        assert session.get_power_role().ok
+        bus.detach(bus.states[0])
+        bus.attach(bus.states[0])
+        assert session.set_profile(PROFILE_27W).ok
+        assert session.cdstress_on().ok
+        assert session.get_rdo().ok
+        assert session.set_speed('h').ok
+        recorder.detach(session)
+        session.cdstress_off()
+    session.close()
+    return path, recorder.count
+
+
+def test_log_reads_back_every_transfer(recording):
+    path, count = recording
+    transfers = read_log(path)
+    assert len(transfers) == count
+    assert {transfer.device for transfer in transfers} == {'1-1.1'}
+    stale = [transfer for transfer in transfers if transfer.errno]
+    assert [transfer.errno for transfer in stale] == [errno.ENODEV]
+
+
+def test_decode_folds_the_stale_handle_retry(recording):
+    steps = decode_steps(read_log(recording[0]))
+    # set_charge writes the charger profile of its tier
+    assert steps == [('set_profile', PROFILE_27W), ('get_power_role',),
+                     ('set_profile', PROFILE_27W), ('cdstress_on',), ('get_rdo',),
+                     ('set_speed', 'h')]
+
+
+def test_replay_serves_every_transfer(recording):
+    path, count = recording
+    replayer = Replayer(path)
+    result, bus = replayer.run()
+    assert [step.ok for step in result.steps] == [True] * len(replayer.steps)
+    assert bus.served == count
+
+
+def test_truncated_log_is_rejected(recording, tmp_path):
+    content = open(recording[0], 'rb').read()
+    # Inside the magic, the header, the first payload and the last record
+    for cut in (4, 12, 57, len(content) - 1):
+        damaged = tmp_path / 'cut.rec'
+        damaged.write_bytes(content[:cut])
+        with pytest.raises(ValueError):
+            read_log(str(damaged))
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    other = tmp_path / 'other.rec'
+    other.write_bytes(b'not a log')
+    with pytest.raises(ValueError):
+        read_log(str(other))
+
+
+def transfer(setup, errno_=0):
+    request_type, request, value, index = setup
+    return RecordedTransfer('1-1.1', 0.0, request_type, request, value, index,
+                            0, 0.0, errno_, 'Pipe error' if errno_ else None, b'')
+
+
+def serve(bus, setup):
+    return bus.serve(*setup, b'')
+
+
+def test_replay_repeats_the_recorded_failure_to_extra_retries():
+    bus = ReplayBus([transfer(CDSTRESS_ON, errno.EPIPE), transfer(CDSTRESS_OFF)])
+    for _ in range(3):
+        with pytest.raises(usb.core.USBError) as raised:
+            serve(bus, CDSTRESS_ON)
+        assert raised.value.errno == errno.EPIPE
+    serve(bus, CDSTRESS_OFF)
+    assert bus.served == 2
+
+
+def test_replay_skips_recorded_retries_the_session_gave_up():
+    bus = ReplayBus([transfer(CDSTRESS_ON, errno.EPIPE), transfer(CDSTRESS_ON, errno.EPIPE),
+                     transfer(CDSTRESS_ON), transfer(CDSTRESS_OFF)])
+    with pytest.raises(usb.core.USBError):
+        serve(bus, CDSTRESS_ON)
+    serve(bus, CDSTRESS_OFF)
+    assert bus.served == 4
+
+
+def test_replay_rejects_traffic_off_the_log():
+    bus = ReplayBus([transfer(CDSTRESS_ON)])
+    with pytest.raises(ReplayError, match='expected'):
+        serve(bus, CDSTRESS_OFF)
+    serve(bus, CDSTRESS_ON)
+    with pytest.raises(ReplayError, match='exhausted'):
+        serve(bus, CDSTRESS_ON)
@@ -0,0 +1,159 @@
+##############################################################################
+#
+# Module: test_reenum_tracer.py
+#
+# Description:
+#     Re-enumeration tracer tests: replay of recorded event streams
+#     and sysfs polling against a fake /sys and /dev tree that a fake
+#     session re-enumerates.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+import shutil
+import threading
+import time
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.reenum_tracer import (ARRIVAL, COMMAND, DEPARTURE, DESCRIPTORS, NODE,
+                                        ReenumTracer, TraceEvent, cycles_from_events,
+                                        replay)
+from model3501lib.results import CommandResult, FAILED, OK
+
+PATH = '1-1.1'
+
+# One reconnect with a repeated arrival, then a speed change that
+# never came back
+RECORDED = [
+    TraceEvent(10.000, COMMAND, 'reconnect 0 0'),
+    TraceEvent(10.010, DEPARTURE, PATH),
+    TraceEvent(10.050, ARRIVAL, PATH),
+    TraceEvent(10.060, ARRIVAL, PATH),
+    TraceEvent(10.070, NODE, '/dev/bus/usb/001/006'),
+    TraceEvent(10.100, DESCRIPTORS, PATH),
+    TraceEvent(20.000, COMMAND, 'speed h'),
+    TraceEvent(20.020, DEPARTURE, PATH),
+]
+
+
+def test_replay_splits_cycles_at_each_command(tmp_path):
+    record = tmp_path / 'events.jsonl'
+    record.write_text(''.join(event.to_json() + '\n' for event in RECORDED))
+    cycles, histograms = replay(str(record))
+    assert [cycle.command for cycle in cycles] == ['reconnect 0 0', 'speed h']
+    first, second = cycles
+    assert first.complete
+    assert first.to_arrival == pytest.approx(0.040)
+    assert first.total == pytest.approx(0.100)
+    assert not second.complete
+    assert second.to_departure == pytest.approx(0.020)
+    assert second.to_arrival is None
+    assert len(histograms['total'].samples) == 1
+
+
+def test_live_and_replayed_cycles_agree(tmp_path):
+    # A duplicate event must count the same live as in a replay
+    tracer = ReenumTracer(None, PATH, source='sysfs', sysfs_root=str(tmp_path))
+    tracer.events = RECORDED[:6]
+    live = tracer._times_since_command()
+    replayed = cycles_from_events(RECORDED[:6])[0]
+    assert live[ARRIVAL] == 10.050
+    assert replayed.to_arrival == pytest.approx(live[ARRIVAL] - live[DEPARTURE])
+
+
+class FakeSession:
+    """
+    Session whose commands re-enumerate a fake sysfs device.
+    """
+    def __init__(self, sysfs, dev, status=OK):
+        self.sysfs = sysfs
+        self.dev = dev
+        self.status = status
+        self.devnum = 5
+        self.thread = None
+        self.plug()
+
+    def plug(self):
+        device = self.sysfs / PATH
+        device.mkdir()
+        (device / 'busnum').write_text('1\n')
+        (device / 'devnum').write_text('%d\n' % self.devnum)
+        node = self.dev / '001' / ('%03d' % self.devnum)
+        node.parent.mkdir(exist_ok=True)
+        time.sleep(0.005)
+        node.touch()
+        time.sleep(0.005)
+        (device / 'descriptors').write_bytes(bytes(18))
+
+    def reenumerate(self):
+        time.sleep(0.01)
+        shutil.rmtree(str(self.sysfs / PATH))
+        time.sleep(0.02)
+        self.devnum += 1
+        self.plug()
+
+    def set_speed(self, speed_type):
+        if self.status == OK:
+            self.thread = threading.Thread(target=self.reenumerate)
+            self.thread.start()
+        return CommandResult('set_speed', self.status)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'sys').mkdir()
+    (tmp_path / 'dev').mkdir()
+    return tmp_path / 'sys', tmp_path / 'dev'
+
+
+def test_sysfs_polling_sees_every_phase(tree, tmp_path):
+    sysfs, dev = tree
+    session = FakeSession(sysfs, dev)
+    record = tmp_path / 'events.jsonl'
+    with ReenumTracer(session, PATH, source='sysfs', sysfs_root=str(sysfs),
+                      dev_root=str(dev), record=str(record)) as tracer:
+        cycle = tracer.trace_speed('h', timeout=2.0)
+    session.thread.join()
+    assert cycle.complete
+    assert cycle.to_departure >= 0.01
+    assert cycle.to_arrival >= 0.02
+    assert cycle.total >= cycle.to_departure + cycle.to_arrival
+    assert [event.kind for event in tracer.events] == [
+        COMMAND, DEPARTURE, ARRIVAL, NODE, DESCRIPTORS]
+    assert tracer.events[3].detail == str(dev / '001' / '006')
+    # The recording replays to the same breakdown
+    replayed = replay(str(record))[0]
+    assert replayed[0].as_dict() == cycle.as_dict()
+
+
+def test_sysfs_polling_times_out_without_departure(tree):
+    sysfs, dev = tree
+    session = FakeSession(sysfs, dev)
+    session.set_speed = lambda speed_type: CommandResult('set_speed', OK)
+    tracer = ReenumTracer(session, PATH, source='sysfs', sysfs_root=str(sysfs),
+                          dev_root=str(dev))
+    cycle = tracer.trace_speed('h', timeout=0.05)
+    assert not cycle.complete
+    assert cycle.to_departure is None
+    assert cycle.result is None
+
+
+def test_failed_command_returns_at_once(tree):
+    sysfs, dev = tree
+    session = FakeSession(sysfs, dev, status=FAILED)
+    tracer = ReenumTracer(session, PATH, source='sysfs', sysfs_root=str(sysfs),
+                          dev_root=str(dev))
+    began = time.monotonic()
+    cycle = tracer.trace_speed('h', timeout=5.0)
+    assert time.monotonic() - began < 1.0
+    assert cycle.result.status == FAILED
+    assert cycle.as_dict()['result']['status'] == FAILED
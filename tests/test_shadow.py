@@ -0,0 +1,88 @@
+##############################################################################
+#
+# Module: test_shadow.py
+#
+# Description:
+#     DeviceShadow tests on the simulated bus: redundant writes are
+#     skipped, nothing is assumed from a fresh handle, and a MUTT
+#     re-plugged between commands gets its settings sent again.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+# (None)
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+
+SKIPPED = "Already set"
+
+
+@pytest.fixture
+def bus():
+    return SimulatedBus(count=1, reenum_delay=0.01)
+
+
+@pytest.fixture
+def session(bus):
+    session = MuttSession(transport=bus, shadow=True)
+    yield session
+    session.close()
+
+
+def test_repeated_write_is_skipped(session, bus):
+    assert session.set_charge(27).message != SKIPPED
+    transfers = bus.states[0].transfers
+    assert session.set_charge(27).message == SKIPPED
+    assert session.set_charge(15).message != SKIPPED
+    assert bus.states[0].transfers == transfers + 1
+
+
+def test_forced_write_is_sent(session, bus):
+    session.cdstress_off()
+    assert session.cdstress_off(force=True).message != SKIPPED
+
+
+def test_fresh_handle_assumes_no_speed(session, bus):
+    # The MUTT is configured for SuperSpeed, but the link speed of
+    # the handle says nothing about that
+    assert session.open()
+    assert 'speed' not in session.shadow.state
+    assert session.set_speed('h').message != SKIPPED
+    assert bus.states[0].speed == 'h'
+
+
+def test_speed_survives_its_own_reenumeration(session, bus):
+    assert session.set_speed('h').ok
+    assert session.set_speed('h').message == SKIPPED
+    assert session.pd_charger_port().ok
+    assert session.set_speed('h').message == SKIPPED
+
+
+def test_replug_between_commands_resends(session, bus):
+    state = bus.states[0]
+    assert session.set_charge(45).ok
+    assert session.cdstress_on().ok
+    bus.detach(state)
+    bus.attach(state)
+    assert session.set_charge(45).message != SKIPPED
+    assert session.cdstress_on().message != SKIPPED
+    assert session.shadow.stats()['sent'] == {'set_charge': 2, 'cdstress_on': 2}
+
+
+def test_failed_write_forgets_the_setting(session, bus):
+    session.reenum_timeout = 0.05
+    assert session.pd_captive_cables().ok
+    bus.detach(bus.states[0])
+    assert not session.pd_captive_cables(force=True).ok
+    assert 'route' not in session.shadow.state
@@ -0,0 +1,66 @@
+##############################################################################
+#
+# Module: test_timeouts.py
+#
+# Description:
+#     Timeout policy tests on a hung simulated MUTT: every command,
+#     the charger profile writes included, reports TIMEOUT and is
+#     counted and retried by the policy.
+#
+# Author:
+#     Vinay N, MCCI Corporation Oct 2026
+#
+#     V2.1.0 Sat Oct 17 2026 10:00:00   Vinay N
+#         Module created
+#
+##############################################################################
+
+# Built-in imports
+# (None)
+
+# Lib imports
+import pytest
+
+# Own modules
+from model3501lib.pd_profile import PROFILE_27W
+from model3501lib.results import TIMEOUT
+from model3501lib.session import MuttSession
+from model3501lib.simulator import SimulatedBus
+from model3501lib.timeouts import TimeoutPolicy
+
+
+@pytest.fixture
+def hung():
+    bus = SimulatedBus(count=1)
+    policy = TimeoutPolicy(timeout=20, retries=2, backoff=0.001)
+    session = MuttSession(transport=bus, timeout_policy=policy)
+    assert session.open()
+    bus.hang(bus.states[0], 5.0)
+    yield session, policy
+    session.close()
+
+
+@pytest.mark.parametrize('command, args', [
+    ('set_charge', (27,)),
+    ('set_profile', (PROFILE_27W,)),
+    ('cdstress_on', ()),
+    ('get_rdo', ()),
+])
+def test_hung_device_times_out_with_retries(hung, command, args):
+    session, policy = hung
+    result = getattr(session, command)(*args)
+    assert result.status == TIMEOUT
+    stats = policy.stats.snapshot()[command]
+    assert stats['operations'] == 1
+    assert stats['timeouts'] == 3
+    assert stats['retries'] == 2
+    assert stats['gave_up'] == 1
+
+
+def test_deadline_ends_the_retries(hung):
+    session, policy = hung
+    policy.override('set_charge', deadline=0.05, retries=100)
+    assert session.set_charge(45).status == TIMEOUT
+    stats = policy.stats.snapshot()['set_charge']
+    assert stats['retries'] < 100
+    assert stats['timeouts'] + stats['deadline_exceeded'] > 0